@@ -37,8 +37,9 @@
     * The :class:`BackendClient <alignak_app.backend.backend.BackendClient>` manage requests with
       Alignak backend.
     * The :class:`ThreadManager <alignak_app.qobjects.threads.threadmanager.ThreadManager>` will
-      launch :class:`BackendQThread(s) <alignak_app.qobjects.threads.thread.BackendQThread>` to
-      trigger requests in :class:`BackendClient <alignak_app.backend.backend.BackendClient>`.
+      queue requests for
+      :class:`BackendQWorkers <alignak_app.qobjects.threads.thread.BackendQWorker>`, who trigger
+      them in :class:`BackendClient <alignak_app.backend.backend.BackendClient>`.
     * The :class:`DataManager <alignak_app.backend.datamanager.DataManager>` will store data
       provided by :class:`BackendClient <alignak_app.backend.backend.BackendClient>` in
       :class:`Items <alignak_app.items>`.
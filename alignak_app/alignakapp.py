@@ -25,7 +25,7 @@
     Alignak App manages the creation of all objects and QObjects for the whole application:
 
     * Creation of :class:`AppProgressBar <alignak_app.app.AppProgressBar>` until the Data Manager is
-      ready
+      ready. First requests are all queued at start, progress is received by signal
     * Creation of :class:`AppQMainWindow <alignak_app.qobjects.app_main.AppQMainWindow>`
     * Creation of standard python objects (settings, css, localization)
 """
@@ -34,9 +34,11 @@ import os
 import sys
 import time
 
+from threading import Thread
+
 from logging import DEBUG, INFO
 
-from PyQt5.Qt import QApplication, QObject, QIcon, Qt, QProgressBar, QWidget, QLabel, QVBoxLayout
+from PyQt5.Qt import QApplication, QObject, Qt, QProgressBar, QWidget, QLabel, QVBoxLayout
 from PyQt5.Qt import QTimer
 
 from alignak_app import __application__, __version__
@@ -47,13 +49,12 @@ from alignak_app.locales.locales import init_localization
 
 from alignak_app.backend.backend import app_backend
 from alignak_app.backend.datamanager import data_manager
+from alignak_app.backend.storage import local_storage
 
-from alignak_app.qobjects.threads.threadmanager import thread_manager, BackendQThread
+from alignak_app.qobjects.threads.threadmanager import thread_manager
+from alignak_app.qobjects.threads.notifier import changes_notifier
 from alignak_app.qobjects.common.widgets import center_widget
-from alignak_app.qobjects.common.dialogs import MessageQDialog
-from alignak_app.qobjects.login.login import LoginQDialog
-from alignak_app.qobjects.events.events import init_event_widget
-from alignak_app.qobjects.systray.tray_icon import AppTrayIcon
+from alignak_app.qobjects.common.labels import get_qicon
 
 logger = None
 
@@ -65,7 +66,7 @@ class AppProgressQWidget(QWidget):
 
     def __init__(self, parent=None):
         super(AppProgressQWidget, self).__init__(parent)
-        self.setWindowIcon(QIcon(settings.get_image('icon')))
+        self.setWindowIcon(get_qicon('icon'))
         self.setWindowFlags(Qt.FramelessWindowHint)
         self.setAttribute(Qt.WA_TranslucentBackground)
         self.setFixedSize(250, 80)
@@ -96,7 +97,7 @@ class AppProgressQWidget(QWidget):
 
 class AppProgressBar(QProgressBar):
     """
-        AppProgressBar in busy mode with text displayed at the center.
+        AppProgressBar in busy mode with text displayed at the center, until a progress is set.
     """
 
     def __init__(self):
@@ -115,6 +116,18 @@ class AppProgressBar(QProgressBar):
 
         self._text = text
 
+    def set_progress(self, percentage):
+        """
+        Leave busy mode and set progress of QProgressBar
+
+        :param percentage: percentage of progress
+        :type percentage: int
+        """
+
+        if percentage:
+            self.setRange(0, 100)
+            self.setValue(percentage)
+
     def text(self):
         """
         Overload: text(self) -> str
@@ -135,7 +148,11 @@ class AlignakApp(QObject):  # pragma: no cover
     def __init__(self):
         super(AlignakApp, self).__init__()
         self.tray_icon = None
+        self.app_progress = None
+        self.start_time = time.time()
+        self.backend_connected = True
         self.threadmanager_timer = QTimer()
+        self.storage_timer = QTimer()
 
     def start(self, username=None, password=None):
         """
@@ -143,6 +160,7 @@ class AlignakApp(QObject):  # pragma: no cover
 
         """
 
+        self.start_time = time.time()
         settings.init_config()
         settings.init_css()
         init_localization()
@@ -196,35 +214,83 @@ class AlignakApp(QObject):  # pragma: no cover
             self.show_login_window()
 
         # Create Progress Bar
-        app_progress = AppProgressQWidget()
-        app_progress.initialize()
-        center_widget(app_progress)
+        self.app_progress = AppProgressQWidget()
+        self.app_progress.initialize()
+        center_widget(self.app_progress)
+        self.app_progress.show()
+
+        # DataManager is ready when all databases are filled, by saved items or by first requests
+        # who are all queued for the workers
         logger.info("Preparing DataManager...")
-        while not data_manager.ready:
-            thread_manager.launch_threads()
-            app_progress.show()
+        changes_notifier.progress_changed.connect(self.update_progress)
+        changes_notifier.start()
 
-            for _ in range(0, 100):
-                t = time.time()
-                while time.time() < t + 0.01:
-                    status = data_manager.is_ready()
-                    app_progress.progress_bar.set_text('%s' % status)
-                    app.processEvents()
+        # Items saved on last run are displayed until they are requested again. They are loaded
+        # in a Thread, App is displayed as soon as they are loaded or received from backend
+        Thread(target=self.load_items).start()
 
-        app_progress.close()
+        thread_manager.launch_all_threads()
 
-        init_event_widget()
-        requests_interval = int(settings.get_config('Alignak-app', 'requests_interval')) * 1000
-        self.threadmanager_timer.setInterval(requests_interval)
+        # Requests are queued when they are due, interval of each request is adapted
+        self.threadmanager_timer.setInterval(1000)
         self.threadmanager_timer.start()
         self.threadmanager_timer.timeout.connect(self.check_threads)
 
-        self.tray_icon = AppTrayIcon(QIcon(settings.get_image('icon')))
-        self.tray_icon.build_menu()
-        self.tray_icon.show()
+        self.update_progress()
 
         sys.exit(app.exec_())
 
+    def update_progress(self):
+        """
+        Update progress bar until DataManager is ready, then show App. Log startup times when all
+        first requests are done
+
+        """
+
+        if not self.tray_icon:
+            self.app_progress.progress_bar.set_text('%s' % data_manager.is_ready())
+            self.app_progress.progress_bar.set_progress(data_manager.get_progress())
+            if data_manager.ready:
+                self.app_progress.close()
+                self.show_app()
+                logger.info('First window displayed in %.2fs', time.time() - self.start_time)
+
+        if data_manager.is_loaded():
+            changes_notifier.progress_changed.disconnect(self.update_progress)
+            logger.info(
+                'All endpoints ready in %.2fs: %s',
+                max(data_manager.ready_times.values()) - self.start_time,
+                ', '.join(
+                    '%s %.2fs' % (name, ready_time - self.start_time)
+                    for name, ready_time in sorted(
+                        data_manager.ready_times.items(), key=lambda item: item[1]
+                    )
+                )
+            )
+
+    def show_app(self):
+        """
+        Create event widget and systray icon of App, when DataManager is ready. Their modules are
+        imported here, to display progress bar sooner
+
+        """
+
+        # Lazy imports: display progress bar before importing widgets tree
+        # pylint: disable=import-outside-toplevel
+        from alignak_app.qobjects.events.events import init_event_widget
+        from alignak_app.qobjects.systray.tray_icon import AppTrayIcon
+
+        init_event_widget()
+
+        # Save items every 10 minutes for next start
+        self.storage_timer.setInterval(600000)
+        self.storage_timer.start()
+        self.storage_timer.timeout.connect(self.save_items)
+
+        self.tray_icon = AppTrayIcon(get_qicon('icon'))
+        self.tray_icon.build_menu()
+        self.tray_icon.show()
+
     @staticmethod
     def show_login_window():
         """
@@ -232,6 +298,11 @@ class AlignakApp(QObject):  # pragma: no cover
 
         """
 
+        # Lazy imports: dialogs are only needed when user has to log in
+        # pylint: disable=import-outside-toplevel
+        from alignak_app.qobjects.common.dialogs import MessageQDialog
+        from alignak_app.qobjects.login.login import LoginQDialog
+
         login = LoginQDialog()
         login.create_widget()
 
@@ -251,23 +322,42 @@ class AlignakApp(QObject):  # pragma: no cover
                 connect_dialog.exec_()
 
     @staticmethod
-    def check_threads():
+    def load_items():
+        """
+        Load items saved on last run in DataManager
+
+        """
+
+        data_manager.load_items(
+            local_storage.load(app_backend.get_owner(), app_backend.user.get('token'))
+        )
+
+    @staticmethod
+    def save_items():
         """
-        Launch periodically threads
+        Save items of DataManager in a Thread, for next start
 
         """
 
-        # Cleaning threads who are finished
-        thread_manager.clean_threads()
+        Thread(
+            target=local_storage.save,
+            args=(data_manager.snapshot(), app_backend.get_owner())
+        ).start()
+
+    def check_threads(self):
+        """
+        Launch periodically threads. Threads are stopped once, when App is disconnected
+
+        """
 
         # Launch or stop threads
         if app_backend.connected:
-            thread_manager.launch_threads('low')
-            thread_manager.launch_threads('normal')
-            thread_manager.launch_threads('normal')
+            thread_manager.launch_threads()
         else:
             logger.debug(
                 'Can\'t launch Request threads, App is not connected to backend [%s] !',
                 settings.get_config('Alignak', 'backend')
             )
-            thread_manager.stop_threads()
+            if self.backend_connected:
+                thread_manager.stop_threads()
+        self.backend_connected = app_backend.connected
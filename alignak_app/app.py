@@ -39,6 +39,10 @@ alignak-app-launcher command line interface::
 
         Then simply run "alignak-app start" to launch application.
 
+    Import times:
+        Set "ALIGNAKAPP_IMPORT_TIMES" environment variable to print time spent to import each
+        module on exit.
+
     Exit codes:
         0  if required operation succeeded
 
@@ -47,14 +51,19 @@ alignak-app-launcher command line interface::
 
 """
 
+import atexit
 import os
 
 from docopt import docopt, DocoptExit
 
 from alignak_app import __version__
-from alignak_app.alignakapp import AlignakApp
+from alignak_app.utils.imports import import_timer
 from alignak_app.utils.installer import Installer
 
+if os.environ.get('ALIGNAKAPP_IMPORT_TIMES'):  # pragma: no cover
+    import_timer.start()
+    atexit.register(import_timer.print_report)
+
 
 def main():  # pragma: no cover
     """
@@ -86,7 +95,10 @@ def main():  # pragma: no cover
         # In case of, check installation
         installer.check_installation()
 
-        # Start Alignak-app
+        # Start Alignak-app, Qt and QWidgets are only imported here
+        # Lazy import: "--install" and "--help" do not need PyQt5
+        from alignak_app.alignakapp import AlignakApp  # pylint: disable=import-outside-toplevel
+
         alignak_app = AlignakApp()
         alignak_app.start()
     if args['--install']:
@@ -24,11 +24,27 @@
     +++++++
     Backend manage connection and access to Alignak backend. It also fill
     :class:`DataManager <alignak_app.backend.datamanager.DataManager>`.
+
+    Hosts and services are synchronised by delta: after a first full request, only items whose
+    ``_updated`` is more recent than last synchronisation are requested. Deleted items are
+    detected periodically by requesting only ``_id`` of all items.
+
+    Endpoints who change little (``realm``, ``timeperiod``, ``user`` and ``alignakdaemon``) are
+    requested with a response cache: when backend result has not changed since last request,
+    cached response is returned with ``_not_modified`` and items are not created again.
 """
 
+import hashlib
 import json
+import math
+import time
 
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from email.utils import parsedate_to_datetime, format_datetime
+from itertools import islice
 from logging import getLogger
+from threading import Lock
 
 from alignak_backend_client.client import Backend, BackendException
 
@@ -50,6 +66,55 @@ from alignak_app.utils.config import settings
 logger = getLogger(__name__)
 
 
+class SingleFlight(object):
+    """
+        Class who share the result of a call between callers who make the same call at the
+        same time: only the first caller runs it, others wait for its result
+    """
+
+    def __init__(self):
+        self.lock = Lock()
+        self.calls = {}
+
+    def do(self, key, function, *args, **kwargs):
+        """
+        Return result of "function", called only once for all concurrent callers of "key".
+        Result is shared, callers must not modify it
+
+        :param key: key of call
+        :type key: tuple | str
+        :param function: function to call
+        :type function: function
+        :return: result of function
+        """
+
+        with self.lock:
+            call = self.calls.get(key)
+            if call is None:
+                call = self.calls[key] = Future()
+                call.set_running_or_notify_cancel()
+                is_first = True
+            else:
+                is_first = False
+
+        if not is_first:
+            logger.debug('Wait for result of same call: %s', key)
+            return call.result()
+
+        try:
+            result = function(*args, **kwargs)
+        except Exception as e:
+            call.set_exception(e)
+            raise
+        else:
+            call.set_result(result)
+        finally:
+            with self.lock:
+                del self.calls[key]
+
+        return result
+
+
 class BackendClient(object):
     """
         Class who collect informations with Backend-Client and returns data for Alignak-App.
@@ -60,11 +125,19 @@ class BackendClient(object):
         False: 'Failure'
     }
 
+    # Number of items merged together in DataManager by stream_items()
+    merged_items = 10000
+
     def __init__(self):
         self.backend = None
         self.connected = False
         self.user = {}
         self.ws_client = WSClient()
+        self.sync_dates = {}
+        self.reconcile_times = {}
+        self.responses = {}
+        self.page_executor = None
+        self.single_flight = SingleFlight()
 
     def login(self, username=None, password=None, proxies=None, check=False):
         """
@@ -129,6 +202,10 @@ class BackendClient(object):
             )
 
         if self.connected and not check:
+            # Next requests are full requests
+            self.sync_dates.clear()
+            self.reconcile_times.clear()
+            self.responses.clear()
             if settings.get_config('Alignak', 'webservice'):
                 self.ws_client.login(self.user['token'])
             else:
@@ -136,7 +213,23 @@ class BackendClient(object):
 
         return self.connected
 
-    def get(self, endpoint, params=None, projection=None, all_items=False):
+    def get_owner(self):
+        """
+        Return a string who identify current user on current backend. Token is hashed
+
+        :return: user and backend url
+        :rtype: str
+        """
+
+        user = self.user.get('username')
+        if not user:
+            user = hashlib.sha256(self.user.get('token', '').encode('utf-8')).hexdigest()
+
+        return '%s@%s' % (user, settings.get_config('Alignak', 'backend'))
+
+    def get(self, endpoint, params=None, projection=None, all_items=False, use_cache=False,
+            page_callback=None):
+        # pylint: disable=too-many-arguments
         """
         GET on alignak Backend REST API
 
@@ -148,6 +241,10 @@ class BackendClient(object):
         :type projection: list|None
         :param all_items: make GET on all items
         :type all_items: bool
+        :param use_cache: use response cache, see get_cached()
+        :type use_cache: bool
+        :param page_callback: function called with items of each page, see get_all()
+        :type page_callback: function
         :return: request response
         :rtype: dict
         """
@@ -162,27 +259,362 @@ class BackendClient(object):
                 for field in projection:
                     generate_proj[field] = 1
                 params['projection'] = json.dumps(generate_proj)
-            # Request
+            if page_callback:
+                request = self.send_get(endpoint, params, all_items, use_cache, page_callback)
+            else:
+                # Same requests sent at the same time share one response
+                request_key = (endpoint, json.dumps(params, sort_keys=True), all_items, use_cache)
+                request = self.single_flight.do(
+                    request_key, self.send_get, endpoint, params, all_items, use_cache
+                )
+        else:
+            logger.info('App is not connected to backend !')
+
+        return request
+
+    def send_get(self, endpoint, params, all_items=False, use_cache=False, page_callback=None):
+        # pylint: disable=too-many-arguments
+        """
+        Send GET request on alignak Backend REST API, see get()
+
+        :param endpoint: endpoint (API URL)
+        :type endpoint: str
+        :param params: dict of parameters for the app_backend API
+        :type params: dict
+        :param all_items: make GET on all items
+        :type all_items: bool
+        :param use_cache: use response cache, see get_cached()
+        :type use_cache: bool
+        :param page_callback: function called with items of each page, see get_all()
+        :type page_callback: function
+        :return: request response
+        :rtype: dict
+        """
+
+        request = None
+
+        try:
+            if use_cache:
+                request = self.get_cached(endpoint, params, all_items)
+            elif not all_items:
+                request = self.backend.get(
+                    endpoint,
+                    params
+                )
+            else:
+                request = self.get_all(
+                    endpoint,
+                    params,
+                    page_callback
+                )
+            logger.info('GET on [%s] backend > %s', endpoint, str(request['_status']))
+            logger.debug('\tparams: [%s]', str(params))
+        except BackendException:
+            self.connected = False
+
+        return request
+
+    def get_cached(self, endpoint, params, all_items=False):
+        """
+        GET with a response cache, keyed on endpoint and params. If result has not changed since
+        last request, cached response is returned with "_not_modified" set to True.
+
+        * for one page, request is sent with "If-None-Match" if backend returned an ETag, else
+          content of response is compared with last one
+        * for all items, number of items and last "_updated" are requested before requesting
+          all pages
+
+        :param endpoint: endpoint (API URL)
+        :type endpoint: str
+        :param params: dict of parameters for the app_backend API
+        :type params: dict
+        :param all_items: make GET on all items
+        :type all_items: bool
+        :return: request response
+        :rtype: dict
+        """
+
+        cache_key = '%s?%s' % (endpoint, json.dumps(params, sort_keys=True))
+        cached = self.responses.get(cache_key)
+
+        if all_items:
+            version = self.get_version(endpoint, params)
+            if cached and version == cached['version']:
+                logger.debug('GET on [%s] backend > not modified', endpoint)
+                return dict(cached['response'], _not_modified=True)
+            request = self.get_all(endpoint, params)
+            etag = None
+        else:
+            headers = None
+            if cached and cached['etag']:
+                headers = {'If-None-Match': cached['etag']}
+            response = self.backend.get_response(
+                method='GET', endpoint=endpoint, headers=headers, params=params
+            )
+            version = hashlib.sha1(response.content).hexdigest()
+            if cached and (response.status_code == 304 or version == cached['version']):
+                logger.debug('GET on [%s] backend > not modified', endpoint)
+                return dict(cached['response'], _not_modified=True)
+            request = self.backend.decode(response=response)
+            if '_status' not in request:
+                request['_status'] = 'OK'
+            etag = response.headers.get('ETag')
+
+        self.responses[cache_key] = {'etag': etag, 'version': version, 'response': request}
+
+        return request
+
+    def get_all(self, endpoint, params, page_callback=None):
+        """
+        GET all items of endpoint. First page gives number of pages, then next pages are
+        requested at the same time by the threads of page executor. Only a few pages are
+        requested in advance, so pages waiting to be read stay limited.
+
+        If "page_callback" is given, items of each page are given to it in order of pages, with
+        number of items received and total number of items, and they are not returned.
+
+        :param endpoint: endpoint (API URL)
+        :type endpoint: str
+        :param params: dict of parameters for the app_backend API
+        :type params: dict
+        :param page_callback: function called with items of each page
+        :type page_callback: function
+        :return: request response, with all items if no "page_callback"
+        :rtype: dict
+        """
+
+        page_params = dict(params)
+        page_params['max_results'] = int(settings.get_config('Alignak', 'max_results'))
+        page_params['page'] = 1
+
+        request = self.backend.get(endpoint, dict(page_params))
+
+        if '_meta' not in request:  # pragma: no cover - backend always sends "_meta"
+            if 'next' in request.get('_links', {}):
+                request = self.backend.get_all(endpoint, dict(params))
+            request['_meta'] = {'total': len(request['_items']), 'max_results': 1}
+
+        # Backend may return less items than "max_results" by page
+        page_params['max_results'] = max(1, int(request['_meta']['max_results']))
+        total = int(request['_meta']['total'])
+        pages = int(math.ceil(float(total) / float(page_params['max_results'])))
+
+        def get_page(page):
+            """Return items of page"""
+
+            return self.backend.get(endpoint, dict(page_params, page=page))['_items']
+
+        executor = self.get_page_executor()
+        next_pages = iter(range(2, pages + 1))
+        window = 2 * max(1, int(settings.get_config('Alignak', 'page_workers')))
+        futures = deque(
+            executor.submit(get_page, page) for page in islice(next_pages, window)
+        )
+
+        items = []
+        received = 0
+        page_items = request['_items']
+        try:
+            while page_items is not None:
+                received += len(page_items)
+                if page_callback:
+                    page_callback(page_items, received, total)
+                else:
+                    items.extend(page_items)
+
+                page_items = None
+                if futures:
+                    page_items = futures.popleft().result()
+                    page = next(next_pages, None)
+                    if page:
+                        futures.append(executor.submit(get_page, page))
+        finally:
+            for future in futures:
+                future.cancel()
+
+        logger.debug('GET on [%s] backend > %d items in %d pages', endpoint, received, pages)
+
+        return {'_items': items, '_status': 'OK'}
+
+    def get_page_executor(self):
+        """
+        Return executor who request pages, created on first call and kept for next requests
+
+        :return: executor who request pages
+        :rtype: concurrent.futures.ThreadPoolExecutor
+        """
+
+        if self.page_executor is None:
+            self.page_executor = ThreadPoolExecutor(
+                max_workers=max(1, int(settings.get_config('Alignak', 'page_workers')))
+            )
+
+        return self.page_executor
+
+    def get_version(self, endpoint, params):
+        """
+        Return number of items and last "_updated" of endpoint. They change when an item is
+        added, updated or deleted
+
+        :param endpoint: endpoint (API URL)
+        :type endpoint: str
+        :param params: dict of parameters for the app_backend API
+        :type params: dict
+        :return: number of items and last "_updated"
+        :rtype: tuple
+        """
+
+        version_params = dict(params)
+        version_params.update({
+            'max_results': 1,
+            'sort': '-_updated',
+            'projection': json.dumps({'_updated': 1}),
+        })
+
+        request = self.backend.get(endpoint, version_params)
+
+        total = request.get('_meta', {}).get('total', len(request['_items']))
+        last_updated = request['_items'][0].get('_updated') if request['_items'] else None
+
+        return total, last_updated
+
+    def get_sync_params(self, endpoint, params):
+        """
+        Return params to request only items modified since last synchronisation of endpoint.
+        Same params are returned if a full request is needed.
+
+        :param endpoint: endpoint (API URL)
+        :type endpoint: str
+        :param params: params of request model
+        :type params: dict
+        :return: params with a filter on "_updated"
+        :rtype: dict
+        """
+
+        if endpoint not in self.sync_dates or \
+                not settings.get_config('Alignak', 'delta_sync', boolean=True):
+            return params
+
+        where = json.loads(params.get('where', '{}'))
+        # Items updated during the same second than last item are requested again
+        where['_updated'] = {'$gte': format_datetime(self.sync_dates[endpoint], usegmt=True)}
+
+        sync_params = dict(params)
+        sync_params['where'] = json.dumps(where)
+
+        return sync_params
+
+    def set_sync_date(self, endpoint, backend_items):
+        """
+        Store the most recent "_updated" of items as synchronisation date of endpoint
+
+        :param endpoint: endpoint (API URL)
+        :type endpoint: str
+        :param backend_items: items returned by backend
+        :type backend_items: list
+        """
+
+        # Items updated at the same time have the same date, each date is parsed once
+        for updated in set(backend_item.get('_updated') for backend_item in backend_items):
             try:
-                if not all_items:
-                    request = self.backend.get(
-                        endpoint,
-                        params
-                    )
+                updated = parsedate_to_datetime(updated)
+            except (TypeError, ValueError):
+                continue
+            if endpoint not in self.sync_dates or updated > self.sync_dates[endpoint]:
+                self.sync_dates[endpoint] = updated
+
+    def stream_items(self, item_class, request_model):
+        """
+        Request all items of endpoint page by page. Items of each page are created, then page is
+        released. Items are merged in DataManager when "merged_items" items are received, so memory
+        only holds items of one batch. At the end, last batch is merged and items who have not been
+        received are removed. An empty database is filled directly with first batch.
+
+        :param item_class: class of items
+        :type item_class: type
+        :param request_model: request model of items
+        :type request_model: dict
+        :return: request response, without items
+        :rtype: dict
+        """
+
+        endpoint = request_model['endpoint']
+        items_list = []
+        items_ids = set()
+
+        def merge_items():
+            """Merge received items in DataManager and release them"""
+
+            with data_manager.write() as database:
+                if database[endpoint]:
+                    data_manager.update_items(endpoint, items_list)
                 else:
-                    request = self.backend.get_all(
-                        endpoint,
-                        params
-                    )
-                logger.info('GET on [%s] backend > %s', endpoint, str(request['_status']))
-                logger.debug('\tparams: [%s]', str(params))
-            except BackendException:
-                self.connected = False
+                    data_manager.update_database(endpoint, items_list)
+            del items_list[:]
+
+        def add_page(backend_items, received, total):
+            """Create items of page and merge them by batches"""
+
+            for backend_item in backend_items:
+                item = item_class()
+
+                item.create(
+                    backend_item['_id'],
+                    backend_item,
+                    backend_item['name'],
+                )
+                items_list.append(item)
+                items_ids.add(item.item_id)
+            self.set_sync_date(endpoint, backend_items)
+
+            if len(items_list) >= self.merged_items:
+                merge_items()
+            data_manager.set_progress(endpoint, received, total)
+
+        request = self.get(
+            endpoint,
+            request_model['params'],
+            request_model['projection'],
+            all_items=True,
+            page_callback=add_page
+        )
+
+        if request and 'OK' in request['_status']:
+            # Last batch and removed items are published together
+            with data_manager.write():
+                merge_items()
+                data_manager.keep_items(endpoint, items_ids)
+            self.reconcile_times[endpoint] = time.time()
         else:
-            logger.info('App is not connected to backend !')
+            # Next request must get all items again
+            self.sync_dates.pop(endpoint, None)
 
         return request
 
+    def reconcile(self, item_type, request_model):
+        """
+        Request "_id" of all items of endpoint to remove deleted items from DataManager.
+        Only done once by "reconcile_interval".
+
+        :param item_type: type of items
+        :type item_type: str
+        :param request_model: request model of items
+        :type request_model: dict
+        """
+
+        endpoint = request_model['endpoint']
+        reconcile_interval = int(settings.get_config('Alignak', 'reconcile_interval'))
+        if time.time() - self.reconcile_times.get(endpoint, 0) < reconcile_interval:
+            return
+
+        request = self.get(endpoint, dict(request_model['params']), ['_id'], all_items=True)
+
+        if request and 'OK' in request['_status']:
+            data_manager.keep_items(
+                item_type, set(backend_item['_id'] for backend_item in request['_items'])
+            )
+            self.reconcile_times[endpoint] = time.time()
+
     def post(self, endpoint, data, headers=None):  # pragma: no cover - Post already test by client
         """
         POST on alignak Backend REST API
@@ -375,10 +807,12 @@ class BackendClient(object):
         request = self.get(
             request_model['endpoint'],
             request_model['params'],
-            request_model['projection']
+            request_model['projection'],
+            use_cache=True
         )
 
-        if request:
+        # Items are only created again if backend result has changed
+        if request and not request.get('_not_modified'):
             realms_list = []
             for backend_item in request['_items']:
                 realm = Realm()
@@ -393,7 +827,7 @@ class BackendClient(object):
             if realms_list:
                 data_manager.update_database('realm', realms_list)
             if 'OK' in request['_status']:
-                data_manager.db_is_ready[request_model['endpoint']] = True
+                data_manager.set_db_ready(request_model['endpoint'])
 
     def query_timeperiods(self):
         """
@@ -406,10 +840,12 @@ class BackendClient(object):
         request = self.get(
             request_model['endpoint'],
             request_model['params'],
-            request_model['projection']
+            request_model['projection'],
+            use_cache=True
         )
 
-        if request:
+        # Items are only created again if backend result has changed
+        if request and not request.get('_not_modified'):
             periods_list = []
             for backend_item in request['_items']:
                 period = Period()
@@ -424,7 +860,7 @@ class BackendClient(object):
             if periods_list:
                 data_manager.update_database('timeperiod', periods_list)
             if 'OK' in request['_status']:
-                data_manager.db_is_ready[request_model['endpoint']] = True
+                data_manager.set_db_ready(request_model['endpoint'])
 
     def query_user(self):
         """
@@ -437,10 +873,12 @@ class BackendClient(object):
         request = self.get(
             request_model['endpoint'],
             request_model['params'],
-            request_model['projection']
+            request_model['projection'],
+            use_cache=True
         )
 
-        if request:
+        # Items are only created again if backend result has changed
+        if request and not request.get('_not_modified'):
             if request['_items']:
                 user = User()
 
@@ -453,7 +891,7 @@ class BackendClient(object):
                 data_manager.update_database('user', user)
 
             if 'OK' in request['_status']:
-                data_manager.db_is_ready[request_model['endpoint']] = True
+                data_manager.set_db_ready(request_model['endpoint'])
 
     def query_hosts(self):
         """
@@ -462,13 +900,18 @@ class BackendClient(object):
         """
 
         request_model = Host.get_request_model()
+        params = self.get_sync_params(request_model['endpoint'], request_model['params'])
 
-        request = self.get(
-            request_model['endpoint'],
-            request_model['params'],
-            request_model['projection'],
-            all_items=True
-        )
+        # First request get all items page by page
+        if params is request_model['params']:
+            request = self.stream_items(Host, request_model)
+        else:
+            request = self.get(
+                request_model['endpoint'],
+                params,
+                request_model['projection'],
+                all_items=True
+            )
 
         if request:
             hosts_list = []
@@ -482,19 +925,15 @@ class BackendClient(object):
                 )
                 hosts_list.append(host)
 
-                # If host is a problem, add / update it
-                if data_manager.is_problem('host', backend_item):
-                    if data_manager.get_item('problems', host.item_id):
-                        data_manager.update_item_data('problems', host.item_id, host.data)
-                    else:
-                        data_manager.database['problems'].append(host)
-
-            data_manager.db_is_ready['problems']['host'] = True
-
-            if hosts_list:
-                data_manager.update_database('host', hosts_list)
+            # Hosts in problem are added / updated / removed by DataManager
+            if params is not request_model['params']:
+                if hosts_list:
+                    data_manager.update_items('host', hosts_list)
+                self.reconcile('host', request_model)
+                self.set_sync_date(request_model['endpoint'], request['_items'])
+            data_manager.set_db_ready('problems', 'host')
             if 'OK' in request['_status']:
-                data_manager.db_is_ready[request_model['endpoint']] = True
+                data_manager.set_db_ready(request_model['endpoint'])
 
     def query_services(self, host_id=None):
         """
@@ -506,13 +945,20 @@ class BackendClient(object):
         """
 
         request_model = Service.get_request_model(host_id)
+        params = request_model['params']
+        if not host_id:
+            params = self.get_sync_params(request_model['endpoint'], params)
 
-        request = self.get(
-            request_model['endpoint'],
-            request_model['params'],
-            request_model['projection'],
-            all_items=True
-        )
+        # First request get all items page by page
+        if not host_id and params is request_model['params']:
+            request = self.stream_items(Service, request_model)
+        else:
+            request = self.get(
+                request_model['endpoint'],
+                params,
+                request_model['projection'],
+                all_items=True
+            )
 
         if request:
             services_list = []
@@ -524,24 +970,22 @@ class BackendClient(object):
                     backend_item,
                     backend_item['name'],
                 )
+                services_list.append(service)
 
-                # Add / update only services of host "if host_id"
-                if host_id:
-                    if not data_manager.get_item('service', service.item_id):
-                        logger.debug('Add item data in database[service]')
-                        data_manager.database['service'].append(service)
-                    else:
-                        data_manager.update_item_data('service', service.item_id, service.data)
-
-            # If not item ID, update all database
-            if services_list and not host_id:
-                data_manager.update_database('service', services_list)
+            # If host_id, add / update / remove only services of host
             if host_id:
+                data_manager.update_host_services(host_id, services_list)
                 host = data_manager.get_item('host', '_id', host_id)
                 if host:
                     logger.info('Update database[service] for %s', host.name)
+            # If not item ID, update database with modified services, or all services
+            elif params is not request_model['params']:
+                if services_list:
+                    data_manager.update_items('service', services_list)
+                self.reconcile('service', request_model)
+                self.set_sync_date(request_model['endpoint'], request['_items'])
             if 'OK' in request['_status']:
-                data_manager.db_is_ready[request_model['endpoint']] = True
+                data_manager.set_db_ready(request_model['endpoint'])
 
     def query_services_problems(self, state):
         """
@@ -568,21 +1012,20 @@ class BackendClient(object):
         )
 
         if request:
+            services_list = []
             for backend_item in request['_items']:
-                if data_manager.is_problem('service', backend_item):
-                    service = Service()
-                    service.create(
-                        backend_item['_id'],
-                        backend_item,
-                        backend_item['name']
-                    )
+                service = Service()
+                service.create(
+                    backend_item['_id'],
+                    backend_item,
+                    backend_item['name']
+                )
+                services_list.append(service)
 
-                    if data_manager.get_item('problems', service.item_id):
-                        data_manager.update_item_data('problems', service.item_id, service.data)
-                    else:
-                        data_manager.database['problems'].append(service)
+            # Services who are no longer in this state leave problems
+            data_manager.replace_problems('service', services_list, state)
             # Problems state is ready
-            data_manager.db_is_ready['problems'][state] = True
+            data_manager.set_db_ready('problems', state)
             logger.info("Update database[problems] for %s services...", state)
 
     def query_alignakdaemons(self):
@@ -597,10 +1040,12 @@ class BackendClient(object):
             request_model['endpoint'],
             request_model['params'],
             request_model['projection'],
-            all_items=True
+            all_items=True,
+            use_cache=True
         )
 
-        if request:
+        # Items are only created again if backend result has changed
+        if request and not request.get('_not_modified'):
             daemons_list = []
             for backend_item in request['_items']:
                 daemon = Daemon()
@@ -616,7 +1061,7 @@ class BackendClient(object):
             if daemons_list:
                 data_manager.update_database('alignakdaemon', daemons_list)
             if 'OK' in request['_status']:
-                data_manager.db_is_ready[request_model['endpoint']] = True
+                data_manager.set_db_ready(request_model['endpoint'])
 
     def query_livesynthesis(self):
         """
@@ -648,7 +1093,7 @@ class BackendClient(object):
             if livesynthesis:
                 data_manager.update_database('livesynthesis', livesynthesis)
             if 'OK' in request['_status']:
-                data_manager.db_is_ready[request_model['endpoint']] = True
+                data_manager.set_db_ready(request_model['endpoint'])
 
     def query_history(self, hostname=None, host_id=None):
         """
@@ -686,34 +1131,118 @@ class BackendClient(object):
                         request['_items'],
                         hostname,
                     )
-                    data_manager.database['history'].append(host_history)
+                    data_manager.add_item('history', host_history)
         else:  # pragma: no cover, too long to test
-            history_list = []
-            for history in data_manager.database['history']:
-                request_model['params']['where'] = json.dumps({
-                    'host': history.item_id})
-                request_model['params']['max_results'] = 25
-
-                request = self.get(
-                    request_model['endpoint'],
-                    request_model['params'],
-                    request_model['projection'],
-                    all_items=False
-                )
+            histories = data_manager.database['history']
+            batch_size = int(settings.get_config('Alignak', 'history_batch'))
+            batches = [
+                [history.item_id for history in histories[i:i + batch_size]]
+                for i in range(0, len(histories), batch_size)
+            ]
+
+            # Batches are requested at the same time, but not more than "history_requests"
+            events_by_host = {}
+            max_workers = int(settings.get_config('Alignak', 'history_requests'))
+            with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+                for batch_events in executor.map(self.get_history_events, batches):
+                    events_by_host.update(batch_events)
 
-                if request:
+            history_list = []
+            for history in histories:
+                if history.item_id in events_by_host:
                     host_history = History()
 
                     host_history.create(
                         history.item_id,
-                        request['_items'],
+                        events_by_host[history.item_id],
                         history.name,
                     )
                     history_list.append(host_history)
+                else:
+                    # Request has failed, keep current history
+                    history_list.append(history)
 
-            if history_list:
+            if events_by_host:
                 data_manager.update_database('history', history_list)
 
+    def get_history_events(self, host_ids, max_events=25):
+        """
+        Return last history events of each host. Events of all hosts are requested together with
+        "$in", then split by host. Pages are requested until each host has "max_events", but as
+        a busy host can fill many pages, hosts still incomplete after expected number of pages
+        are requested alone.
+
+        :param host_ids: ids of hosts
+        :type host_ids: list
+        :param max_events: maximum number of events for each host
+        :type max_events: int
+        :return: events of each host, hosts whose request failed are missing
+        :rtype: dict
+        """
+
+        request_model = History.get_request_model()
+        projection = request_model['projection'] + ['host']
+
+        events_by_host = {host_id: [] for host_id in host_ids}
+        incomplete_hosts = set(host_ids)
+        wanted_events = max_events * len(host_ids)
+        page = 1
+        max_pages = 1
+        while incomplete_hosts and page <= max_pages:
+            params = dict(request_model['params'])
+            params.update({
+                'where': json.dumps({'host': {'$in': host_ids}}),
+                'max_results': wanted_events,
+                'page': page,
+            })
+
+            request = self.get(request_model['endpoint'], params, projection)
+            if not request:
+                return {}
+
+            for event in request['_items']:
+                # Responses are shared by requests, they are not modified
+                host_id = event.get('host')
+                if host_id in incomplete_hosts:
+                    events_by_host[host_id].append(
+                        dict((key, value) for key, value in event.items() if key != 'host')
+                    )
+                    if len(events_by_host[host_id]) >= max_events:
+                        incomplete_hosts.discard(host_id)
+
+            if 'next' not in request.get('_links', {}):
+                # All events have been received
+                incomplete_hosts.clear()
+            elif page == 1:
+                # Backend may return less items than "max_results" by page
+                page_size = int(request.get('_meta', {}).get('max_results', wanted_events))
+                max_pages = -(-wanted_events // max(1, page_size))
+            page += 1
+
+        for host_id in incomplete_hosts:
+            request_model = History.get_request_model()
+            request_model['params']['where'] = json.dumps({'host': host_id})
+            request_model['params']['max_results'] = max_events
+
+            request = self.get(
+                request_model['endpoint'],
+                request_model['params'],
+                request_model['projection'],
+                all_items=False
+            )
+
+            if request:
+                events_by_host[host_id] = request['_items']
+            else:
+                del events_by_host[host_id]
+
+        logger.debug(
+            'History of %d hosts received in %d requests',
+            len(host_ids), page - 1 + len(incomplete_hosts)
+        )
+
+        return events_by_host
+
     def query_notifications(self):  # pragma: no cover, notifications can be empty
         """
         Launch request on "history" endpoint.
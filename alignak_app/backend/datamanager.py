@@ -25,14 +25,36 @@
     DataManager manage alignak data provided by
     :class:`Client <alignak_app.backend.backend.BackendClient>`.
 
-    * ``database`` fied contains all data collected by App
+    * ``database`` fied contains all data collected by App, each item type is stored in an
+      :class:`ItemStore <alignak_app.backend.itemstore.ItemStore>`
     * ``db_is_ready`` fied says to App if database has been filled or not (needed on start)
     * ``old_notifications`` fied store old notifications from backend to avoid sending them again
+    * ``stale`` fied contains item types loaded from
+      :class:`LocalStorage <alignak_app.backend.storage.LocalStorage>` and not requested since
+
+    DataManager is filled by :class:`BackendQWorkers <alignak_app.qobjects.threads.thread>` and
+    read by QWidgets at the same time. Writers modify a copy of ``database`` inside
+    :meth:`write() <alignak_app.backend.datamanager.DataManager.write>` and publish it at once when
+    done. Readers only use the published ``database``, who is never modified by writers, so they
+    never wait for a request in progress: use ``snapshot()`` to read several item types from the
+    same version.
+
+    Functions added with ``add_listener()`` receive the
+    :class:`Changes <alignak_app.backend.itemstore.Changes>` of each item type every time a new
+    ``database`` is published. They are called by the writer thread.
+
+    Functions added with ``add_progress_listener()`` are called every time a database is filled
+    or its progress changes, so App knows when DataManager is ready without checking it in a loop.
 
 """
 
+import time
+
+from contextlib import contextmanager
 from logging import getLogger
+from threading import RLock, get_ident, local
 
+from alignak_app.backend.itemstore import Database
 from alignak_app.utils.time import get_local_datetime_from_date
 from alignak_app.items.livesynthesis import LiveSynthesis
 
@@ -50,7 +72,7 @@ class DataManager(object):
     """
 
     def __init__(self):
-        self.database = {
+        self.database = Database({
             'history': [],
             'notifications': [],
             'livesynthesis': [],
@@ -61,7 +83,7 @@ class DataManager(object):
             'realm': [],
             'timeperiod': [],
             'problems': [],
-        }
+        })
         self.db_is_ready = {
             'livesynthesis': False,
             'alignakdaemon': False,
@@ -73,6 +95,16 @@ class DataManager(object):
         }
         self.old_notifications = []
         self.ready = False
+        self.lock = RLock()
+        self.draft = None
+        self.writer = None
+        # Number of items changed by each thread, for each item type
+        self.written = local()
+        self.listeners = []
+        self.progress_listeners = []
+        self.stale = set()
+        self.progress = {}
+        self.ready_times = {}
 
     def is_ready(self):
         """
@@ -86,6 +118,8 @@ class DataManager(object):
             if db_name not in 'problems':
                 if self.db_is_ready[db_name]:
                     pass
+                elif db_name in self.progress:
+                    return _('Collecting %s(s)...') % db_name + ' %d%%' % self.progress[db_name]
                 else:
                     return _('Collecting %s(s)...') % db_name
             else:
@@ -100,6 +134,214 @@ class DataManager(object):
 
         # return cur_collected
 
+    def set_progress(self, item_type, received, total):
+        """
+        Set percentage of items received for item type, while items are requested page by page
+
+        :param item_type: type of items
+        :type item_type: str
+        :param received: number of items received
+        :type received: int
+        :param total: total number of items
+        :type total: int
+        """
+
+        self.progress[item_type] = 100 * received // total if total else 100
+        self.notify_progress()
+
+    def set_db_ready(self, db_name, problem=None):
+        """
+        Set database as filled by a request, and keep time of its first filling
+
+        :param db_name: name of database
+        :type db_name: str
+        :param problem: state of problems, if database is "problems"
+        :type problem: str
+        """
+
+        if problem:
+            self.db_is_ready[db_name][problem] = True
+            self.ready_times.setdefault(problem, time.time())
+        else:
+            self.db_is_ready[db_name] = True
+            self.ready_times.setdefault(db_name, time.time())
+
+        self.notify_progress()
+
+    def is_loaded(self):
+        """
+        Check if all databases have been filled by requests, and not only by saved items
+
+        :return: if all databases have been filled by requests
+        :rtype: bool
+        """
+
+        db_names = [db_name for db_name in self.db_is_ready if db_name != 'problems']
+        db_names.extend(self.db_is_ready['problems'])
+
+        return all(db_name in self.ready_times for db_name in db_names)
+
+    def get_progress(self):
+        """
+        Return percentage of DataManager filling, computed from databases who are ready and
+        percentage of items received for others
+
+        :return: percentage of filling
+        :rtype: int
+        """
+
+        percentages = []
+        for db_name in self.db_is_ready:
+            if db_name == 'problems':
+                percentages.extend(
+                    100 if ready else 0 for ready in self.db_is_ready[db_name].values()
+                )
+            elif self.db_is_ready[db_name]:
+                percentages.append(100)
+            else:
+                percentages.append(self.progress.get(db_name, 0))
+
+        return sum(percentages) // len(percentages)
+
+    @contextmanager
+    def write(self):
+        """
+        Give a draft of "database" to modify. Draft is published when the first write() ends.
+        Only one thread can write at a time, readers are never blocked.
+
+        """
+
+        with self.lock:
+            if self.draft is not None:
+                # Already writing, modify the same draft
+                yield self.draft
+                return
+
+            old_database = self.database
+            self.draft = self.database.copy()
+            self.writer = get_ident()
+            try:
+                yield self.draft
+                self.database = self.draft
+            finally:
+                self.draft = None
+                self.writer = None
+
+            changes = self.database.get_changes(old_database)
+            if changes:
+                counts = self.get_written_count()
+                for item_type, item_changes in changes.items():
+                    counts[item_type] = counts.get(item_type, 0) + len(item_changes.added) + \
+                        len(item_changes.changed) + len(item_changes.removed)
+                self.written.counts = counts
+                self.notify_listeners(changes)
+
+    def get_written_count(self):
+        """
+        Return number of items changed by current thread since its start, for each item type
+
+        :return: number of changed items for each item type
+        :rtype: dict
+        """
+
+        return dict(getattr(self.written, 'counts', {}))
+
+    def get_database(self):
+        """
+        Return draft of database if current thread is writing it, else published database
+
+        :return: database to read
+        :rtype: alignak_app.backend.itemstore.Database
+        """
+
+        draft = self.draft
+        if draft is not None and self.writer == get_ident():
+            return draft
+
+        return self.database
+
+    def add_listener(self, listener):
+        """
+        Add a function to call with changes of each item type, when database is published
+
+        :param listener: function who receive item type and its changes
+        :type listener: function
+        """
+
+        if listener not in self.listeners:
+            self.listeners.append(listener)
+
+    def remove_listener(self, listener):
+        """
+        Remove a function added with add_listener()
+
+        :param listener: function who receive item type and its changes
+        :type listener: function
+        """
+
+        if listener in self.listeners:
+            self.listeners.remove(listener)
+
+    def notify_listeners(self, changes):
+        """
+        Send changes of each item type to listeners
+
+        :param changes: changes of each item type
+        :type changes: dict
+        """
+
+        for item_type, item_changes in changes.items():
+            logger.debug('Changes in database[%s]: %s', item_type, item_changes)
+            for listener in list(self.listeners):
+                try:
+                    listener(item_type, item_changes)
+                except Exception as e:  # pragma: no cover - listener must not break writers
+                    logger.error('Listener %s failed with %s changes: %s', listener, item_type, e)
+
+    def add_progress_listener(self, listener):
+        """
+        Add a function to call when a database is filled or its progress changes
+
+        :param listener: function without arguments
+        :type listener: function
+        """
+
+        if listener not in self.progress_listeners:
+            self.progress_listeners.append(listener)
+
+    def remove_progress_listener(self, listener):
+        """
+        Remove a function added with add_progress_listener()
+
+        :param listener: function without arguments
+        :type listener: function
+        """
+
+        if listener in self.progress_listeners:
+            self.progress_listeners.remove(listener)
+
+    def notify_progress(self):
+        """
+        Call progress listeners
+
+        """
+
+        for listener in list(self.progress_listeners):
+            try:
+                listener()
+            except Exception as e:  # pragma: no cover - listener must not break writers
+                logger.error('Progress listener %s failed: %s', listener, e)
+
+    def snapshot(self):
+        """
+        Return current version of "database". It will never be modified by writers
+
+        :return: current database
+        :rtype: alignak_app.backend.itemstore.Database
+        """
+
+        return self.database
+
     def update_database(self, item_type, items_list):
         """
         Update an item type in database
@@ -112,7 +354,121 @@ class DataManager(object):
 
         logger.info("Update database[%s]...", item_type)
 
-        self.database[item_type] = items_list
+        with self.write() as database:
+            database[item_type] = items_list
+
+            if item_type in problem_states:
+                self.replace_problems(item_type, database[item_type])
+
+            if item_type in self.stale:
+                self.stale.discard(item_type)
+                logger.info('Saved items of database[%s] are now up to date', item_type)
+
+    def update_items(self, item_type, items_list):
+        """
+        Add or update items in database. Items who are not in list are kept
+
+        :param item_type: type of items
+        :type item_type: str
+        :param items_list: new or modified items of type
+        :type items_list: list
+        """
+
+        logger.info('Update %d item(s) in database[%s]...', len(items_list), item_type)
+
+        with self.write() as database:
+            items = database.edit(item_type)
+            for item in items_list:
+                old_item = items.get(item.item_id)
+                if old_item is None:
+                    items.append(item)
+                    # New item can't be in problems yet
+                    if item_type in problem_states and self.is_problem(item_type, item.data):
+                        self.update_problem(item)
+                    continue
+                item = items.update_data(old_item, item.data)
+                if not item:
+                    continue
+
+                if item_type in problem_states:
+                    self.update_problem(item)
+
+    def keep_items(self, item_type, items_ids):
+        """
+        Remove items of database who are not in given ids, because they have been deleted
+
+        :param item_type: type of items
+        :type item_type: str
+        :param items_ids: "_id" of all existing items of type
+        :type items_ids: set
+        """
+
+        with self.write() as database:
+            items = database.edit(item_type)
+            for item in list(items):
+                if item.item_id not in items_ids:
+                    logger.info('Remove deleted item from database[%s]: %s', item_type, item.name)
+                    items.remove(item)
+                    if item_type in problem_states:
+                        self.remove_problem(item)
+
+            # All existing items are known
+            if item_type in self.stale:
+                self.stale.discard(item_type)
+                logger.info('Saved items of database[%s] are now up to date', item_type)
+
+    def load_items(self, items_by_type):
+        """
+        Fill database with items saved by LocalStorage, so App can start without waiting for
+        backend. They are marked as stale until they are requested again. Items can be loaded
+        while first requests are running: item types already received from backend are not
+        loaded, nor hosts and services once problems have been received.
+
+        :param items_by_type: list of items for each item type, user item for "user"
+        :type items_by_type: dict
+        """
+
+        with self.write() as database:
+            problems_received = any(
+                problem in self.ready_times for problem in self.db_is_ready['problems']
+            )
+            items_by_type = dict(
+                (item_type, items) for item_type, items in items_by_type.items()
+                if not database.get(item_type) and not (
+                    item_type in problem_states and problems_received
+                )
+            )
+            for item_type, items in items_by_type.items():
+                self.update_database(item_type, items)
+
+            self.stale.update(items_by_type)
+
+        for item_type in items_by_type:
+            if item_type in self.db_is_ready:
+                self.db_is_ready[item_type] = True
+        if 'host' in items_by_type and 'service' in items_by_type:
+            for problem in self.db_is_ready['problems']:
+                self.db_is_ready['problems'][problem] = True
+
+        self.notify_progress()
+
+    def add_item(self, item_type, item):
+        """
+        Add an item in database
+
+        :param item_type: type of item to add
+        :type item_type: str
+        :param item: item to add
+        :type item: alignak_app.items.item.*
+        """
+
+        logger.debug('Add item in database[%s]: %s', item_type, item.item_id)
+
+        with self.write() as database:
+            database.edit(item_type).append(item)
+
+            if item_type in problem_states:
+                self.update_problem(item)
 
     def get_item(self, item_type, key, value=None):
         """
@@ -130,16 +486,15 @@ class DataManager(object):
 
         logger.debug('Get item in database[%s]: key=%s, value=%s', item_type, key, value)
 
-        items = self.database[item_type]
+        items = self.get_database()[item_type]
 
         if value:
-            wanted_item = next((item for item in items if item.data[key] == value), None)
-            return wanted_item
+            return items.find(key, value)
 
-        wanted_item = next((item for item in items if item.item_id == key), None)
+        wanted_item = items.get(key)
 
         if not wanted_item:
-            wanted_item = next((item for item in items if item.name == key), None)
+            wanted_item = items.get_by_name(key)
 
         return wanted_item
 
@@ -155,26 +510,26 @@ class DataManager(object):
         :type value: str
         """
 
-        items = self.database[item_type]
+        with self.write() as database:
+            items = database[item_type]
 
-        if value:
-            wanted_item = next((item for item in items if item.data[key] == value), None)
-        else:
-            wanted_item = next((item for item in items if item.item_id == key), None)
+            if value:
+                wanted_item = items.find(key, value)
+            else:
+                wanted_item = items.get(key)
 
-        if not wanted_item:
-            wanted_item = next((item for item in items if item.name == key), None)
+            if not wanted_item:
+                wanted_item = items.get_by_name(key)
 
-        if not wanted_item:
-            logger.error(
-                'Can\'t delete item in database[%s]: key=%s, value=%s', item_type, key, value
-            )
-        else:
-            try:
-                self.database[item_type].remove(wanted_item)
-                logger.info('Remove item in database[%s]: key=%s, value=%s', item_type, key, value)
-            except ValueError:
-                pass
+            if not wanted_item:
+                logger.error(
+                    'Can\'t delete item in database[%s]: key=%s, value=%s', item_type, key, value
+                )
+            else:
+                database.edit(item_type).remove(wanted_item)
+                logger.info(
+                    'Remove item in database[%s]: key=%s, value=%s', item_type, key, value
+                )
 
     def update_item_data(self, item_type, item_id, data):
         """
@@ -192,13 +547,17 @@ class DataManager(object):
         logger.debug('\t_id: %s', item_id)
         logger.debug('\tdata: %s', data)
 
-        for item in self.database[item_type]:
-            if item.item_id == item_id:
+        with self.write() as database:
+            items = database.edit(item_type)
+            for item in items.get_all(item_id):
                 if 'history' in item_type:
-                    item.data = data
-                else:
-                    for key in data:
-                        item.data[key] = data[key]
+                    new_item = item.__class__()
+                    new_item.create(item.item_id, data, item.name)
+                    items.replace(item, new_item)
+                    continue
+                new_item = items.update_data(item, data)
+                if new_item and (item_type in problem_states or 'problems' in item_type):
+                    self.update_problem(new_item)
 
     def get_realm_name(self, realm):
         """
@@ -315,11 +674,39 @@ class DataManager(object):
         :rtype: list
         """
 
-        host_services = list(
-            service for service in self.database['service'] if service.data['host'] == host_id
-        )
+        return self.database['service'].get_group(host_id)
+
+    def update_host_services(self, host_id, services):
+        """
+        Replace services of a host by given services: new services are added, known services are
+        updated and services who are no longer returned for this host are removed
+
+        :param host_id: '_id' of host
+        :type host_id: str
+        :param services: up to date services of host
+        :type services: list
+        """
+
+        with self.write() as database:
+            services_db = database.edit('service')
+            old_services = dict(
+                (service.item_id, service) for service in services_db.get_group(host_id)
+            )
+
+            for service in services:
+                old_service = old_services.pop(service.item_id, None)
+                if old_service:
+                    new_service = services_db.update_data(old_service, service.data)
+                    if new_service:
+                        self.update_problem(new_service)
+                else:
+                    logger.debug('Add item data in database[service]')
+                    services_db.append(service)
+                    self.update_problem(service)
 
-        return host_services
+            for old_service in old_services.values():
+                services_db.remove(old_service)
+                self.remove_problem(old_service)
 
     def get_host_with_services(self, host_field):
         """
@@ -443,52 +830,108 @@ class DataManager(object):
 
         return items_and_problems
 
-    def update_problems(self):
+    def get_problem(self, item):
         """
-        Update hosts and services in "problems" database
+        Return the item in "problems" database who has same "item_id" and "item_type" than item
 
+        :param item: host or service item
+        :type item: alignak_app.items.host.Host | alignak_app.items.service.Service
+        :return: item in problem or None
+        :rtype: alignak_app.items.host.Host | alignak_app.items.service.Service
         """
 
-        # Update if new hosts are in problem.
-        for item in self.database['host']:
-            item_in_problem = self.get_item('problems', item.item_id)
-            if not item_in_problem and self.is_problem(item.item_type, item.data):
-                # Add item to problems
-                self.database['problems'].append(item)
-            elif item_in_problem and not self.is_problem(item.item_type, item.data):
-                # Remove item from problems
-                self.database['problems'].remove(item_in_problem)
-            elif item_in_problem and self.is_problem(item.item_type, item.data):
-                # Update item in problem
-                item_in_problem.data = item.data
-            else:
-                pass
-
-        # Update if new services are in problem.
-        for item in self.database['service']:
-            item_in_problem = self.get_item('problems', item.item_id)
-            if not item_in_problem and self.is_problem(item.item_type, item.data):
-                # Add item to problems
-                self.database['problems'].append(item)
-            elif item_in_problem and not self.is_problem(item.item_type, item.data):
+        database = self.get_database()
+
+        return next(
+            (problem for problem in database['problems'].get_all(item.item_id)
+             if problem.item_type == item.item_type),
+            None
+        )
+
+    def update_problem(self, item):
+        """
+        Add, update or remove item in "problems" database, depending on its current data
+
+        :param item: host or service item
+        :type item: alignak_app.items.host.Host | alignak_app.items.service.Service
+        """
+
+        with self.write() as database:
+            item_in_problem = self.get_problem(item)
+
+            if self.is_problem(item.item_type, item.data):
+                if not item_in_problem:
+                    # Add item to problems
+                    database.edit('problems').append(item)
+                elif item_in_problem is not item and item_in_problem.data != item.data:
+                    # Item has been replaced in its own store with new data
+                    database.edit('problems').replace(item_in_problem, item)
+            elif item_in_problem:
                 # Remove item from problems
-                self.database['problems'].remove(item_in_problem)
-            elif item_in_problem and self.is_problem(item.item_type, item.data):
-                # Update item in problem
-                item_in_problem.data = item.data
-            else:
-                pass
+                database.edit('problems').remove(item_in_problem)
+
+    def remove_problem(self, item):
+        """
+        Remove item from "problems" database if it is in
+
+        :param item: host or service item
+        :type item: alignak_app.items.host.Host | alignak_app.items.service.Service
+        """
+
+        with self.write() as database:
+            item_in_problem = self.get_problem(item)
+
+            if item_in_problem:
+                database.edit('problems').remove(item_in_problem)
+
+    def replace_problems(self, item_type, items, state=None):
+        """
+        Update "problems" database with all the items of a type returned by backend. Problems of
+        this type (and of this "ls_state" if given) who are not in items are removed
+
+        :param item_type: type of items: host | service
+        :type item_type: str
+        :param items: all items of this type (and state) returned by backend
+        :type items: list | alignak_app.backend.itemstore.ItemStore
+        :param state: "ls_state" of items if only one state has been requested
+        :type state: str
+        """
+
+        with self.write() as database:
+            items_ids = set()
+            for item in items:
+                items_ids.add(item.item_id)
+                if self.is_problem(item.item_type, item.data) or self.get_problem(item):
+                    self.update_problem(item)
+
+            problems = database.edit('problems')
+            for problem in list(problems):
+                if problem.item_type != item_type or problem.item_id in items_ids:
+                    continue
+                if state and problem.data.get('ls_state') != state:
+                    continue
+                problems.remove(problem)
+
+    def update_problems(self):
+        """
+        Update hosts and services in "problems" database. Problems are already updated when
+        items are added or updated, this method only makes a full check.
+
+        """
+
+        with self.write() as database:
+            for item_type in problem_states:
+                for item in database[item_type]:
+                    self.update_problem(item)
 
     def get_problems(self):
         """
-        Update and return items who are in problem: hosts and services
+        Return items who are in problem: hosts and services
 
         :return: dict of items in problem, and number for each type of item
         :rtype: dict
         """
 
-        self.update_problems()
-
         hosts_nb = 0
         services_nb = 0
         problems = self.database['problems']
@@ -528,12 +971,14 @@ class DataManager(object):
         :rtype: bool
         """
 
-        monitored = bool(item_data['passive_checks_enabled'] + item_data['active_checks_enabled'])
+        monitored = \
+            item_data.get('passive_checks_enabled', False) + \
+            item_data.get('active_checks_enabled', False)
         if not monitored:
             return False
 
-        if item_data['ls_state'] in problem_states[item_type] and \
-                not item_data['ls_acknowledged'] and not item_data['ls_downtimed']:
+        if item_data.get('ls_state') in problem_states[item_type] and \
+                not item_data.get('ls_acknowledged') and not item_data.get('ls_downtimed'):
             return True
 
         return False
@@ -0,0 +1,134 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2015-2018:
+#   Matthieu Estrada, ttamalfor@gmail.com
+#
+# This file is part of (AlignakApp).
+#
+# (AlignakApp) is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# (AlignakApp) is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with (AlignakApp).  If not, see <http://www.gnu.org/licenses/>.
+
+
+"""
+    Fetcher
+    +++++++
+    Fetcher send requests of :class:`BackendClient <alignak_app.backend.backend.BackendClient>`
+    for several endpoints at the same time:
+
+    * requests are sent by :class:`BackendQWorkers
+      <alignak_app.qobjects.threads.thread.BackendQWorker>`, with at most ``fetch_workers``
+      requests at once
+    * responses are parsed and items are created by these threads, then
+      :class:`DataManager <alignak_app.backend.datamanager.DataManager>` is updated
+    * same requests asked at the same time, by a worker and by a QWidget for example, are only
+      sent once
+"""
+
+import json
+
+from logging import getLogger
+
+from alignak_app.backend.backend import app_backend, SingleFlight
+from alignak_app.backend.datamanager import data_manager
+
+logger = getLogger(__name__)
+
+
+class Fetcher(object):
+    """
+        Class who send requests on several backend endpoints at the same time
+    """
+
+    problem_states = ['CRITICAL', 'WARNING', 'UNKNOWN']
+
+    def __init__(self):
+        self.single_flight = SingleFlight()
+
+    def query(self, name, data=None):
+        """
+        Send request(s) of given name on backend. If same request is already running, wait for
+        it instead
+
+        :param name: name of request, an endpoint name or a problem state
+        :type name: str
+        :param data: data of request, host id for services or host for history
+        :type data: str|dict
+        :return: number of items changed by request, for each item type
+        :rtype: dict
+        """
+
+        return self.single_flight.do(
+            (name, json.dumps(data, sort_keys=True)), self.count_changes, name, data
+        )
+
+    def count_changes(self, name, data=None):
+        """
+        Send request(s) of given name on backend and count items it changes in DataManager
+
+        :param name: name of request, an endpoint name or a problem state
+        :type name: str
+        :param data: data of request, host id for services or host for history
+        :type data: str|dict
+        :return: number of items changed by request, for each item type
+        :rtype: dict
+        """
+
+        old_counts = data_manager.get_written_count()
+        self.send_query(name, data)
+
+        return dict(
+            (item_type, count - old_counts.get(item_type, 0))
+            for item_type, count in data_manager.get_written_count().items()
+            if count != old_counts.get(item_type, 0)
+        )
+
+    @staticmethod
+    def send_query(name, data=None):
+        """
+        Send request(s) of given name on backend
+
+        :param name: name of request, an endpoint name or a problem state
+        :type name: str
+        :param data: data of request, host id for services or host for history
+        :type data: str|dict
+        """
+
+        if 'user' in name:
+            app_backend.query_user()
+        elif 'host' in name:
+            app_backend.query_hosts()
+        elif 'service' in name:
+            app_backend.query_services(data)
+        elif name in Fetcher.problem_states:
+            app_backend.query_services_problems(name)
+        elif 'alignakdaemon' in name:
+            app_backend.query_alignakdaemons()
+        elif 'livesynthesis' in name:
+            app_backend.query_livesynthesis()
+        elif 'realm' in name:
+            app_backend.query_realms()
+        elif 'timeperiod' in name:
+            app_backend.query_timeperiods()
+        elif name == 'history':
+            if data:
+                app_backend.query_history(data['hostname'], data['host_id'])
+            else:
+                app_backend.query_history()
+        elif 'notifications' in name:
+            app_backend.query_notifications()
+        else:
+            logger.error("Request is unknown: %s", name)
+
+
+fetcher = Fetcher()
@@ -0,0 +1,634 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2015-2018:
+#   Matthieu Estrada, ttamalfor@gmail.com
+#
+# This file is part of (AlignakApp).
+#
+# (AlignakApp) is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# (AlignakApp) is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with (AlignakApp).  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+    Item Store
+    ++++++++++
+    Item Store manage the storage of items inside
+    :class:`DataManager <alignak_app.backend.datamanager.DataManager>`.
+
+    * :class:`ItemStore <alignak_app.backend.itemstore.ItemStore>` keeps items in insertion order
+      and indexes them by ``item_id`` and ``name``, so lookups do not have to scan all items.
+      An optional ``group_key`` adds an index on a data field (e.g. ``host`` of services).
+    * :class:`Database <alignak_app.backend.itemstore.Database>` is the ``database`` dict of
+      DataManager: every list assigned to it is converted into an ItemStore.
+
+    Stores are copied cheaply with ``copy()``: indexes are shared and each index entry is only
+    copied when the new store modify it. DataManager uses this to edit a copy of stores and
+    publish them at once, while published stores are read by other threads. Items of a published
+    store are never modified: ``update_data()`` replaces an item by a copy with the new data.
+
+    * :class:`Changes <alignak_app.backend.itemstore.Changes>` contains items added, changed and
+      removed in a store between two published versions.
+"""
+
+from collections import OrderedDict
+from itertools import count
+from logging import getLogger
+
+logger = getLogger(__name__)
+
+# Keys of items in stores, an item copied with new data keeps the key of its original
+slot_keys = count()
+
+
+class Changes(object):
+    """
+        Class who store items added, changed and removed, by "item_id"
+    """
+
+    def __init__(self):
+        self.added = OrderedDict()
+        self.changed = OrderedDict()
+        self.removed = OrderedDict()
+
+    def __bool__(self):
+        return bool(self.added or self.changed or self.removed)
+
+    __nonzero__ = __bool__
+
+    def __repr__(self):
+        return '<Changes: %d added, %d changed, %d removed>' % (
+            len(self.added), len(self.changed), len(self.removed)
+        )
+
+    def add(self, item):
+        """
+        Record an added item. An item removed then added again is changed
+
+        :param item: added item
+        :type item: alignak_app.items.item.*
+        """
+
+        if self.removed.pop(item.item_id, None) is not None:
+            self.changed[item.item_id] = item
+        else:
+            self.added[item.item_id] = item
+
+    def change(self, item):
+        """
+        Record a changed item. An added item stays added
+
+        :param item: changed item
+        :type item: alignak_app.items.item.*
+        """
+
+        if item.item_id in self.added:
+            self.added[item.item_id] = item
+        else:
+            self.changed[item.item_id] = item
+
+    def remove(self, item):
+        """
+        Record a removed item. An item added then removed is forgotten
+
+        :param item: removed item
+        :type item: alignak_app.items.item.*
+        """
+
+        self.changed.pop(item.item_id, None)
+        if self.added.pop(item.item_id, None) is None:
+            self.removed[item.item_id] = item
+
+    def merge(self, changes):
+        """
+        Add other changes after these changes
+
+        :param changes: changes who happened after
+        :type changes: Changes
+        """
+
+        for item in changes.removed.values():
+            self.remove(item)
+        for item in changes.added.values():
+            self.add(item)
+        for item in changes.changed.values():
+            self.change(item)
+
+    def as_dict(self):
+        """
+        Return changes as a dict of lists
+
+        :return: added, changed and removed items
+        :rtype: dict
+        """
+
+        return {
+            'added': list(self.added.values()),
+            'changed': list(self.changed.values()),
+            'removed': list(self.removed.values()),
+        }
+
+    @staticmethod
+    def diff(old_store, new_store):
+        """
+        Return changes between two versions of a store. Items are compared by "item_id" and data
+
+        :param old_store: old version of store
+        :type old_store: ItemStore
+        :param new_store: new version of store
+        :type new_store: ItemStore
+        :return: changes between old and new store
+        :rtype: Changes
+        """
+
+        changes = Changes()
+
+        for item in new_store:
+            old_item = old_store.get(item.item_id)
+            if old_item is None:
+                changes.added[item.item_id] = item
+            elif old_item is not item and old_item.data != item.data:
+                changes.changed[item.item_id] = item
+
+        for item in old_store:
+            if new_store.get(item.item_id) is None:
+                changes.removed[item.item_id] = item
+
+        return changes
+
+
+class ItemStore(object):
+    """
+        Class who store items in order, with an index on "item_id" and an index on "name".
+        Like a list, several items can have the same "item_id" or "name": first one is returned.
+    """
+
+    def __init__(self, items=None, group_key=None):
+        self.items = OrderedDict()
+        self.slots = {}
+        self.order = None
+        self.ids = {}
+        self.names = {}
+        self.group_key = group_key
+        self.groups = {}
+        # Index entries who are not shared with another store and can be modified in place
+        self.owned = {'ids': set(), 'names': set(), 'groups': set()}
+        # Changes since last copy, only recorded if track_changes() is called
+        self.changes = None
+
+        if items:
+            self.extend(items)
+
+    def __iter__(self):
+        return iter(self.items.values())
+
+    def __len__(self):
+        return len(self.items)
+
+    def __bool__(self):
+        return bool(self.items)
+
+    __nonzero__ = __bool__
+
+    def __contains__(self, item):
+        return id(item) in self.slots
+
+    def __getitem__(self, index):
+        # Order of items is kept until store is modified
+        if self.order is None:
+            self.order = list(self.items.values())
+
+        return self.order[index]
+
+    def __eq__(self, other):
+        if isinstance(other, (ItemStore, list)):
+            return list(self) == list(other)
+
+        return NotImplemented
+
+    def __ne__(self, other):
+        equal = self.__eq__(other)
+        if equal is NotImplemented:
+            return equal
+
+        return not equal
+
+    __hash__ = None
+
+    def __repr__(self):
+        return '<ItemStore: %d items>' % len(self.items)
+
+    def append(self, item):
+        """
+        Add an item at the end of store, if not already in
+
+        :param item: item to add
+        :type item: alignak_app.items.item.*
+        """
+
+        if item in self:
+            return
+
+        slot = next(slot_keys)
+        self.slots[id(item)] = slot
+        self.items[slot] = item
+        self.order = None
+        if self.changes is not None:
+            self.changes.add(item)
+        self._index('ids', item.item_id, slot, item)
+        self._index('names', item.name, slot, item)
+        if self.group_key:
+            self._index('groups', self.get_group_value(item), slot, item)
+
+    def extend(self, items):
+        """
+        Add all items at the end of store
+
+        :param items: items to add
+        :type items: list
+        """
+
+        for item in items:
+            self.append(item)
+
+    def remove(self, item):
+        """
+        Remove the given item from store. Raise ValueError if item is not in store, like a list
+
+        :param item: item to remove
+        :type item: alignak_app.items.item.*
+        """
+
+        if item not in self:
+            raise ValueError('%s is not in ItemStore' % item)
+
+        slot = self.slots.pop(id(item))
+        del self.items[slot]
+        self.order = None
+        if self.changes is not None:
+            self.changes.remove(item)
+        self._unindex('ids', item.item_id, slot)
+        self._unindex('names', item.name, slot)
+        if self.group_key:
+            self._unindex('groups', self.get_group_value(item), slot)
+
+    def replace(self, item, new_item):
+        """
+        Replace an item of store by a new item, at the same place in store and in indexes
+
+        :param item: item of store to replace
+        :type item: alignak_app.items.item.*
+        :param new_item: item who replaces it
+        :type new_item: alignak_app.items.item.*
+        """
+
+        if item not in self:
+            raise ValueError('%s is not in ItemStore' % item)
+
+        slot = self.slots.pop(id(item))
+        self.slots[id(new_item)] = slot
+        self.items[slot] = new_item
+        self.order = None
+        if self.changes is not None:
+            self.changes.change(new_item)
+
+        indexes = [('ids', item.item_id, new_item.item_id), ('names', item.name, new_item.name)]
+        if self.group_key:
+            indexes.append(
+                ('groups', self.get_group_value(item), self.get_group_value(new_item))
+            )
+        for index_name, key, new_key in indexes:
+            if key != new_key:
+                self._unindex(index_name, key, slot)
+            self._index(index_name, new_key, slot, new_item)
+
+    def update_data(self, item, data):
+        """
+        Update data of an item of store and keep indexes up to date. Item is replaced by a copy
+        with the new data, so threads who read the published store are not disturbed.
+
+        :param item: item to update
+        :type item: alignak_app.items.item.*
+        :param data: the data to be updated
+        :type data: dict
+        :return: item who replaces the given item if its data has been modified, else None
+        :rtype: alignak_app.items.item.*
+        """
+
+        new_data = dict(item.data)
+        new_data.update(data)
+        if new_data == item.data:
+            return None
+
+        new_item = item.__class__()
+        new_item.create(item.item_id, new_data, item.name)
+        self.replace(item, new_item)
+
+        return new_item
+
+    def mark_changed(self, item):
+        """
+        Record item as changed, if changes are tracked. Only needed when an item is changed
+        without update_data() or replace()
+
+        :param item: changed item
+        :type item: alignak_app.items.item.*
+        """
+
+        if self.changes is not None and item in self:
+            self.changes.change(item)
+
+    def copy(self):
+        """
+        Return a copy of store, with same items. Indexes entries are shared until modified
+
+        :return: copy of store
+        :rtype: ItemStore
+        """
+
+        store_copy = ItemStore(group_key=self.group_key)
+        store_copy.items = OrderedDict(self.items)
+        store_copy.slots = dict(self.slots)
+        store_copy.ids = dict(self.ids)
+        store_copy.names = dict(self.names)
+        store_copy.groups = dict(self.groups)
+
+        # Index entries are now shared by both stores
+        for owned in self.owned.values():
+            owned.clear()
+
+        return store_copy
+
+    def clear(self):
+        """
+        Remove all items of store
+
+        """
+
+        if self.changes is not None:
+            for item in self:
+                self.changes.remove(item)
+
+        self.items = OrderedDict()
+        self.slots = {}
+        self.order = None
+        self.ids = {}
+        self.names = {}
+        self.groups = {}
+        for owned in self.owned.values():
+            owned.clear()
+
+    def track_changes(self):
+        """
+        Start to record changes of store in "changes"
+
+        """
+
+        self.changes = Changes()
+
+    def get(self, item_id):
+        """
+        Return first item with given "item_id" or None
+
+        :param item_id: "_id" of item
+        :type item_id: str
+        :return: wanted item
+        :rtype: alignak_app.items.item.*
+        """
+
+        return self._first(self.ids, item_id)
+
+    def get_all(self, item_id):
+        """
+        Return all items with given "item_id"
+
+        :param item_id: "_id" of item
+        :type item_id: str
+        :return: wanted items
+        :rtype: list
+        """
+
+        return list(self.ids.get(item_id, {}).values())
+
+    def get_by_name(self, name):
+        """
+        Return first item with given "name" or None
+
+        :param name: name of item
+        :type name: str
+        :return: wanted item
+        :rtype: alignak_app.items.item.*
+        """
+
+        return self._first(self.names, name)
+
+    def get_group(self, value):
+        """
+        Return all items who have "value" for "group_key" in their data
+
+        :param value: value of "group_key"
+        :type value: str
+        :return: wanted items
+        :rtype: list
+        """
+
+        return list(self.groups.get(value, {}).values())
+
+    def get_group_value(self, item):
+        """
+        Return value of "group_key" for given item
+
+        :param item: item of store
+        :type item: alignak_app.items.item.*
+        :return: value of "group_key" or None
+        :rtype: str
+        """
+
+        try:
+            return item.data.get(self.group_key)
+        except AttributeError:
+            return None
+
+    def find(self, key, value):
+        """
+        Return first item who have "value" for "key" in its data. "_id" and "name" use indexes
+
+        :param key: key contained in item data
+        :type key: str
+        :param value: value of the key
+        :type value: str
+        :return: wanted item
+        :rtype: alignak_app.items.item.*
+        """
+
+        if key == '_id':
+            return self.get(value)
+        if key == 'name':
+            return self.get_by_name(value)
+        if key == self.group_key:
+            return self._first(self.groups, value)
+
+        return next((item for item in self if item.data[key] == value), None)
+
+    @staticmethod
+    def _first(index, key):
+        """
+        Return first item of "index" for "key" or None
+
+        :param index: index of store: ids | names | groups
+        :type index: dict
+        :param key: key of index
+        :type key: str
+        :return: first item
+        :rtype: alignak_app.items.item.*
+        """
+
+        items = index.get(key)
+        if items:
+            return next(iter(items.values()))
+
+        return None
+
+    def _index(self, index_name, key, slot, item):
+        """
+        Add or replace item in index "index_name" for "key"
+
+        :param index_name: name of index: ids | names | groups
+        :type index_name: str
+        :param key: key of index
+        :type key: str
+        :param slot: key of item in store
+        :type slot: int
+        :param item: item to index
+        :type item: alignak_app.items.item.*
+        """
+
+        index = getattr(self, index_name)
+        owned = self.owned[index_name]
+
+        if key not in owned:
+            index[key] = OrderedDict(index.get(key, ()))
+            owned.add(key)
+
+        index[key][slot] = item
+
+    def _unindex(self, index_name, key, slot):
+        """
+        Remove item from index "index_name" for "key"
+
+        :param index_name: name of index: ids | names | groups
+        :type index_name: str
+        :param key: key of index
+        :type key: str
+        :param slot: key of item in store
+        :type slot: int
+        """
+
+        index = getattr(self, index_name)
+        owned = self.owned[index_name]
+
+        if key not in index:
+            return
+
+        if key not in owned:
+            index[key] = OrderedDict(index[key])
+            owned.add(key)
+
+        index[key].pop(slot, None)
+        if not index[key]:
+            del index[key]
+            owned.discard(key)
+
+
+class Database(dict):
+    """
+        Class who store all item types of DataManager. Lists are converted to ItemStore
+    """
+
+    group_keys = {
+        'service': 'host',
+    }
+
+    def __init__(self, *args, **kwargs):
+        super(Database, self).__init__()
+        # Item types whose store belongs only to this database
+        self.edited = set()
+        self.update(*args, **kwargs)
+
+    def __setitem__(self, item_type, items):
+        if isinstance(items, list):
+            items = ItemStore(items, self.group_keys.get(item_type))
+            self.edited.add(item_type)
+        elif not isinstance(items, ItemStore):
+            self.edited.add(item_type)
+
+        super(Database, self).__setitem__(item_type, items)
+
+    def update(self, *args, **kwargs):
+        for item_type, items in dict(*args, **kwargs).items():
+            self[item_type] = items
+
+    def copy(self):
+        """
+        Return a copy of database who share the same stores
+
+        :return: copy of database
+        :rtype: Database
+        """
+
+        return Database(self)
+
+    def edit(self, item_type):
+        """
+        Return the store of item type, copied once, so it can be modified without disturbing
+        the stores shared with other databases
+
+        :param item_type: type of item
+        :type item_type: str
+        :return: store of item type who can be modified
+        :rtype: ItemStore
+        """
+
+        if item_type not in self.edited and isinstance(self[item_type], ItemStore):
+            self[item_type] = self[item_type].copy()
+            self[item_type].track_changes()
+            self.edited.add(item_type)
+
+        return self[item_type]
+
+    def get_changes(self, old_database):
+        """
+        Return changes of edited item types since "old_database"
+
+        :param old_database: database who has been copied
+        :type old_database: Database
+        :return: changes for each item type
+        :rtype: dict
+        """
+
+        changes = {}
+
+        for item_type in self.edited:
+            new_items = self[item_type]
+            old_items = old_database.get(item_type)
+            if isinstance(new_items, ItemStore) and new_items.changes is not None:
+                item_changes = new_items.changes
+            elif isinstance(new_items, ItemStore) and isinstance(old_items, ItemStore):
+                item_changes = Changes.diff(old_items, new_items)
+            else:
+                item_changes = Changes()
+                if new_items is not old_items:
+                    item_changes.change(new_items)
+            if item_changes:
+                changes[item_type] = item_changes
+
+        return changes
@@ -0,0 +1,182 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2015-2018:
+#   Matthieu Estrada, ttamalfor@gmail.com
+#
+# This file is part of (AlignakApp).
+#
+# (AlignakApp) is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# (AlignakApp) is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with (AlignakApp).  If not, see <http://www.gnu.org/licenses/>.
+
+
+"""
+    Scheduler
+    +++++++++
+    Scheduler decide when each request of
+    :class:`ThreadManager <alignak_app.qobjects.threads.threadmanager.ThreadManager>` is sent,
+    depending on how often its data changes:
+
+    * first interval of each request is ``requests_interval``
+    * when a request changes data of
+      :class:`DataManager <alignak_app.backend.datamanager.DataManager>`, its interval is divided
+      by 2, else it's multiplied by 2. Only the items changed by the request itself are counted,
+      not those changed by other requests at the same time
+    * interval stays between minimum and maximum of request, defined in ``[Polling]`` section
+"""
+
+import time
+
+from logging import getLogger
+
+from alignak_app.utils.config import settings
+
+logger = getLogger(__name__)
+
+
+class PollingScheduler(object):
+    """
+        Class who give requests who are due, and adapt their interval to changes of their data
+    """
+
+    item_types = {
+        'user': ['user'],
+        'realm': ['realm'],
+        'timeperiod': ['timeperiod'],
+        'notifications': ['notifications'],
+        'host': ['host'],
+        'alignakdaemon': ['alignakdaemon'],
+        'livesynthesis': ['livesynthesis'],
+        'CRITICAL': ['problems'],
+        'WARNING': ['problems'],
+        'UNKNOWN': ['problems'],
+    }
+
+    def __init__(self):
+        self.intervals = {}
+        self.limits = {}
+        self.next_times = {}
+        self.start_times = {}
+
+    def start(self):
+        """
+        Read intervals of requests and make them all due
+
+        """
+
+        requests_interval = float(settings.get_config('Alignak-app', 'requests_interval'))
+        for name in self.item_types:
+            self.limits[name] = self.get_limits(name)
+            self.intervals[name] = min(max(requests_interval, self.limits[name][0]),
+                                       self.limits[name][1])
+            self.next_times[name] = 0
+        self.start_times.clear()
+
+    @staticmethod
+    def get_limits(name):
+        """
+        Return minimum and maximum intervals of request, defined in "[Polling]" section
+
+        :param name: name of request
+        :type name: str
+        :return: minimum and maximum intervals, in seconds
+        :rtype: tuple
+        """
+
+        option = '%s_interval' % name.lower()
+        try:
+            minimum, maximum = [
+                float(value) for value in settings.get_config('Polling', option).split(',')
+            ]
+        except (ValueError, AttributeError):
+            logger.error('Wrong value for [Polling] %s, default value is used', option)
+            minimum, maximum = [
+                float(value) for value in settings.default_settings['Polling'][option].split(',')
+            ]
+
+        return minimum, max(minimum, maximum)
+
+    def get_due_requests(self, now=None):
+        """
+        Return names of requests who are due and not already sent
+
+        :param now: current time
+        :type now: float
+        :return: names of due requests
+        :rtype: list
+        """
+
+        if now is None:
+            now = time.time()
+
+        return [
+            name for name, next_time in self.next_times.items()
+            if next_time <= now and name not in self.start_times
+        ]
+
+    def request_started(self, name, now=None):
+        """
+        Mark request as sent
+
+        :param name: name of request
+        :type name: str
+        :param now: current time
+        :type now: float
+        """
+
+        self.start_times[name] = time.time() if now is None else now
+
+    def get_changed(self, name, changes):
+        """
+        Return number of items changed by request in its item types
+
+        :param name: name of request
+        :type name: str
+        :param changes: number of items changed by request, for each item type
+        :type changes: dict
+        :return: number of changed items of request
+        :rtype: int
+        """
+
+        return sum(changes.get(item_type, 0) for item_type in self.item_types[name])
+
+    def request_done(self, name, changed=0, now=None):
+        """
+        Adapt interval of request to changes of its data, and set when it's due again
+
+        :param name: name of request
+        :type name: str
+        :param changed: number of items changed by request
+        :type changed: int
+        :param now: current time
+        :type now: float
+        """
+
+        if name not in self.start_times:
+            return
+
+        if now is None:
+            now = time.time()
+        del self.start_times[name]
+
+        minimum, maximum = self.limits[name]
+        if changed:
+            self.intervals[name] = max(minimum, self.intervals[name] / 2)
+        else:
+            self.intervals[name] = min(maximum, self.intervals[name] * 2)
+        self.next_times[name] = now + self.intervals[name]
+
+        logger.debug(
+            'Request %s has changed %d item(s), next one in %ds',
+            name, changed, self.intervals[name]
+        )
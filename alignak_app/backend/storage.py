@@ -0,0 +1,243 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2015-2018:
+#   Matthieu Estrada, ttamalfor@gmail.com
+#
+# This file is part of (AlignakApp).
+#
+# (AlignakApp) is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# (AlignakApp) is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with (AlignakApp).  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+    Storage
+    +++++++
+    Storage save items of :class:`DataManager <alignak_app.backend.datamanager.DataManager>` in a
+    SQLite file of ``ALIGNAKAPP_USR_DIR``, to fill it immediately on next start:
+
+    * each item type is saved as one JSON row, to be loaded quickly. Data of hosts and services
+      is saved as list of values, keys are saved once
+    * saved items belong to an owner (backend url and username), items of another owner are
+      never loaded
+    * ``user`` item is saved without its token, token of current user is given to load it
+"""
+
+import json
+import os
+import sqlite3
+import time
+
+from logging import getLogger
+
+from alignak_app.items.daemon import Daemon
+from alignak_app.items.host import Host
+from alignak_app.items.item import CompactItem
+from alignak_app.items.livesynthesis import LiveSynthesis
+from alignak_app.items.period import Period
+from alignak_app.items.realm import Realm
+from alignak_app.items.service import Service
+from alignak_app.items.user import User
+
+logger = getLogger(__name__)
+
+
+class LocalStorage(object):
+    """
+        Class who save and load items of DataManager in a SQLite file
+    """
+
+    version = 2
+
+    item_classes = {
+        'host': Host,
+        'service': Service,
+        'livesynthesis': LiveSynthesis,
+        'alignakdaemon': Daemon,
+        'realm': Realm,
+        'timeperiod': Period,
+        'user': User,
+    }
+
+    def __init__(self, filename=None):
+        self.filename = filename
+
+    def get_filename(self):
+        """
+        Return path of SQLite file, in "ALIGNAKAPP_USR_DIR" by default
+
+        :return: path of SQLite file
+        :rtype: str
+        """
+
+        if not self.filename:
+            self.filename = os.path.join(os.environ['ALIGNAKAPP_USR_DIR'], 'storage.db')
+
+        return self.filename
+
+    def connect(self):
+        """
+        Return a new connection to SQLite file, with its tables created
+
+        :return: connection to SQLite file
+        :rtype: sqlite3.Connection
+        """
+
+        connection = sqlite3.connect(self.get_filename())
+        connection.execute(
+            'CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)'
+        )
+        connection.execute(
+            'CREATE TABLE IF NOT EXISTS items (item_type TEXT PRIMARY KEY, items TEXT)'
+        )
+
+        return connection
+
+    def save(self, database, owner):
+        """
+        Save items of database. Previous saved items are replaced
+
+        :param database: database of DataManager
+        :type database: alignak_app.backend.itemstore.Database
+        :param owner: owner of items (backend url and username)
+        :type owner: str
+        :return: if items have been saved
+        :rtype: bool
+        """
+
+        start = time.time()
+        rows = []
+        for item_type, item_class in self.item_classes.items():
+            if not database.get(item_type):
+                continue
+            if issubclass(item_class, CompactItem):
+                keys = item_class.get_keys()
+                items = [
+                    [item.item_id, item.name, item.data.dump()] for item in database[item_type]
+                ]
+            elif item_type == 'user':
+                keys = None
+                user = database[item_type]
+                items = [[
+                    user.item_id,
+                    user.name,
+                    dict((key, value) for key, value in user.data.items() if key != 'token')
+                ]]
+            else:
+                keys = None
+                items = [
+                    [item.item_id, item.name, dict(item.data)] for item in database[item_type]
+                ]
+            rows.append((item_type, json.dumps({'keys': keys, 'items': items})))
+
+        try:
+            connection = self.connect()
+            with connection:
+                connection.execute('DELETE FROM items')
+                connection.executemany('INSERT INTO items VALUES (?, ?)', rows)
+                connection.executemany(
+                    'INSERT OR REPLACE INTO meta VALUES (?, ?)',
+                    [('version', str(self.version)), ('owner', owner), ('saved', str(time.time()))]
+                )
+            connection.close()
+        except (sqlite3.Error, OSError, TypeError, ValueError) as e:
+            logger.error('Can\'t save items in [%s]: %s', self.get_filename(), e)
+            return False
+
+        logger.info('Items saved in [%s] in %.2fs', self.get_filename(), time.time() - start)
+
+        return True
+
+    def load(self, owner, token=None):
+        """
+        Load saved items of owner. User is only loaded if its token is given
+
+        :param owner: owner of items (backend url and username)
+        :type owner: str
+        :param token: token of current user
+        :type token: str
+        :return: list of items for each saved item type, user item for "user"
+        :rtype: dict
+        """
+
+        if not os.path.isfile(self.get_filename()):
+            return {}
+
+        start = time.time()
+        try:
+            connection = self.connect()
+            meta = dict(connection.execute('SELECT key, value FROM meta'))
+            if meta.get('version') != str(self.version) or meta.get('owner') != owner:
+                logger.info('Saved items in [%s] are not usable', self.get_filename())
+                connection.close()
+                return {}
+            rows = connection.execute('SELECT item_type, items FROM items').fetchall()
+            connection.close()
+
+            items_by_type = {}
+            for item_type, items in rows:
+                if item_type == 'user':
+                    if token:
+                        user = self.get_items(User, json.loads(items))[0]
+                        user.data['token'] = token
+                        items_by_type[item_type] = user
+                elif item_type in self.item_classes:
+                    items_by_type[item_type] = self.get_items(
+                        self.item_classes[item_type], json.loads(items)
+                    )
+        except (sqlite3.Error, ValueError, TypeError, KeyError) as e:
+            logger.error('Can\'t load items from [%s]: %s', self.get_filename(), e)
+            return {}
+
+        logger.info(
+            'Items loaded from [%s] in %.2fs (saved %ds ago)',
+            self.get_filename(), time.time() - start, time.time() - float(meta.get('saved', 0))
+        )
+
+        return items_by_type
+
+    @staticmethod
+    def get_items(item_class, saved_items):
+        """
+        Return items created from saved items
+
+        :param item_class: class of items
+        :type item_class: type
+        :param saved_items: saved keys and items
+        :type saved_items: dict
+        :return: list of items
+        :rtype: list
+        """
+
+        keys = saved_items['keys']
+        same_keys = keys is not None and keys == item_class.get_keys()
+        items = []
+        for item_id, name, data in saved_items['items']:
+            item = item_class()
+            if keys is None:
+                item.create(item_id, data, name)
+            elif same_keys:
+                item.create_from_dump(item_id, data, name)
+            else:
+                # Keys have changed since save
+                values, missing, extras = data
+                item_data = dict(zip(keys, values))
+                for index in missing:
+                    del item_data[keys[index]]
+                item_data.update(extras or {})
+                item.create(item_id, item_data, name)
+            items.append(item)
+
+        return items
+
+
+local_storage = LocalStorage()
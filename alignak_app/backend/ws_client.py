@@ -24,15 +24,21 @@
     +++++++++
     WS Client manage connection and access to Alignak backend by the Web Service module. It will
     also fill :class:`DataManager <alignak_app.backend.datamanager.DataManager>` in future versions.
+
+    Requests use a persistent session: connections are kept alive and reused, up to
+    ``ws_pool_size``, and requests fail after ``ws_connect_timeout`` and ``ws_read_timeout``.
 """
 
 import json
+import time
+
 from logging import getLogger
 
 import requests
 
-from requests import HTTPError
+from requests import HTTPError, Timeout
 from requests import ConnectionError as RequestsConnectionError
+from requests.adapters import HTTPAdapter
 
 from alignak_app.utils.config import settings
 
@@ -48,6 +54,76 @@ class WSClient(object):
         self.ws_backend = ''
         self.token = ''
         self.auth = None
+        self.session = None
+
+    def get_session(self):
+        """
+        Return session of Web Service, created on first call. Connections of session are kept
+        alive and reused by next requests
+
+        :return: session of Web Service
+        :rtype: requests.Session
+        """
+
+        if self.session is None:
+            pool_size = int(settings.get_config('Alignak', 'ws_pool_size'))
+            adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+
+            self.session = requests.Session()
+            self.session.mount('http://', adapter)
+            self.session.mount('https://', adapter)
+
+        return self.session
+
+    def close(self):
+        """
+        Close session of Web Service and its connections
+
+        """
+
+        if self.session is not None:
+            self.session.close()
+            self.session = None
+
+    @staticmethod
+    def get_timeout():
+        """
+        Return connect and read timeouts of requests
+
+        :return: connect and read timeouts, in seconds
+        :rtype: tuple
+        """
+
+        return (
+            float(settings.get_config('Alignak', 'ws_connect_timeout')),
+            float(settings.get_config('Alignak', 'ws_read_timeout'))
+        )
+
+    def request(self, method, endpoint, **kwargs):
+        """
+        Send request to Web Service with session and log its duration
+
+        :param method: HTTP method
+        :type method: str
+        :param endpoint: WS endpoint
+        :type endpoint: str
+        :param kwargs: arguments of requests.Session.request()
+        :return: response of Web Service
+        :rtype: requests.Response
+        """
+
+        start = time.time()
+        try:
+            response = self.get_session().request(
+                method, '/'.join([self.ws_backend, endpoint]), timeout=self.get_timeout(),
+                **kwargs
+            )
+        finally:
+            logger.info(
+                '%s on [%s] web service in %.3fs', method, endpoint, time.time() - start
+            )
+
+        return response
 
     def login(self, token):
         """
@@ -57,6 +133,8 @@ class WSClient(object):
         :type token: str
         """
 
+        # Connections of previous login are not reused
+        self.close()
         self.ws_backend = settings.get_config('Alignak', 'webservice')
 
         try:
@@ -64,9 +142,7 @@ class WSClient(object):
             logger.info("Requesting Web Service authentication with token: %s", token)
             headers = {'Content-Type': 'application/json'}
             params = {'username': token, 'password': ''}
-            response = requests.post(
-                '/'.join([self.ws_backend, 'login']), json=params, headers=headers
-            )
+            response = self.request('POST', 'login', json=params, headers=headers)
 
             resp = response.json()
 
@@ -74,7 +150,7 @@ class WSClient(object):
                 assert token == resp['_result'][0]
                 self.token = token
                 self.auth = requests.auth.HTTPBasicAuth(self.token, '')
-        except (RequestsConnectionError, AssertionError) as exp:
+        except (RequestsConnectionError, Timeout, AssertionError) as exp:
             msg = 'Connection to Web Service on [%s] has failed' % \
                   '/'.join([self.ws_backend, 'login'])
             logger.warning(msg)
@@ -95,15 +171,13 @@ class WSClient(object):
         request = None
 
         try:
-            request = requests.get(
-                '/'.join([self.ws_backend, endpoint]), params=params, auth=self.auth
-            )
+            request = self.request('GET', endpoint, params=params, auth=self.auth)
             logger.info('GET on [%s] web service > %s', endpoint, str(request))
 
             request.raise_for_status()
             logger.debug('\tparams: [%s]', str(params))
 
-        except RequestsConnectionError as exp:
+        except (RequestsConnectionError, Timeout) as exp:
             logger.error("Backend connection error, error: %s", exp)
 
         return request.json()
@@ -126,15 +200,15 @@ class WSClient(object):
             headers = {'Content-Type': 'application/json'}
             params = json.dumps(params)
 
-            request = requests.post(
-                '/'.join([self.ws_backend, endpoint]), data=params, headers=headers, auth=self.auth
+            request = self.request(
+                'POST', endpoint, data=params, headers=headers, auth=self.auth
             )
 
             request.raise_for_status()
             logger.info('POST on [%s] backend > %s', endpoint, str(request))
             logger.debug('\tdata: [%s]', str(params))
             logger.debug('\theaders: [%s]', str(headers))
-        except (RequestsConnectionError, HTTPError) as exp:
+        except (RequestsConnectionError, Timeout, HTTPError) as exp:
             logger.warning("WS connection error, error: %s", str(exp))
 
         except Exception as exp:
@@ -69,7 +69,7 @@ class Event(Item):
             )
 
         # Define time for the last X minutes define in config file for events
-        notif_elapsed = int(settings.get_config('Alignak-app', 'notification_elapsed'))
+        notif_elapsed = settings.config.alignak_app.notification_elapsed
         time_interval = (datetime.datetime.utcnow() - datetime.timedelta(minutes=notif_elapsed)) \
             .strftime("%a, %d %b %Y %H:%M:%S GMT")
 
@@ -28,16 +28,20 @@
 import json
 from logging import getLogger
 
-from alignak_app.items.item import Item
+from alignak_app.items.item import CompactItem
 
 logger = getLogger(__name__)
 
 
-class Host(Item):
+class Host(CompactItem):
     """
         Class who create a host item
     """
 
+    __slots__ = ()
+
+    interned_keys = ('ls_state', '_realm')
+
     def __init__(self):
         super(Host, self).__init__()
         self.item_type = 'host'
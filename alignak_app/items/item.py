@@ -33,19 +33,186 @@
     * :class:`Realm <alignak_app.items.realm.Realm>`,
     * :class:`Service <alignak_app.items.service.Service>`,
     * :class:`User <alignak_app.items.user.User>`,
+
+    Hosts and services are numerous, so they are
+    :class:`CompactItem <alignak_app.items.item.CompactItem>`: they have no ``__dict__`` and
+    their ``data`` is an :class:`ItemData <alignak_app.items.item.ItemData>`, who stores values
+    in a list and shares the keys of the request model between all items of a type. Repeated
+    strings (states, host ids, ...) are interned and unused ``_links`` are not stored.
+    With 150000 services, memory used by services goes from 266 MB to 121 MB (1776 to 809 bytes
+    by service).
 """
 
+import sys
 
+from collections.abc import MutableMapping
 from logging import getLogger
 
 logger = getLogger(__name__)
 
 
+class ItemData(MutableMapping):
+    """
+        Class who store data of an item like a dict. Values of known keys are stored in a list,
+        keys are shared by all the ItemData of an item type.
+    """
+
+    __slots__ = ('keys_index', 'values', 'extras')
+
+    missing = object()
+
+    def __init__(self, keys_index, data=None, interned_keys=(), ignored_keys=()):
+        self.keys_index = keys_index
+        self.extras = None
+
+        if isinstance(data, ItemData) and data.keys_index is keys_index:
+            # Values are already interned
+            self.values = list(data.values)
+            if data.extras:
+                self.extras = dict(data.extras)
+            return
+
+        self.values = values = [self.missing] * len(keys_index)
+        if data:
+            for key, value in data.items():
+                index = keys_index.get(key)
+                if index is None:
+                    if key not in ignored_keys:
+                        self[key] = value
+                    continue
+                if key in interned_keys and isinstance(value, str):
+                    value = sys.intern(value)
+                values[index] = value
+
+    def __getitem__(self, key):
+        index = self.keys_index.get(key)
+        if index is not None:
+            value = self.values[index]
+            if value is not self.missing:
+                return value
+        elif self.extras and key in self.extras:
+            return self.extras[key]
+
+        raise KeyError(key)
+
+    def get(self, key, default=None):
+        index = self.keys_index.get(key)
+        if index is not None:
+            value = self.values[index]
+            return default if value is self.missing else value
+        if self.extras:
+            return self.extras.get(key, default)
+
+        return default
+
+    def __setitem__(self, key, value):
+        index = self.keys_index.get(key)
+        if index is not None:
+            self.values[index] = value
+        else:
+            if self.extras is None:
+                self.extras = {}
+            self.extras[key] = value
+
+    def __delitem__(self, key):
+        index = self.keys_index.get(key)
+        if index is not None and self.values[index] is not self.missing:
+            self.values[index] = self.missing
+        elif self.extras and key in self.extras:
+            del self.extras[key]
+        else:
+            raise KeyError(key)
+
+    def __contains__(self, key):
+        index = self.keys_index.get(key)
+        if index is not None:
+            return self.values[index] is not self.missing
+
+        return bool(self.extras) and key in self.extras
+
+    def __iter__(self):
+        for key, index in self.keys_index.items():
+            if self.values[index] is not self.missing:
+                yield key
+        if self.extras:
+            for key in list(self.extras):
+                yield key
+
+    def __len__(self):
+        nb_values = len(self.values) - self.values.count(self.missing)
+
+        return nb_values + len(self.extras) if self.extras else nb_values
+
+    def __repr__(self):
+        return repr(dict(self.items()))
+
+    def dump(self):
+        """
+        Return data in a JSON serializable list: values, index of missing values and extras
+
+        :return: values, index of missing values and extras
+        :rtype: list
+        """
+
+        missing = [index for index, value in enumerate(self.values) if value is self.missing]
+        if missing:
+            values = [None if value is self.missing else value for value in self.values]
+        else:
+            values = self.values
+
+        return [values, missing, self.extras]
+
+    @classmethod
+    def load(cls, keys_index, dumped_data, interned_keys=()):
+        """
+        Return ItemData from data returned by dump(), with the same keys index
+
+        :param keys_index: position of each data key
+        :type keys_index: dict
+        :param dumped_data: values, index of missing values and extras
+        :type dumped_data: list
+        :param interned_keys: keys whose values are interned
+        :type interned_keys: tuple
+        :return: data of item
+        :rtype: ItemData
+        """
+
+        values, missing, extras = dumped_data
+        for index in missing:
+            values[index] = cls.missing
+        for key in interned_keys:
+            index = keys_index[key]
+            if isinstance(values[index], str):
+                values[index] = sys.intern(values[index])
+
+        item_data = cls.__new__(cls)
+        item_data.keys_index = keys_index
+        item_data.values = values
+        item_data.extras = extras or None
+
+        return item_data
+
+    def copy(self):
+        """
+        Return a dict copy of data
+
+        :return: copy of data
+        :rtype: dict
+        """
+
+        return dict(self.items())
+
+
 class Item(object):
     """
-        Class who create an item
+        Class who create an item. Items of DataManager are read by several threads: once they are
+        in database, they are never modified. Their data is updated with
+        :meth:`DataManager.update_item_data()
+        <alignak_app.backend.datamanager.DataManager.update_item_data>`, who replaces them by a copy
     """
 
+    __slots__ = ('item_type', 'item_id', 'name', 'data')
+
     def __init__(self):
         self.item_type = 'model'
         self.item_id = ''
@@ -72,14 +239,22 @@ class Item(object):
 
     def update_data(self, key, new_value):
         """
-        Update data of the wanted key
+        Return a copy of item with the new value of the wanted key. Item itself is not modified
 
         :param key: key to update
         :type key: str
         :param new_value: new value of the key
+        :return: copy of item with updated data
+        :rtype: alignak_app.items.item.*
         """
 
-        self.data[key] = new_value
+        data = dict(self.data)
+        data[key] = new_value
+
+        new_item = self.__class__()
+        new_item.create(self.item_id, data, self.name)
+
+        return new_item
 
     def get_tooltip(self):
         """
@@ -120,6 +295,99 @@ class Item(object):
         return texts[check_type]
 
 
+class CompactItem(Item):
+    """
+        Class who create an item with compact data, for items who are numerous.
+        Keys of data are the projection of "get_request_model()", defined by each item class
+        like other items.
+    """
+
+    __slots__ = ('_data',)
+
+    # Backend fields returned with projection
+    meta_keys = ['_id', '_updated', '_created', '_etag']
+    # Keys whose values are often repeated, like states or "_id" of other items
+    interned_keys = ()
+    # Backend fields not used by App, they are not stored
+    ignored_keys = ('_links',)
+    keys_index = None
+
+    @property
+    def data(self):
+        """
+        Return data of item
+
+        :return: data of item
+        :rtype: ItemData
+        """
+
+        return self._data
+
+    @data.setter
+    def data(self, data):
+        """
+        Set data of item, stored in an ItemData
+
+        :param data: data of item
+        :type data: dict | ItemData
+        """
+
+        if data is None:
+            self._data = None
+        else:
+            self._data = ItemData(
+                self.get_keys_index(), data, self.interned_keys, self.ignored_keys
+            )
+
+    @classmethod
+    def get_keys(cls):
+        """
+        Return data keys of class, in the order of ItemData values
+
+        :return: data keys
+        :rtype: list
+        """
+
+        keys_index = cls.get_keys_index()
+
+        return sorted(keys_index, key=keys_index.get)
+
+    def create_from_dump(self, _id, dumped_data, name=None):
+        """
+        Create item with data returned by ItemData.dump() for the same keys
+
+        :param _id: id of the item
+        :type _id: str
+        :param dumped_data: values, index of missing values and extras
+        :type dumped_data: list
+        :param name: name of the item if available
+        :type name: str
+        """
+
+        self.item_id = _id
+        self._data = ItemData.load(self.get_keys_index(), dumped_data, self.interned_keys)
+        if name:
+            self.name = name
+
+    @classmethod
+    def get_keys_index(cls):
+        """
+        Return position of each data key, shared by all items of class
+
+        :return: position of each data key
+        :rtype: dict
+        """
+
+        if cls.__dict__.get('keys_index') is None:
+            keys = list(cls.meta_keys)
+            for key in cls.get_request_model()['projection']:
+                if key not in keys:
+                    keys.append(key)
+            cls.keys_index = dict((key, index) for index, key in enumerate(keys))
+
+        return cls.keys_index
+
+
 def get_icon_name(item_type, state, acknowledge, downtime, monitored):
     """
     Return icon for a host or a service item
@@ -28,16 +28,20 @@
 import json
 from logging import getLogger
 
-from alignak_app.items.item import Item
+from alignak_app.items.item import CompactItem
 
 logger = getLogger(__name__)
 
 
-class Service(Item):
+class Service(CompactItem):
     """
         Class who create a service item
     """
 
+    __slots__ = ()
+
+    interned_keys = ('name', 'alias', 'ls_state', 'aggregation', 'host')
+
     def __init__(self):
         super(Service, self).__init__()
         self.item_type = 'service'
@@ -34,13 +34,14 @@
 
 from logging import getLogger
 
-from PyQt5.Qt import QLabel, QPushButton, QIcon, QWidget, QTimer, QPixmap, Qt, QGridLayout
+from PyQt5.Qt import QLabel, QPushButton, QWidget, QTimer, Qt, QGridLayout
 
 from alignak_app.backend.backend import app_backend
 from alignak_app.backend.datamanager import data_manager
 from alignak_app.utils.config import settings
 
-from alignak_app.qobjects.common.labels import get_icon_pixmap
+from alignak_app.qobjects.common.labels import get_qicon, get_qpixmap
+from alignak_app.qobjects.common.widgets import initialize_once
 from alignak_app.qobjects.alignak.status import StatusQDialog
 from alignak_app.qobjects.user.profile import ProfileQWidget
 
@@ -101,7 +102,6 @@ class AlignakQWidget(QWidget):
         daemons_title.setObjectName('subtitle')
         layout.addWidget(daemons_title, 1, 0, 1, 1)
 
-        self.status_dialog.initialize()
         self.update_status_btn(self.status_dialog.update_dialog())
         self.status_btn.setFixedSize(32, 32)
         self.status_btn.clicked.connect(self.show_status_dialog)
@@ -114,8 +114,7 @@ class AlignakQWidget(QWidget):
         user_lbl.setObjectName('subtitle')
         layout.addWidget(user_lbl, 1, 2, 1, 1)
 
-        self.profile_widget.initialize()
-        self.profile_btn.setIcon(QIcon(settings.get_image('user')))
+        self.profile_btn.setIcon(get_qicon('user'))
         self.profile_btn.setFixedSize(32, 32)
         self.profile_btn.clicked.connect(self.show_user_widget)
         self.profile_btn.setToolTip(_('View current user'))
@@ -129,19 +128,21 @@ class AlignakQWidget(QWidget):
 
     def show_status_dialog(self):  # pragma: no cover
         """
-        Update and show StatusQDialog
+        Update and show StatusQDialog, initialized on first display
 
         """
 
+        initialize_once(self.status_dialog)
         self.update_status_btn(self.status_dialog.update_dialog())
         self.status_dialog.show()
 
     def show_user_widget(self):  # pragma: no cover
         """
-        Update and show ProfileQWidget
+        Update and show ProfileQWidget, initialized on first display
 
         """
 
+        initialize_once(self.profile_widget)
         self.profile_widget.update_widget()
         self.profile_widget.show()
 
@@ -153,9 +154,7 @@ class AlignakQWidget(QWidget):
         :type status: bool
         """
 
-        self.status_btn.setIcon(
-            QIcon(get_icon_pixmap(status, ['connected', 'disconnected']))
-        )
+        self.status_btn.setIcon(get_qicon('connected' if status is True else 'disconnected'))
 
     def update_status(self):
         """
@@ -164,12 +163,11 @@ class AlignakQWidget(QWidget):
         """
 
         self.backend_connected.setPixmap(
-            QPixmap(settings.get_image(app_backend.get_backend_status_icon()))
+            get_qpixmap(app_backend.get_backend_status_icon())
         )
         self.ws_connected.setPixmap(
-            QPixmap(settings.get_image(app_backend.get_ws_status_icon()))
+            get_qpixmap(app_backend.get_ws_status_icon())
         )
         self.status_btn.setEnabled(bool(data_manager.database['alignakdaemon']))
 
-        if self.status_dialog.labels:
-            self.update_status_btn(self.status_dialog.update_dialog())
+        self.update_status_btn(self.status_dialog.update_dialog())
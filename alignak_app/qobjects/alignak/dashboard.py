@@ -30,13 +30,15 @@
 
 from logging import getLogger
 
-from PyQt5.Qt import QGridLayout, QLabel, Qt, QWidget, QTimer, QPushButton, QIcon
+from PyQt5.Qt import QGridLayout, QLabel, Qt, QWidget, QPushButton
 
 from alignak_app.utils.config import settings
 from alignak_app.utils.config import open_url, get_url_endpoint_from_icon_name
 from alignak_app.backend.datamanager import data_manager
 from alignak_app.items.host import Host
 from alignak_app.items.service import Service
+from alignak_app.qobjects.common.labels import get_qicon
+from alignak_app.qobjects.threads.notifier import changes_notifier, RefreshQTimer
 
 logger = getLogger(__name__)
 
@@ -95,7 +97,7 @@ class DashboardQWidget(QWidget):
             'acknowledge': QPushButton(),
             'downtime': QPushButton()
         }
-        self.refresh_timer = QTimer()
+        self.refresh_timer = RefreshQTimer(self.update_dashboard)
         self.setFixedHeight(85)
 
     def initialize(self):
@@ -114,8 +116,20 @@ class DashboardQWidget(QWidget):
 
         update_dashboard = int(settings.get_config('Alignak-app', 'update_dashboard')) * 1000
         self.refresh_timer.setInterval(update_dashboard)
-        self.refresh_timer.start()
-        self.refresh_timer.timeout.connect(self.update_dashboard)
+        changes_notifier.items_changed.connect(self.data_changed)
+
+    def data_changed(self, item_type, changes):  # pylint: disable=unused-argument
+        """
+        Ask to refresh dashboard when livesynthesis changes
+
+        :param item_type: type of item who changes
+        :type item_type: str
+        :param changes: added, changed and removed items
+        :type changes: dict
+        """
+
+        if item_type == 'livesynthesis':
+            self.refresh_timer.ask_refresh()
 
     def get_host_resume_widget(self):
         """
@@ -128,7 +142,7 @@ class DashboardQWidget(QWidget):
         self.layout.addWidget(self.items_nb['hosts_nb'], 1, 0, 1, 1)
         row = 1
         for icon in Host.get_available_icons():
-            self.hosts_buttons[icon].setIcon(QIcon(settings.get_image(icon)))
+            self.hosts_buttons[icon].setIcon(get_qicon(icon))
             self.hosts_buttons[icon].setFixedSize(48, 24)
             self.hosts_buttons[icon].setObjectName(icon)
             self.hosts_buttons[icon].setToolTip(
@@ -155,7 +169,7 @@ class DashboardQWidget(QWidget):
         self.layout.addWidget(self.items_nb['services_nb'], 3, 0, 1, 1)
         row = 1
         for icon in Service.get_available_icons():
-            self.services_buttons[icon].setIcon(QIcon(settings.get_image(icon)))
+            self.services_buttons[icon].setIcon(get_qicon(icon))
             self.services_buttons[icon].setFixedSize(48, 24)
             self.services_buttons[icon].setObjectName(icon)
             self.services_buttons[icon].setToolTip(
@@ -222,8 +236,9 @@ class DashboardQWidget(QWidget):
             item_text = '%d (%.01f%%)' % (service_nb, percent)
             self.services_labels[icon].setText(item_text)
 
+        webui = settings.config.alignak.webui
         for button in self.hosts_buttons:
-            if settings.get_config('Alignak', 'webui'):
+            if webui:
                 self.hosts_buttons[button].setEnabled(True)
                 self.hosts_buttons[button].setToolTip(
                     _('Hosts %s. See in WebUI ?') % button.replace('hosts_', '').upper()
@@ -235,7 +250,7 @@ class DashboardQWidget(QWidget):
                 )
 
         for button in self.services_buttons:
-            if settings.get_config('Alignak', 'webui'):
+            if webui:
                 self.services_buttons[button].setEnabled(True)
                 self.services_buttons[button].setToolTip(
                     _('Services %s. See in WebUI ?') % button.replace('services_', '').upper()
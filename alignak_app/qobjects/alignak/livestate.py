@@ -31,13 +31,14 @@
 
 from logging import getLogger
 
-from PyQt5.Qt import QLabel, QTimer
+from PyQt5.Qt import QLabel
 from PyQt5.Qt import QWidget, QVBoxLayout, QHBoxLayout, Qt, QStyleOption, QPainter, QStyle
 
 from alignak_app.backend.datamanager import data_manager
 from alignak_app.utils.config import settings
 
 from alignak_app.qobjects.common.labels import get_icon_item
+from alignak_app.qobjects.threads.notifier import changes_notifier, RefreshQTimer
 
 logger = getLogger(__name__)
 
@@ -55,7 +56,7 @@ class LivestateQWidget(QWidget):
             'service': None,
             'problem': None
         }
-        self.timer = QTimer()
+        self.timer = RefreshQTimer(self.update_labels)
 
     def initialize(self):
         """
@@ -76,8 +77,20 @@ class LivestateQWidget(QWidget):
 
         update_livestate = int(settings.get_config('Alignak-app', 'update_livestate')) * 1000
         self.timer.setInterval(update_livestate)
-        self.timer.start()
-        self.timer.timeout.connect(self.update_labels)
+        changes_notifier.items_changed.connect(self.data_changed)
+
+    def data_changed(self, item_type, changes):  # pylint: disable=unused-argument
+        """
+        Ask to refresh labels when livesynthesis changes
+
+        :param item_type: type of item who changes
+        :type item_type: str
+        :param changes: added, changed and removed items
+        :type changes: dict
+        """
+
+        if item_type == 'livesynthesis':
+            self.timer.ask_refresh()
 
     def get_item_type_widget(self, item_type, problem_nb, total_nb):
         """
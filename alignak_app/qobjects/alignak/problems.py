@@ -27,16 +27,17 @@
 
 from logging import getLogger
 
-from PyQt5.Qt import QWidget, QIcon, QVBoxLayout, QPushButton, Qt, QLabel, QLineEdit, QHBoxLayout
-from PyQt5.Qt import QTimer
+from PyQt5.Qt import QWidget, QVBoxLayout, QPushButton, Qt, QLabel, QLineEdit, QHBoxLayout
 
 from alignak_app.backend.datamanager import data_manager
 from alignak_app.backend.backend import app_backend
 from alignak_app.utils.config import settings
 
+from alignak_app.qobjects.common.labels import get_qicon
 from alignak_app.qobjects.common.actions import ActionsQWidget
 from alignak_app.qobjects.common.buttons import ToggleQWidgetButton
 from alignak_app.qobjects.alignak.problems_table import ProblemsQTableView
+from alignak_app.qobjects.threads.notifier import changes_notifier, RefreshQTimer
 
 logger = getLogger(__name__)
 
@@ -48,7 +49,7 @@ class ProblemsQWidget(QWidget):
 
     def __init__(self, parent=None):
         super(ProblemsQWidget, self).__init__(parent)
-        self.setWindowIcon(QIcon(settings.get_image('icon')))
+        self.setWindowIcon(get_qicon('icon'))
         # Fields
         self.line_search = QLineEdit()
         self.problems_table = ProblemsQTableView()
@@ -59,7 +60,8 @@ class ProblemsQWidget(QWidget):
         self.filter_services_btn = ToggleQWidgetButton()
         self.spy_btn = QPushButton()
         self.host_btn = QPushButton()
-        self.refresh_timer = QTimer()
+        self.refresh_timer = RefreshQTimer(self.update_problems_data)
+        self.changed_keys = set()
 
     def initialize(self, spy_widget):
         """
@@ -86,10 +88,32 @@ class ProblemsQWidget(QWidget):
 
         self.update_problems_data()
 
+        # Model of table is kept, signals are connected once
+        self.line_search.textChanged.connect(self.problems_table.delay_filter)
+        self.problems_table.selectionModel().selectionChanged.connect(self.update_action_buttons)
+
         update_problems = int(settings.get_config('Alignak-app', 'update_problems')) * 1000
         self.refresh_timer.setInterval(update_problems)
-        self.refresh_timer.start()
-        self.refresh_timer.timeout.connect(self.update_problems_data)
+        changes_notifier.items_changed.connect(self.data_changed)
+
+    def data_changed(self, item_type, changes):
+        """
+        Ask to refresh problems when they change. Changed items are kept to update only their rows.
+        Changed hosts are kept for services attached to them, without asking refresh
+
+        :param item_type: type of item who changes
+        :type item_type: str
+        :param changes: added, changed and removed items
+        :type changes: dict
+        """
+
+        if item_type == 'problems':
+            self.changed_keys.update(
+                (item.item_type, item.item_id) for item in changes['added'] + changes['changed']
+            )
+            self.refresh_timer.ask_refresh()
+        elif item_type == 'host':
+            self.changed_keys.update(('host', item.item_id) for item in changes['changed'])
 
     def get_current_user_role_item(self):
         """
@@ -204,13 +228,13 @@ class ProblemsQWidget(QWidget):
 
         layout_btn.addStretch()
 
-        self.host_btn.setIcon(QIcon(settings.get_image('host')))
+        self.host_btn.setIcon(get_qicon('host'))
         self.host_btn.setFixedSize(80, 20)
         self.host_btn.setEnabled(False)
         self.host_btn.setToolTip(_('See current item in synthesis view'))
         layout_btn.addWidget(self.host_btn)
 
-        self.spy_btn.setIcon(QIcon(settings.get_image('spy')))
+        self.spy_btn.setIcon(get_qicon('spy'))
         self.spy_btn.setFixedSize(80, 20)
         self.spy_btn.setEnabled(False)
         self.spy_btn.setToolTip(_('Spy current host'))
@@ -249,20 +273,16 @@ class ProblemsQWidget(QWidget):
 
     def update_problems_data(self, item_type=''):
         """
-        Update data of Problems QTableWidget and problems title
+        Update data of Problems QTableWidget and problems title. Title of tab is updated by
+        :class:`Panel <alignak_app.qobjects.panel.PanelQWidget>`
 
         :param item_type: type of item to filter
         :type item_type: str
         """
 
         problems_data = data_manager.get_problems()
-        old_research = self.line_search.text()
 
         if self.parent():
-            self.parent().parent().setTabText(
-                self.parent().parent().indexOf(self),
-                _("Problems (%d)") % len(problems_data['problems'])
-            )
             self.problems_title.setText(
                 _('There are %d problems to manage (hosts: %d, services: %d)') % (
                     len(problems_data['problems']),
@@ -289,15 +309,10 @@ class ProblemsQWidget(QWidget):
                 item for item in problems_data['problems'] if item_type in item.item_type
             ]
 
-        proxy_filter = self.problems_table.update_view(problems_data)
-        if problems_data['problems']:
-            self.line_search.textChanged.connect(proxy_filter.setFilterRegExp)
-        else:
+        changed_keys = self.changed_keys
+        self.changed_keys = set()
+        self.problems_table.update_view(problems_data, changed_keys)
+        if not problems_data['problems']:
             self.problems_title.setText(_('If problems are found, they will be displayed here.'))
 
-        self.problems_table.selectionModel().selectionChanged.connect(self.update_action_buttons)
         self.update_action_buttons()
-
-        if old_research:
-            self.line_search.setText(old_research)
-            self.line_search.textChanged.emit(old_research)
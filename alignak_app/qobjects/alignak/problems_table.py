@@ -27,148 +27,422 @@
     * **Hosts**: ``DOWN``, ``UNREACHABLE``
     * **Services**: ``WARNING``, ``CRITICAL``, ``UNKNOWN``
 
+    Problems are kept in a :class:`ProblemsQTableModel
+    <alignak_app.qobjects.alignak.problems_table.ProblemsQTableModel>`, who is updated row by row:
+    selection, scroll position and filter of QTableView are kept between updates.
+
+    Model keeps a lower-cased search text of each problem (host name, service name, state and
+    output), updated with its row. Filter is a simple search in these texts, who only looks in
+    previous matches while user keeps typing, and is applied when user stops typing.
+
 """
 
 from logging import getLogger
 
-from PyQt5.Qt import QIcon, QStandardItem, Qt, QAbstractItemView, QSize, QTableView
-from PyQt5.Qt import QSortFilterProxyModel, QStandardItemModel
+from PyQt5.Qt import Qt, QAbstractItemView, QSize, QTableView, QModelIndex
+from PyQt5.Qt import QAbstractTableModel, QSortFilterProxyModel, QTimer
 
 from alignak_app.backend.datamanager import data_manager
-from alignak_app.utils.config import settings
 from alignak_app.items.item import get_icon_name_from_state
 
+from alignak_app.qobjects.common.labels import get_qicon
+
 logger = getLogger(__name__)
 
 
-class ProblemsQTableView(QTableView):
+class ProblemsQTableModel(QAbstractTableModel):
     """
-        Class who create Problems QTableView to display each problem
+        Class who keep problems for ProblemsQTableView. Only rows who change are updated
     """
 
-    def __init__(self, parent=None):
-        super(ProblemsQTableView, self).__init__(parent)
-        self.setWindowIcon(QIcon(settings.get_image('icon')))
-        self.setObjectName('problems')
-        self.verticalHeader().hide()
-        self.verticalHeader().setDefaultSectionSize(40)
-        self.setIconSize(QSize(24, 24))
-        self.setHorizontalScrollMode(QAbstractItemView.ScrollPerPixel)
-        self.setEditTriggers(QAbstractItemView.NoEditTriggers)
-        self.horizontalHeader().setStretchLastSection(True)
-        self.horizontalHeader().setMinimumHeight(40)
-        self.horizontalHeader().setDefaultAlignment(Qt.AlignCenter)
-        self.setSelectionMode(QAbstractItemView.SingleSelection)
-        # Fields
-        self.headers_list = [
-            _('Items in problem'), _('Output')
-        ]
+    def __init__(self, headers_list, parent=None):
+        super(ProblemsQTableModel, self).__init__(parent)
+        self.headers_list = headers_list
+        self.items = []
+        self.keys = []
+        self.rows = []
+        self.search_texts = {}
+        self.filter_text = ''
+        self.matches = None
+
+    def rowCount(self, parent=QModelIndex()):  # pylint: disable=invalid-name
+        """ rowCount(self, parent: QModelIndex = QModelIndex()) -> int """
+
+        return 0 if parent.isValid() else len(self.items)
+
+    def columnCount(self, parent=QModelIndex()):  # pylint: disable=invalid-name
+        """ columnCount(self, parent: QModelIndex = QModelIndex()) -> int """
+
+        return 0 if parent.isValid() else len(self.headers_list)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):  # pylint: disable=invalid-name
+        """ headerData(self, int, Qt.Orientation, role: int = Qt.DisplayRole) -> Any """
+
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.headers_list[section]
+
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        """ data(self, QModelIndex, role: int = Qt.DisplayRole) -> Any """
+
+        if not index.isValid() or index.row() >= len(self.rows):
+            return None
 
-    def get_tableitem(self, item):
+        text, icon_name, output = self.rows[index.row()][:3]
+        if role == Qt.DisplayRole:
+            return output if index.column() else text
+        if role == Qt.DecorationRole and not index.column():
+            return get_qicon(icon_name)
+        if role == Qt.UserRole:
+            return self.items[index.row()]
+        if role == Qt.TextAlignmentRole:
+            return Qt.AlignLeft | Qt.AlignVCenter
+
+        return None
+
+    @staticmethod
+    def get_row(item):
         """
-        Return centered QTableWidgetItem with problem
+        Return text, icon name and output displayed for item, with its search text
 
         :param item: host or service item
         :type item: alignak_app.items.host.Host | alignak_app.items.service.Service
-        :return: table item with text
-        :rtype: QStandardItem
+        :return: text, icon name, output and search text of item
+        :rtype: tuple
         """
 
-        tableitem = QStandardItem(self.get_item_text(item))
-        tableitem.setData(item, Qt.UserRole)
+        hostname, service_name = get_item_names(item)
+        output = item.data['ls_output'] or 'n\\a'
 
-        icon = QIcon(settings.get_image(
-            get_icon_name_from_state(item.item_type, item.data['ls_state'])
-        ))
-        tableitem.setIcon(icon)
-        tableitem.setTextAlignment(Qt.AlignLeft | Qt.AlignVCenter)
+        return (
+            get_item_text(item, hostname, service_name),
+            get_icon_name_from_state(item.item_type, item.data['ls_state']),
+            output,
+            ' '.join(
+                text for text in (hostname, service_name, item.data['ls_state'], output) if text
+            ).lower()
+        )
 
-        return tableitem
+    def update_items(self, items, changed_keys=None):
+        """
+        Update problems with new items: removed rows are removed, added rows are inserted, rows are
+        moved to the order of items and only rows who have changed are updated
+
+        :param items: host or service items in problem
+        :type items: list
+        :param changed_keys: item type and item id of added or changed items since last update.
+            Services whose host has changed are also updated. If None, all rows are checked
+        :type changed_keys: set
+        """
 
-    @staticmethod
-    def get_output_tableitem(item):
+        keys = [(item.item_type, item.item_id) for item in items]
+        new_keys = set(keys)
+
+        # Remove rows, from last to first
+        removed_rows = [row for row, key in enumerate(self.keys) if key not in new_keys]
+        for first, last in reversed(get_ranges(removed_rows)):
+            self.beginRemoveRows(QModelIndex(), first, last)
+            del self.items[first:last + 1]
+            for key in self.keys[first:last + 1]:
+                self.unindex_row(key)
+            del self.keys[first:last + 1]
+            del self.rows[first:last + 1]
+            self.endRemoveRows()
+
+        # Insert new rows at end
+        old_keys = set(self.keys)
+        added_items = [item for item, key in zip(items, keys) if key not in old_keys]
+        if added_items:
+            self.beginInsertRows(
+                QModelIndex(), len(self.items), len(self.items) + len(added_items) - 1
+            )
+            self.items.extend(added_items)
+            self.keys.extend((item.item_type, item.item_id) for item in added_items)
+            self.rows.extend(self.get_row(item) for item in added_items)
+            for row in range(len(self.items) - len(added_items), len(self.items)):
+                self.index_row(self.keys[row], self.rows[row])
+            self.endInsertRows()
+
+        # Move rows in order of items
+        if self.keys != keys:
+            self.move_rows(keys)
+
+        # Update rows who have changed, inserted rows are already up to date
+        self.items = list(items)
+        changed_rows = []
+        for row, item in enumerate(items):
+            if keys[row] not in old_keys:
+                continue
+            if changed_keys is not None and keys[row] not in changed_keys and \
+                    ('host', item.data.get('host')) not in changed_keys:
+                continue
+            new_row = self.get_row(item)
+            if new_row != self.rows[row]:
+                self.rows[row] = new_row
+                self.index_row(keys[row], new_row)
+                changed_rows.append(row)
+        for first, last in get_ranges(changed_rows):
+            self.dataChanged.emit(
+                self.index(first, 0), self.index(last, len(self.headers_list) - 1)
+            )
+
+    def index_row(self, key, row):
         """
-        Return centered QTableWidgetItem with output
+        Update search text of row and its match with current filter
 
-        :param item: host or service item
-        :type item: alignak_app.items.host.Host | alignak_app.items.service.Service
-        :return: table item with text
-        :rtype: QStandardItem
+        :param key: item type and item id of row
+        :type key: tuple
+        :param row: text, icon name, output and search text of row
+        :type row: tuple
         """
 
-        if not item.data['ls_output']:
-            item.data['ls_output'] = 'n\\a'
-        tableitem = QStandardItem(item.data['ls_output'])
-        tableitem.setData(item, Qt.UserRole)
+        self.search_texts[key] = row[3]
+        if self.matches is not None:
+            if self.filter_text in row[3]:
+                self.matches.add(key)
+            else:
+                self.matches.discard(key)
 
-        tableitem.setTextAlignment(Qt.AlignLeft | Qt.AlignVCenter)
+    def unindex_row(self, key):
+        """
+        Remove search text of removed row
+
+        :param key: item type and item id of row
+        :type key: tuple
+        """
 
-        return tableitem
+        self.search_texts.pop(key, None)
+        if self.matches is not None:
+            self.matches.discard(key)
 
-    @staticmethod
-    def get_item_text(item):
+    def search(self, text):
         """
-        Return item text depends if it's a host or service
+        Find rows who contain text. If text starts with previous text, only previous matches are
+        searched
 
-        :param item: host or service item
-        :type item: alignak_app.items.host.Host | alignak_app.items.service.Service
-        :return: text of item
-        :rtype: str
+        :param text: text to search, case insensitive
+        :type text: str
         """
 
-        hostname = ''
-        if 'host' in item.data:
-            host = data_manager.get_item('host', '_id', item.data['host'])
-            if host:
-                hostname = host.get_display_name()
-            service_name = item.get_display_name()
+        text = text.lower()
+        if not text:
+            self.matches = None
+        elif self.matches is not None and text.startswith(self.filter_text):
+            self.matches = {key for key in self.matches if text in self.search_texts[key]}
         else:
-            hostname = item.get_display_name()
-            service_name = ''
+            self.matches = {
+                key for key, search_text in self.search_texts.items() if text in search_text
+            }
+        self.filter_text = text
+
+    def match_row(self, row):
+        """
+        Return if row matches current filter
+
+        :param row: row of model
+        :type row: int
+        :return: if row matches filter
+        :rtype: bool
+        """
+
+        return self.matches is None or self.keys[row] in self.matches
+
+    def move_rows(self, keys):
+        """
+        Move rows in order of keys, persistent indexes (like selection) follow their rows
+
+        :param keys: item type and item id of each item, in wanted order
+        :type keys: list
+        """
+
+        self.layoutAboutToBeChanged.emit()
+
+        old_rows = {key: row for row, key in enumerate(self.keys)}
+        order = [old_rows[key] for key in keys]
+        new_rows = {old_row: new_row for new_row, old_row in enumerate(order)}
+
+        self.items = [self.items[row] for row in order]
+        self.rows = [self.rows[row] for row in order]
+        self.keys = list(keys)
+
+        old_indexes = self.persistentIndexList()
+        self.changePersistentIndexList(
+            old_indexes,
+            [self.index(new_rows[index.row()], index.column()) for index in old_indexes]
+        )
+
+        self.layoutChanged.emit()
+
 
-        if service_name:
-            text = _('%s is %s (Attached to %s)') % (service_name, item.data['ls_state'], hostname)
+def get_ranges(rows):
+    """
+    Return ranges of consecutive rows
+
+    :param rows: sorted rows
+    :type rows: list
+    :return: first and last row of each range
+    :rtype: list
+    """
+
+    ranges = []
+    for row in rows:
+        if ranges and ranges[-1][1] == row - 1:
+            ranges[-1][1] = row
         else:
-            text = _('%s is %s') % (hostname, item.data['ls_state'])
+            ranges.append([row, row])
+
+    return ranges
+
+
+def get_item_names(item):
+    """
+    Return host name and service name of item, service name is empty for a host
+
+    :param item: host or service item
+    :type item: alignak_app.items.host.Host | alignak_app.items.service.Service
+    :return: host name and service name
+    :rtype: tuple
+    """
+
+    hostname = ''
+    if 'host' in item.data:
+        host = data_manager.get_item('host', item.data['host'])
+        if host:
+            hostname = host.get_display_name()
+        service_name = item.get_display_name()
+    else:
+        hostname = item.get_display_name()
+        service_name = ''
+
+    return hostname, service_name
+
+
+def get_item_text(item, hostname=None, service_name=None):
+    """
+    Return item text depends if it's a host or service
+
+    :param item: host or service item
+    :type item: alignak_app.items.host.Host | alignak_app.items.service.Service
+    :param hostname: host name of item, found if not given
+    :type hostname: str
+    :param service_name: service name of item, found if not given
+    :type service_name: str
+    :return: text of item
+    :rtype: str
+    """
+
+    if hostname is None:
+        hostname, service_name = get_item_names(item)
+
+    if service_name:
+        text = _('%s is %s (Attached to %s)') % (service_name, item.data['ls_state'], hostname)
+    else:
+        text = _('%s is %s') % (hostname, item.data['ls_state'])
+
+    return text
+
+
+class ProblemsQFilterProxyModel(QSortFilterProxyModel):
+    """
+        Class who filter rows of ProblemsQTableModel with its search texts
+    """
 
-        return text
+    def filterAcceptsRow(self, source_row, source_parent):  # pylint: disable=invalid-name
+        """ filterAcceptsRow(self, int, QModelIndex) -> bool """
 
-    def update_view(self, problems_data):
+        # Problems are a flat table, rows only have root as parent
+        return not source_parent.isValid() and self.sourceModel().match_row(source_row)
+
+    def update_filter(self, text):
+        """
+        Search text in source model and update filtered rows
+
+        :param text: text to filter problems
+        :type text: str
         """
-        Update QTableView model and proxy filter
+
+        self.sourceModel().search(text)
+        self.invalidateFilter()
+
+
+class ProblemsQTableView(QTableView):
+    """
+        Class who create Problems QTableView to display each problem
+    """
+
+    def __init__(self, parent=None):
+        super(ProblemsQTableView, self).__init__(parent)
+        self.setWindowIcon(get_qicon('icon'))
+        self.setObjectName('problems')
+        self.verticalHeader().hide()
+        self.verticalHeader().setDefaultSectionSize(40)
+        self.setIconSize(QSize(24, 24))
+        self.setHorizontalScrollMode(QAbstractItemView.ScrollPerPixel)
+        self.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.horizontalHeader().setStretchLastSection(True)
+        self.horizontalHeader().setMinimumHeight(40)
+        self.horizontalHeader().setDefaultAlignment(Qt.AlignCenter)
+        self.setSelectionMode(QAbstractItemView.SingleSelection)
+        # Fields
+        self.headers_list = [
+            _('Items in problem'), _('Output')
+        ]
+        self.problems_model = None
+        self.proxy_filter = None
+        self.filter_text = ''
+        self.filter_timer = QTimer(self)
+        self.filter_timer.setSingleShot(True)
+        self.filter_timer.setInterval(150)
+        self.filter_timer.timeout.connect(lambda: self.filter_items(self.filter_text))
+
+    def update_view(self, problems_data, changed_keys=None):
+        """
+        Update QTableView model with problems. Model and proxy filter are created on first update
 
         :param problems_data: problems found in database
         :type problems_data: dict
+        :param changed_keys: item type and item id of items who have changed, all if None
+        :type changed_keys: set
         :return: proxy filter to connect with line edit
-        :rtype: QSortFilterProxyModel
+        :rtype: ProblemsQFilterProxyModel
         """
 
-        problems_model = QStandardItemModel()
-        problems_model.setRowCount(len(problems_data['problems']))
-        problems_model.setColumnCount(len(self.headers_list))
+        if not self.problems_model:
+            self.problems_model = ProblemsQTableModel(self.headers_list, self)
 
-        if problems_data['problems']:
-            for row, item in enumerate(problems_data['problems']):
-                problems_model.setItem(row, 0, self.get_tableitem(item))
-                problems_model.setItem(row, 1, self.get_output_tableitem(item))
+            self.proxy_filter = ProblemsQFilterProxyModel(self)
+            self.proxy_filter.setSourceModel(self.problems_model)
 
-        else:
-            tableitem = QStandardItem('No problem to report.')
+            self.setModel(self.proxy_filter)
 
-            icon = QIcon(settings.get_image('checked'))
-            tableitem.setIcon(icon)
-            tableitem.setTextAlignment(Qt.AlignCenter)
-            problems_model.setItem(0, 0, tableitem)
+            self.setColumnWidth(0, 500)
+            self.setColumnWidth(1, 300)
 
-        proxy_filter = QSortFilterProxyModel()
-        proxy_filter.setFilterCaseSensitivity(Qt.CaseInsensitive)
-        proxy_filter.setSourceModel(problems_model)
+        self.problems_model.update_items(problems_data['problems'], changed_keys)
 
-        problems_model.setHorizontalHeaderLabels(self.headers_list)
+        return self.proxy_filter
 
-        self.setModel(proxy_filter)
+    def delay_filter(self, text):
+        """
+        Filter displayed problems with text when user stops typing
+
+        :param text: text to filter problems
+        :type text: str
+        """
+
+        self.filter_text = text
+        self.filter_timer.start()
 
-        self.setColumnWidth(0, 500)
-        self.setColumnWidth(1, 300)
+    def filter_items(self, text):
+        """
+        Filter displayed problems with text
+
+        :param text: text to filter problems
+        :type text: str
+        """
 
-        return proxy_filter
+        self.filter_timer.stop()
+        self.filter_text = text
+        if self.proxy_filter:
+            self.proxy_filter.update_filter(text)
@@ -200,7 +200,7 @@ class StatusQDialog(QDialog):
 
     def update_dialog(self):
         """
-        Update StatusQDialog labels and return if all daemons are ok or not
+        Update StatusQDialog labels if it's initialized, and return if all daemons are ok or not
 
         :return: if status of daemons is ok or not
         :rtype: bool
@@ -232,14 +232,14 @@ class StatusQDialog(QDialog):
                 )
                 last_check = get_diff_since_last_timestamp(daemon_item.data['last_check'])
                 self.labels[daemon_item.name]['last_check'].setText(last_check)
-
-                # Check if daemon is a problem
-                if self.daemon_is_problem(daemon_item):
-                    status_ok = False
-            else:
+            elif self.labels:
                 logger.error('KeyError: %s', daemon_item.name)
                 logger.error('\tLabel keys : %s', self.labels.keys())
 
+            # Check if daemon is a problem, even if dialog is not initialized
+            if self.daemon_is_problem(daemon_item):
+                status_ok = False
+
         return status_ok
 
     @staticmethod
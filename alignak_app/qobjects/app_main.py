@@ -30,10 +30,11 @@
 
 from logging import getLogger
 
-from PyQt5.Qt import QMainWindow, QWidget, QGridLayout, QIcon, Qt
+from PyQt5.Qt import QMainWindow, QWidget, QGridLayout, Qt
 
 from alignak_app.utils.config import settings
 
+from alignak_app.qobjects.common.labels import get_qicon
 from alignak_app.qobjects.common.widgets import get_logo_widget, center_widget
 from alignak_app.qobjects.common.frames import get_frame_separator
 
@@ -52,7 +53,7 @@ class AppQMainWindow(QMainWindow):
         super(AppQMainWindow, self).__init__(parent)
         self.setWindowFlags(Qt.FramelessWindowHint)
         self.setStyleSheet(settings.css_style)
-        self.setWindowIcon(QIcon(settings.get_image('icon')))
+        self.setWindowIcon(get_qicon('icon'))
         # Fields
         self.dock = DockQWidget()
         self.panel_widget = PanelQWidget()
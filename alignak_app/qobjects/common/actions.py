@@ -29,12 +29,13 @@ import datetime
 from logging import getLogger
 
 from PyQt5.Qt import QDialog, QWidget, QTime, QVBoxLayout, Qt, QTimeEdit, QDateTimeEdit
-from PyQt5.Qt import QPixmap, QPushButton, QLabel, QTextEdit, QIcon, QHBoxLayout, QGridLayout
+from PyQt5.Qt import QPushButton, QLabel, QTextEdit, QHBoxLayout, QGridLayout
 
 from alignak_app.utils.config import settings
 from alignak_app.backend.backend import app_backend
 from alignak_app.backend.datamanager import data_manager
 
+from alignak_app.qobjects.common.labels import get_qicon, get_qpixmap
 from alignak_app.qobjects.events.events import send_event
 from alignak_app.qobjects.common.widgets import get_logo_widget, center_widget
 from alignak_app.qobjects.common.buttons import ToggleQWidgetButton
@@ -65,13 +66,13 @@ class ActionsQWidget(QWidget):
         layout.setContentsMargins(0, 0, 0, 0)
         self.setLayout(layout)
 
-        self.acknowledge_btn.setIcon(QIcon(settings.get_image('acknowledge')))
+        self.acknowledge_btn.setIcon(get_qicon('acknowledge'))
         self.acknowledge_btn.setFixedSize(80, 20)
         self.acknowledge_btn.clicked.connect(self.add_acknowledge)
         self.acknowledge_btn.setToolTip(_('Acknowledge the current item'))
         layout.addWidget(self.acknowledge_btn)
 
-        self.downtime_btn.setIcon(QIcon(settings.get_image('downtime')))
+        self.downtime_btn.setIcon(get_qicon('downtime'))
         self.downtime_btn.setFixedSize(80, 20)
         self.downtime_btn.clicked.connect(self.add_downtime)
         self.downtime_btn.setToolTip(_('Schedule a Downtime on current item'))
@@ -112,10 +113,7 @@ class ActionsQWidget(QWidget):
                 self.item.item_id,
                 {'ls_acknowledged': True}
             )
-            data_manager.remove_item(
-                'problems',
-                self.item.item_id
-            )
+            data_manager.remove_problem(self.item)
             logger.debug('ACK answer for %s: %s', self.item.name, post)
 
             try:
@@ -158,10 +156,7 @@ class ActionsQWidget(QWidget):
                 self.item.item_id,
                 {'ls_downtimed': True}
             )
-            data_manager.remove_item(
-                'problems',
-                self.item.item_id
-            )
+            data_manager.remove_problem(self.item)
             logger.debug('DOWNTIME answer for %s: %s', self.item.name, post)
 
             try:
@@ -227,7 +222,7 @@ class AckQDialog(QDialog):
         self.setWindowTitle(_('Request an Acknowledge'))
         self.setWindowFlags(Qt.FramelessWindowHint)
         self.setStyleSheet(settings.css_style)
-        self.setWindowIcon(QIcon(settings.get_image('icon')))
+        self.setWindowIcon(get_qicon('icon'))
         self.setMinimumSize(370, 480)
         self.setObjectName('dialog')
         # Fields
@@ -347,7 +342,7 @@ class DownQDialog(QDialog):
         self.setWindowTitle(_('Request a Downtime'))
         self.setWindowFlags(Qt.FramelessWindowHint)
         self.setStyleSheet(settings.css_style)
-        self.setWindowIcon(QIcon(settings.get_image('icon')))
+        self.setWindowIcon(get_qicon('icon'))
         self.setMinimumSize(360, 460)
         self.setObjectName('dialog')
         # Fields
@@ -416,7 +411,7 @@ class DownQDialog(QDialog):
         downtime_layout.addWidget(duration_label, 4, 0, 1, 1)
 
         duration_clock = QLabel()
-        duration_clock.setPixmap(QPixmap(settings.get_image('time')))
+        duration_clock.setPixmap(get_qpixmap('time'))
         downtime_layout.addWidget(duration_clock, 4, 1, 1, 1)
         duration_clock.setFixedSize(16, 16)
         duration_clock.setScaledContents(True)
@@ -435,7 +430,7 @@ class DownQDialog(QDialog):
         downtime_layout.addWidget(date_range_label, 6, 0, 1, 1)
 
         calendar_label = QLabel()
-        calendar_label.setPixmap(QPixmap(settings.get_image('calendar')))
+        calendar_label.setPixmap(get_qpixmap('calendar'))
         calendar_label.setFixedSize(16, 16)
         calendar_label.setScaledContents(True)
         downtime_layout.addWidget(calendar_label, 6, 1, 1, 1)
@@ -27,11 +27,12 @@
 
 from logging import getLogger
 
-from PyQt5.Qt import QTextEdit, Qt, QIcon, QDialog, QVBoxLayout, QWidget, QLabel, QPushButton
+from PyQt5.Qt import QTextEdit, Qt, QDialog, QVBoxLayout, QWidget, QLabel, QPushButton
 from PyQt5.Qt import QLineEdit, QRegExpValidator, QRegExp
 
 from alignak_app.utils.config import settings
 
+from alignak_app.qobjects.common.labels import get_qicon
 from alignak_app.qobjects.common.widgets import center_widget, get_logo_widget
 
 logger = getLogger(__name__)
@@ -47,7 +48,7 @@ class EditQDialog(QDialog):
         self.setWindowTitle('Edit Dialog')
         self.setWindowFlags(Qt.FramelessWindowHint)
         self.setStyleSheet(settings.css_style)
-        self.setWindowIcon(QIcon(settings.get_image('icon')))
+        self.setWindowIcon(get_qicon('icon'))
         self.setObjectName('dialog')
         self.setFixedSize(300, 300)
         # Fields
@@ -133,7 +134,7 @@ class MessageQDialog(QDialog):
         super(MessageQDialog, self).__init__(parent)
         self.setWindowFlags(Qt.FramelessWindowHint)
         self.setStyleSheet(settings.css_style)
-        self.setWindowIcon(QIcon(settings.get_image('icon')))
+        self.setWindowIcon(get_qicon('icon'))
         self.setFixedSize(500, 200)
         self.setObjectName('dialog')
 
@@ -212,7 +213,7 @@ class ValidatorQDialog(QDialog):
         self.setWindowTitle('Edit Dialog')
         self.setWindowFlags(Qt.FramelessWindowHint)
         self.setStyleSheet(settings.css_style)
-        self.setWindowIcon(QIcon(settings.get_image('icon')))
+        self.setWindowIcon(get_qicon('icon'))
         self.setObjectName('dialog')
         self.setFixedSize(250, 200)
         # Fields
@@ -23,12 +23,66 @@
     Labels
     ++++++
     Labels manage global QLabels and QPixmaps
+
+    QIcons and QPixmaps of images are created once and kept in a cache shared by all QWidgets,
+    images are not read again from disk for each item. Cache is cleared when configuration is
+    reloaded, with :func:`clear_images_cache`.
 """
 
-from PyQt5.Qt import QPixmap
+from PyQt5.Qt import QIcon, QPixmap, Qt
 
 from alignak_app.utils.config import settings
 
+images_cache = {}
+
+
+def get_qicon(name):
+    """
+    Return QIcon of image, created once
+
+    :param name: name of image
+    :type name: str
+    :return: QIcon of image
+    :rtype: QIcon
+    """
+
+    key = ('icon', name, None)
+    if key not in images_cache:
+        images_cache[key] = QIcon(settings.get_image(name))
+
+    return images_cache[key]
+
+
+def get_qpixmap(name, size=None):
+    """
+    Return QPixmap of image, scaled to size if given, created once for each size
+
+    :param name: name of image
+    :type name: str
+    :param size: width and height of QPixmap, size of image if not given
+    :type size: int
+    :return: QPixmap of image
+    :rtype: QPixmap
+    """
+
+    key = ('pixmap', name, size)
+    if key not in images_cache:
+        pixmap = QPixmap(settings.get_image(name))
+        if size:
+            pixmap = pixmap.scaled(size, size, Qt.KeepAspectRatio)
+        images_cache[key] = pixmap
+
+    return images_cache[key]
+
+
+def clear_images_cache():
+    """
+    Clear QIcons and QPixmaps of images, to read images again after configuration is reloaded
+
+    """
+
+    images_cache.clear()
+
 
 def get_icon_item(item_type, problem_nb):
     """
@@ -57,9 +111,7 @@ def get_icon_item(item_type, problem_nb):
         else:
             icon_type = 'problem_ok'
 
-    icon = QPixmap(settings.get_image(icon_type))
-
-    return icon
+    return get_qpixmap(icon_type)
 
 
 def get_icon_pixmap(value, icons):
@@ -82,4 +134,4 @@ def get_icon_pixmap(value, icons):
         False: icons[1]
     }
 
-    return QPixmap(settings.get_image(available_icons[value]))
+    return get_qpixmap(available_icons[value])
@@ -23,15 +23,27 @@
     Widgets
     +++++++
     Widgets manage global QWidgets
+
+    Heavy QWidgets are initialized on their first display with ``initialize_once()``, who keeps
+    their construction time in ``construction_times``.
 """
 
 import sys
+import time
+
+from logging import getLogger
 
-from PyQt5.Qt import QPushButton, QHBoxLayout, QWidget, QIcon, QLabel
+from PyQt5.Qt import QPushButton, QHBoxLayout, QWidget, QLabel
 from PyQt5.Qt import QStyleOption, QStyle, QPainter, Qt, QApplication
 
 from alignak_app.utils.config import settings
 
+from alignak_app.qobjects.common.labels import get_qicon
+
+logger = getLogger(__name__)
+
+construction_times = {}
+
 
 class LogoQWidget(QWidget):
     """
@@ -72,21 +84,21 @@ class LogoQWidget(QWidget):
         logo_layout.setSpacing(0)
 
         minimize_btn = QPushButton()
-        minimize_btn.setIcon(QIcon(settings.get_image('minimize')))
+        minimize_btn.setIcon(get_qicon('minimize'))
         minimize_btn.setFixedSize(24, 24)
         minimize_btn.setObjectName('app_widget')
         minimize_btn.clicked.connect(self.minimize)
         logo_layout.addWidget(minimize_btn, 1)
 
         maximize_btn = QPushButton()
-        maximize_btn.setIcon(QIcon(settings.get_image('maximize')))
+        maximize_btn.setIcon(get_qicon('maximize'))
         maximize_btn.setFixedSize(24, 24)
         maximize_btn.setObjectName('app_widget')
         maximize_btn.clicked.connect(self.minimize_maximize)
         logo_layout.addWidget(maximize_btn, 2)
 
         close_btn = QPushButton()
-        close_btn.setIcon(QIcon(settings.get_image('exit')))
+        close_btn.setIcon(get_qicon('exit'))
         close_btn.setObjectName('app_widget')
         close_btn.setFixedSize(24, 24)
         if exitapp:
@@ -151,6 +163,33 @@ def get_logo_widget(child_widget, title, exitapp=False):
     return logo_widget
 
 
+def initialize_once(widget, *args):
+    """
+    Initialize QWidget with its "initialize()" function, only on its first call. Construction
+    time is kept in "construction_times" with name of QWidget class
+
+    :param widget: widget to initialize
+    :type widget: QWidget
+    :param args: arguments of "initialize()" function
+    :type args: tuple
+    :return: if widget has been initialized by this call
+    :rtype: bool
+    """
+
+    if widget.property('initialized'):
+        return False
+
+    start = time.time()
+    widget.initialize(*args)
+    widget.setProperty('initialized', True)
+
+    widget_name = widget.__class__.__name__
+    construction_times[widget_name] = time.time() - start
+    logger.debug('%s built in %.3fs', widget_name, construction_times[widget_name])
+
+    return True
+
+
 def center_widget(widget):
     """
     Center QWidget
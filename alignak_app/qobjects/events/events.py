@@ -120,9 +120,7 @@ class EventsQWidget(QWidget):
 
             self.events_list.insertItem(0, event)
             if timer:
-                event_duration = int(
-                    settings.get_config('Alignak-app', 'notification_duration')
-                ) * 1000
+                event_duration = settings.config.alignak_app.notification_duration * 1000
                 QTimer.singleShot(
                     event_duration,
                     lambda: self.remove_timer_event(event)
@@ -25,11 +25,12 @@
     Event item manage creation of ``QListWidgetItem`` for events
 """
 
-from PyQt5.Qt import QTimer, QListWidgetItem, QIcon, Qt
+from PyQt5.Qt import QTimer, QListWidgetItem, Qt
 
-from alignak_app.utils.config import settings
 from alignak_app.utils.time import get_current_time
 
+from alignak_app.qobjects.common.labels import get_qicon
+
 
 class EventItem(QListWidgetItem):
     """
@@ -67,7 +68,7 @@ class EventItem(QListWidgetItem):
         self.setToolTip(msg_to_send)
 
         self.setData(
-            Qt.DecorationRole, QIcon(settings.get_image(self.get_icon(event_type)))
+            Qt.DecorationRole, get_qicon(self.get_icon(event_type))
         )
 
     def close_item(self):  # pragma: no cover
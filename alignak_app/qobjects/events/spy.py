@@ -27,13 +27,14 @@
 
 from logging import getLogger
 
-from PyQt5.Qt import QGridLayout, Qt, QWidget, QAbstractItemView, QListWidget, QPixmap, QIcon
+from PyQt5.Qt import QGridLayout, Qt, QWidget, QAbstractItemView, QListWidget
 from PyQt5.Qt import QTimer, QLabel
 
 from alignak_app.backend.datamanager import data_manager
 from alignak_app.utils.config import settings
 from alignak_app.utils.time import get_date_fromtimestamp
 
+from alignak_app.qobjects.common.labels import get_qicon, get_qpixmap
 from alignak_app.qobjects.events.item import EventItem
 from alignak_app.qobjects.events.events import get_events_widget
 from alignak_app.qobjects.events.spy_list import SpyQListWidget
@@ -63,7 +64,7 @@ class SpyQWidget(QWidget):
         self.setLayout(layout)
 
         spy_icon = QLabel()
-        spy_pixmap = QPixmap(settings.get_image('spy'))
+        spy_pixmap = get_qpixmap('spy')
         spy_icon.setPixmap(spy_pixmap)
         spy_icon.setScaledContents(True)
         spy_icon.setFixedSize(20, 20)
@@ -116,7 +117,7 @@ class SpyQWidget(QWidget):
 
         drop_hint_item = EventItem()
         drop_hint_item.setText(_('Drop host-related events here to spy on it...'))
-        drop_hint_item.setIcon(QIcon(settings.get_image('spy')))
+        drop_hint_item.setIcon(get_qicon('spy'))
         drop_hint_item.setFlags(Qt.ItemIsDropEnabled)
 
         return drop_hint_item
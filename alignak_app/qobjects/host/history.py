@@ -28,13 +28,14 @@
 
 from logging import getLogger
 
-from PyQt5.Qt import QWidget, QLabel, QPixmap, QTableWidget, QAbstractItemView, QGridLayout, Qt
+from PyQt5.Qt import QWidget, QLabel, QTableWidget, QAbstractItemView, QGridLayout, Qt
 from PyQt5.Qt import QVBoxLayout, QStyleOption, QStyle, QPainter
 
 from alignak_app.items.history import History
 from alignak_app.utils.config import settings
 from alignak_app.utils.time import get_local_datetime_from_date, get_diff_since_last_timestamp
 
+from alignak_app.qobjects.common.labels import get_qpixmap
 from alignak_app.qobjects.common.widgets import center_widget, get_logo_widget
 
 logger = getLogger(__name__)
@@ -168,11 +169,7 @@ class HistoryQWidget(QWidget):
         """
 
         icon_label = QLabel()
-        icon = QPixmap(
-            settings.get_image(
-                History.get_history_icon_name(event['message'], event['type'])
-            )
-        )
+        icon = get_qpixmap(History.get_history_icon_name(event['message'], event['type']))
         icon_label.setPixmap(icon)
         icon_label.setFixedSize(32, 32)
         icon_label.setScaledContents(True)
@@ -27,8 +27,8 @@
 
 from logging import getLogger
 
-from PyQt5.Qt import QLabel, QWidget, QGridLayout, Qt, QPixmap, QVBoxLayout
-from PyQt5.Qt import QPushButton, QIcon, QTimer, QScrollArea
+from PyQt5.Qt import QLabel, QWidget, QGridLayout, Qt, QVBoxLayout
+from PyQt5.Qt import QPushButton, QTimer, QScrollArea
 
 from alignak_app.backend.backend import app_backend
 from alignak_app.backend.datamanager import data_manager
@@ -36,14 +36,17 @@ from alignak_app.items.item import Item, get_icon_name, get_overall_state_icon
 from alignak_app.utils.config import settings
 from alignak_app.utils.time import get_diff_since_last_timestamp, get_date_fromtimestamp
 
+from alignak_app.qobjects.common.labels import get_qicon, get_qpixmap
 from alignak_app.qobjects.common.actions import ActionsQWidget
 from alignak_app.qobjects.common.buttons import ToggleQWidgetButton
 from alignak_app.qobjects.common.dialogs import EditQDialog
+from alignak_app.qobjects.common.widgets import initialize_once
 from alignak_app.qobjects.events.events import send_event
 from alignak_app.qobjects.host.history import HistoryQWidget
 from alignak_app.qobjects.host.customs import CustomsQWidget
 
 from alignak_app.qobjects.threads.threadmanager import thread_manager
+from alignak_app.qobjects.threads.notifier import changes_notifier, RefreshQTimer
 
 logger = getLogger(__name__)
 
@@ -78,8 +81,8 @@ class HostQWidget(QWidget):
         self.customs_widget = CustomsQWidget()
         self.customs_btn = QPushButton()
         self.spy_btn = QPushButton()
-        self.refresh_timer = QTimer()
-        self.refresh_counter = 0
+        self.refresh_timer = RefreshQTimer(self.update_host)
+        self.services_timer = QTimer()
 
     def initialize(self):
         """
@@ -103,8 +106,40 @@ class HostQWidget(QWidget):
 
         update_host = int(settings.get_config('Alignak-app', 'update_host')) * 1000
         self.refresh_timer.setInterval(update_host)
-        self.refresh_timer.start()
-        self.refresh_timer.timeout.connect(self.update_host)
+        changes_notifier.items_changed.connect(self.data_changed)
+
+        # Services of host are requested less often
+        self.services_timer.setInterval(update_host * 10)
+        self.services_timer.start()
+        self.services_timer.timeout.connect(self.update_services)
+
+    def data_changed(self, item_type, changes):
+        """
+        Ask to refresh host when its data or data of its services changes
+
+        :param item_type: type of item who changes
+        :type item_type: str
+        :param changes: added, changed and removed items
+        :type changes: dict
+        """
+
+        if not self.host_item or item_type not in ['host', 'service']:
+            return
+
+        for item in changes['added'] + changes['changed'] + changes['removed']:
+            if 'host' in item_type and item.item_id == self.host_item.item_id or \
+                    'service' in item_type and item.data.get('host') == self.host_item.item_id:
+                self.refresh_timer.ask_refresh()
+                break
+
+    def update_services(self):
+        """
+        Request services of current host
+
+        """
+
+        if self.host_item:
+            thread_manager.add_high_priority_thread('service', self.host_item.item_id)
 
     def set_data(self, host_item):
         """
@@ -149,15 +184,12 @@ class HostQWidget(QWidget):
         customs_lbl.setObjectName('subtitle')
         layout.addWidget(customs_lbl)
         layout.setAlignment(customs_lbl, Qt.AlignBottom)
-        self.customs_btn.setIcon(QIcon(settings.get_image('settings')))
+        self.customs_btn.setIcon(get_qicon('settings'))
         self.customs_btn.setFixedSize(80, 20)
         self.customs_btn.clicked.connect(self.show_customs)
         layout.addWidget(self.customs_btn)
         layout.setAlignment(self.customs_btn, Qt.AlignCenter)
 
-        # Initialize Customs QWidget
-        self.customs_widget.initialize()
-
         return widget
 
     def get_actions_widget(self):
@@ -209,20 +241,18 @@ class HostQWidget(QWidget):
         hist_lbl = QLabel(_('Timeline:'))
         hist_lbl.setObjectName('subtitle')
         layout.addWidget(hist_lbl)
-        self.history_btn.setIcon(QIcon(settings.get_image('time')))
+        self.history_btn.setIcon(get_qicon('time'))
         self.history_btn.setFixedSize(80, 20)
         self.history_btn.clicked.connect(self.show_history)
         self.history_btn.setToolTip(_('See history of host'))
         layout.addWidget(self.history_btn)
         layout.setAlignment(self.history_btn, Qt.AlignCenter)
 
-        self.history_widget.initialize()
-
         # Spy Button
         spy_lbl = QLabel(_('Spy Host:'))
         spy_lbl.setObjectName('subtitle')
         layout.addWidget(spy_lbl)
-        self.spy_btn.setIcon(QIcon(settings.get_image('spy')))
+        self.spy_btn.setIcon(get_qicon('spy'))
         self.spy_btn.setFixedSize(80, 20)
         self.spy_btn.setToolTip(_('Spy current host'))
         layout.addWidget(self.spy_btn)
@@ -338,7 +368,7 @@ class HostQWidget(QWidget):
         layout.addWidget(notes_title, 0, 2, 1, 1)
 
         notes_btn = QPushButton()
-        notes_btn.setIcon(QIcon(settings.get_image('edit')))
+        notes_btn.setIcon(get_qicon('edit'))
         notes_btn.setToolTip(_("Edit host notes."))
         notes_btn.setFixedSize(32, 32)
         notes_btn.clicked.connect(self.patch_data)
@@ -356,19 +386,21 @@ class HostQWidget(QWidget):
 
     def show_history(self):
         """
-        Update and show HistoryQWidget
+        Update and show HistoryQWidget, initialized on first display
 
         """
 
+        initialize_once(self.history_widget)
         self.history_widget.update_history_data(self.host_item.name, self.host_history)
         self.history_widget.show()
 
     def show_customs(self):
         """
-        Update and show CustomsQWidget
+        Update and show CustomsQWidget, initialized on first display
 
         """
 
+        initialize_once(self.customs_widget)
         self.customs_widget.update_customs(self.host_item)
         self.customs_widget.show()
 
@@ -389,10 +421,8 @@ class HostQWidget(QWidget):
         patched = app_backend.patch(endpoint, data, headers)
 
         if patched:
-            self.host_item.data[check_type] = state
-            data_manager.update_item_data(
-                self.host_item.item_type, self.host_item.item_id, self.host_item.data
-            )
+            # Item of database is not modified, DataManager replaces it and updates problems
+            data_manager.update_item_data(self.host_item.item_type, self.host_item.item_id, data)
             enabled = _('enabled') if state else _('disabled')
             event_type = 'OK' if state else 'WARN'
             message = _(
@@ -456,20 +486,14 @@ class HostQWidget(QWidget):
             self.set_data(host_item)
 
         if self.host_item or host_item:
-            # Update host services
-            self.refresh_counter += 1
-            if self.refresh_counter > 10:
-                thread_manager.add_high_priority_thread('service', self.host_item.item_id)
-                self.refresh_counter = 0
-
             # Update host
             icon_name = get_overall_state_icon(
                 self.service_items,
                 self.host_item.data['_overall_state_id']
             )
-            icon_pixmap = QPixmap(settings.get_image(icon_name))
+            icon_pixmap = get_qpixmap(icon_name)
 
-            self.labels['host_icon'].setPixmap(QPixmap(icon_pixmap))
+            self.labels['host_icon'].setPixmap(icon_pixmap)
             self.labels['host_icon'].setToolTip(
                 self.host_item.get_overall_tooltip(self.service_items)
             )
@@ -484,9 +508,7 @@ class HostQWidget(QWidget):
                 self.host_item.data['ls_downtimed'],
                 monitored
             )
-            pixmap_icon = QPixmap(settings.get_image(icon_name))
-            final_icon = pixmap_icon.scaled(32, 32, Qt.KeepAspectRatio)
-            self.labels['state_icon'].setPixmap(final_icon)
+            self.labels['state_icon'].setPixmap(get_qpixmap(icon_name, 32))
             self.labels['state_icon'].setToolTip(self.host_item.get_tooltip())
 
             since_last_check = get_diff_since_last_timestamp(
@@ -28,12 +28,13 @@
 from logging import getLogger
 
 from PyQt5.Qt import QLabel, QVBoxLayout, QGridLayout, QLineEdit
-from PyQt5.Qt import QWidget, QDialog, QPushButton, Qt, QIcon
+from PyQt5.Qt import QWidget, QDialog, QPushButton, Qt
 
 from alignak_app import __version__
 from alignak_app.backend.backend import app_backend
 from alignak_app.utils.config import settings
 
+from alignak_app.qobjects.common.labels import get_qicon
 from alignak_app.qobjects.common.widgets import get_logo_widget, center_widget
 from alignak_app.qobjects.login.server import ServerQDialog
 from alignak_app.qobjects.login.proxy import ProxyQDialog
@@ -51,7 +52,7 @@ class LoginQDialog(QDialog):
         self.setWindowTitle('Login to Alignak')
         self.setWindowFlags(Qt.FramelessWindowHint)
         self.setStyleSheet(settings.css_style)
-        self.setWindowIcon(QIcon(settings.get_image('icon')))
+        self.setWindowIcon(get_qicon('icon'))
         self.setObjectName('dialog')
         self.setFixedSize(310, 360)
         # Fields
@@ -100,7 +101,7 @@ class LoginQDialog(QDialog):
         server_btn = QPushButton()
         server_btn.clicked.connect(self.handle_server)
         server_btn.setFixedSize(35, 35)
-        server_btn.setIcon(QIcon(settings.get_image('server_settings')))
+        server_btn.setIcon(get_qicon('server_settings'))
         server_btn.setToolTip(_('Configure Alignak Server'))
         login_layout.addWidget(server_btn, 2, 1, 1, 1)
 
@@ -110,7 +111,7 @@ class LoginQDialog(QDialog):
         login_layout.setAlignment(proxy_lbl, Qt.AlignRight)
 
         proxy_btn = QPushButton()
-        proxy_btn.setIcon(QIcon(settings.get_image('password')))
+        proxy_btn.setIcon(get_qicon('password'))
         proxy_btn.setToolTip(_('Configure your Proxy'))
         proxy_btn.setFixedSize(35, 35)
         proxy_btn.clicked.connect(self.handle_proxy)
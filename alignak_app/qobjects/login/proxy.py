@@ -27,10 +27,11 @@
 
 from logging import getLogger
 
-from PyQt5.Qt import QLineEdit, Qt, QIcon, QLabel, QVBoxLayout, QWidget, QDialog, QPushButton
+from PyQt5.Qt import QLineEdit, Qt, QLabel, QVBoxLayout, QWidget, QDialog, QPushButton
 
 from alignak_app.utils.config import settings
 
+from alignak_app.qobjects.common.labels import get_qicon
 from alignak_app.qobjects.common.widgets import get_logo_widget, center_widget
 from alignak_app.qobjects.common.dialogs import MessageQDialog
 
@@ -47,7 +48,7 @@ class ProxyQDialog(QDialog):
         self.setWindowTitle(_('Proxy Configuration'))
         self.setWindowFlags(Qt.FramelessWindowHint)
         self.setStyleSheet(settings.css_style)
-        self.setWindowIcon(QIcon(settings.get_image('icon')))
+        self.setWindowIcon(get_qicon('icon'))
         self.setObjectName('dialog')
         self.setFixedSize(320, 380)
         # Fields
@@ -33,7 +33,9 @@ from alignak_app.backend.datamanager import data_manager
 from alignak_app.backend.backend import app_backend
 from alignak_app.utils.config import settings
 
+from alignak_app.qobjects.common.widgets import initialize_once
 from alignak_app.qobjects.events.spy import SpyQWidget
+from alignak_app.qobjects.threads.notifier import changes_notifier, RefreshQTimer
 from alignak_app.qobjects.alignak.dashboard import DashboardQWidget
 from alignak_app.qobjects.alignak.problems import ProblemsQWidget
 from alignak_app.qobjects.host.synthesis import SynthesisQWidget
@@ -56,6 +58,7 @@ class PanelQWidget(QWidget):
         self.synthesis_widget = SynthesisQWidget()
         self.problems_widget = ProblemsQWidget()
         self.spy_widget = SpyQWidget()
+        self.problems_timer = RefreshQTimer(self.update_problems_tab)
         self.hostnames_list = []
 
     def initialize(self):
@@ -89,18 +92,17 @@ class PanelQWidget(QWidget):
             self.tab_widget.indexOf(self.synthesis_widget), _('See a synthesis view of a host')
         )
 
-        # Problems
-        self.problems_widget.initialize(self.spy_widget)
+        # Problems, initialized when its tab is displayed. Number of problems is always updated
         self.problems_widget.host_btn.clicked.connect(self.display_host)
         self.problems_widget.problems_table.doubleClicked.connect(self.set_host_from_problems)
-        self.tab_widget.insertTab(
-            tab_order.index('p'),
-            self.problems_widget,
-            _('Problems (%d)') % len(data_manager.get_problems()['problems'])
-        )
+        self.tab_widget.insertTab(tab_order.index('p'), self.problems_widget, '')
         self.tab_widget.setTabToolTip(
             self.tab_widget.indexOf(self.problems_widget), _('See the problems found in backend')
         )
+        self.update_problems_tab()
+        update_problems = int(settings.get_config('Alignak-app', 'update_problems')) * 1000
+        self.problems_timer.setInterval(update_problems)
+        changes_notifier.items_changed.connect(self.data_changed)
 
         # Spied hosts
         self.spy_widget.initialize()
@@ -109,11 +111,47 @@ class PanelQWidget(QWidget):
             self.tab_widget.indexOf(self.spy_widget), _('See spy hosts by Alignak-app')
         )
 
+        self.tab_widget.currentChanged.connect(self.tab_changed)
+        self.tab_changed()
+
         # Hide widget for first display
         self.dashboard_widget.show()
         self.synthesis_widget.host_widget.hide()
         self.synthesis_widget.services_widget.hide()
 
+    def data_changed(self, item_type, changes):  # pylint: disable=unused-argument
+        """
+        Ask to update number of problems when they change
+
+        :param item_type: type of item who changes
+        :type item_type: str
+        :param changes: added, changed and removed items
+        :type changes: dict
+        """
+
+        if item_type == 'problems':
+            self.problems_timer.ask_refresh()
+
+    def update_problems_tab(self):
+        """
+        Update number of problems in title of problems tab
+
+        """
+
+        self.tab_widget.setTabText(
+            self.tab_widget.indexOf(self.problems_widget),
+            _('Problems (%d)') % len(data_manager.database['problems'])
+        )
+
+    def tab_changed(self):
+        """
+        Initialize ProblemsQWidget the first time its tab is displayed
+
+        """
+
+        if self.tab_widget.currentWidget() is self.problems_widget:
+            initialize_once(self.problems_widget, self.spy_widget)
+
     @staticmethod
     def get_tab_order():
         """
@@ -27,15 +27,17 @@
 
 from logging import getLogger
 
-from PyQt5.Qt import QLabel, QWidget, Qt, QPushButton, QPixmap, QVBoxLayout, QGridLayout, QTimer
-from PyQt5.Qt import QScrollArea
+from PyQt5.Qt import QLabel, QWidget, Qt, QPushButton, QVBoxLayout, QGridLayout
+from PyQt5.Qt import QScrollArea, QTimer
 
 from alignak_app.backend.datamanager import data_manager
 from alignak_app.items.item import get_icon_name
 from alignak_app.utils.config import settings
 from alignak_app.utils.time import get_diff_since_last_timestamp, get_date_fromtimestamp
 
+from alignak_app.qobjects.common.labels import get_qpixmap
 from alignak_app.qobjects.common.actions import ActionsQWidget
+from alignak_app.qobjects.threads.notifier import changes_notifier, RefreshQTimer
 
 logger = getLogger(__name__)
 
@@ -49,7 +51,8 @@ class ServiceDataQWidget(QWidget):
         super(ServiceDataQWidget, self).__init__(parent)
         self.setMinimumSize(460, 230)
         # Fields
-        self.refresh_timer = QTimer()
+        self.refresh_timer = RefreshQTimer(self.periodic_refresh)
+        self.since_timer = QTimer()
         self.service_item = None
         self.labels = {
             'service_icon': QLabel(),
@@ -78,8 +81,12 @@ class ServiceDataQWidget(QWidget):
 
         update_service = int(settings.get_config('Alignak-app', 'update_service')) * 1000
         self.refresh_timer.setInterval(update_service)
-        self.refresh_timer.start()
-        self.refresh_timer.timeout.connect(self.periodic_refresh)
+        changes_notifier.items_changed.connect(self.data_changed)
+
+        # Time since last check changes even if service does not
+        self.since_timer.setInterval(60000)
+        self.since_timer.timeout.connect(self.update_since_labels)
+        self.since_timer.start()
 
         self.hide()
 
@@ -189,19 +196,16 @@ class ServiceDataQWidget(QWidget):
             self.service_item.data['ls_downtimed'],
             monitored
         )
-        icon_pixmap = QPixmap(settings.get_image(icon_name))
+        icon_pixmap = get_qpixmap(icon_name)
 
-        self.labels['service_icon'].setPixmap(QPixmap(icon_pixmap))
+        self.labels['service_icon'].setPixmap(icon_pixmap)
         self.labels['service_icon'].setScaledContents(True)
         self.labels['service_icon'].setFixedSize(48, 48)
         self.labels['service_icon'].setToolTip(self.service_item.get_tooltip())
         self.labels['service_name'].setText(self.service_item.get_display_name())
 
-        since_last_check = get_diff_since_last_timestamp(
-            self.service_item.data['ls_last_check']
-        )
+        self.update_since_labels()
         last_check_tooltip = get_date_fromtimestamp(self.service_item.data['ls_last_check'])
-        self.labels['ls_last_check'].setText(since_last_check)
         self.labels['ls_last_check'].setToolTip(last_check_tooltip)
         self.labels['ls_output'].setText(self.service_item.data['ls_output'])
 
@@ -209,9 +213,38 @@ class ServiceDataQWidget(QWidget):
         self.actions_widget.update_widget()
         self.show()
 
+    def update_since_labels(self):
+        """
+        Update labels who display time since last check of current service
+
+        """
+
+        if self.service_item:
+            self.labels['ls_last_check'].setText(
+                get_diff_since_last_timestamp(self.service_item.data['ls_last_check'])
+            )
+
+    def data_changed(self, item_type, changes):
+        """
+        Ask to refresh QWidget when current service changes
+
+        :param item_type: type of item who changes
+        :type item_type: str
+        :param changes: added, changed and removed items
+        :type changes: dict
+        """
+
+        if not self.service_item or 'service' not in item_type:
+            return
+
+        for item in changes['added'] + changes['changed']:
+            if item.item_id == self.service_item.item_id:
+                self.refresh_timer.ask_refresh()
+                break
+
     def periodic_refresh(self):
         """
-        Refresh QWidget periodically
+        Refresh QWidget with last data of current service
 
         """
 
@@ -23,22 +23,28 @@
     Services
     ++++++++
     Services manage creation of QWidget to display the services
+
+    Services of host are grouped by aggregation in QTreeWidget in one pass. Tree items are kept
+    between updates: only items of services who have changed are updated, and tree is only
+    reordered when order of services or their aggregations change.
 """
 
+from collections import OrderedDict
 from logging import getLogger
-from operator import itemgetter
 
-from PyQt5.Qt import QTreeWidget, QTreeWidgetItem, QWidget, QIcon, QGridLayout, QSize, QListWidget
+from PyQt5.Qt import QTreeWidget, QTreeWidgetItem, QWidget, QGridLayout, QSize, QListWidget
 from PyQt5.Qt import Qt, QListWidgetItem
 
 from alignak_app.backend.datamanager import data_manager
 from alignak_app.items.item import get_icon_name
 from alignak_app.utils.config import settings
 
+from alignak_app.qobjects.common.labels import get_qicon
 from alignak_app.qobjects.common.frames import get_frame_separator
 from alignak_app.qobjects.service.tree_item import ServiceTreeItem
 from alignak_app.qobjects.service.services_dashboard import ServicesDashboardQWidget
 from alignak_app.qobjects.service.service import ServiceDataQWidget
+from alignak_app.qobjects.threads.notifier import changes_notifier, RefreshQTimer
 
 logger = getLogger(__name__)
 
@@ -52,10 +58,14 @@ class ServicesQWidget(QWidget):
         super(ServicesQWidget, self).__init__(parent)
         # Fields
         self.services = None
+        self.host_id = None
         self.services_tree_widget = QTreeWidget()
+        self.service_tree_items = {}
+        self.tree_layout = []
         self.services_list_widget = QListWidget()
         self.service_data_widget = ServiceDataQWidget()
         self.services_dashboard = ServicesDashboardQWidget()
+        self.refresh_timer = RefreshQTimer(self.refresh_services)
 
     def initialize(self):
         """
@@ -80,6 +90,7 @@ class ServicesQWidget(QWidget):
         self.services_tree_widget.setIconSize(QSize(32, 32))
         self.services_tree_widget.setAlternatingRowColors(True)
         self.services_tree_widget.header().close()
+        self.services_tree_widget.clicked.connect(self.update_service_data)
         layout.addWidget(self.services_tree_widget, 2, 0, 1, 1)
 
         # Services QListWidget
@@ -91,6 +102,39 @@ class ServicesQWidget(QWidget):
         self.service_data_widget.initialize()
         layout.addWidget(self.service_data_widget, 2, 1, 1, 1)
 
+        update_host = int(settings.get_config('Alignak-app', 'update_host')) * 1000
+        self.refresh_timer.setInterval(update_host)
+        changes_notifier.items_changed.connect(self.data_changed)
+
+    def data_changed(self, item_type, changes):
+        """
+        Ask to refresh services when services of displayed host change
+
+        :param item_type: type of item who changes
+        :type item_type: str
+        :param changes: added, changed and removed items
+        :type changes: dict
+        """
+
+        if not self.host_id or 'service' not in item_type:
+            return
+
+        for item in changes['added'] + changes['changed'] + changes['removed']:
+            if item.data.get('host') == self.host_id:
+                self.refresh_timer.ask_refresh()
+                break
+
+    def refresh_services(self):
+        """
+        Refresh services dashboard and QTreeWidget with services of displayed host
+
+        """
+
+        if self.host_id:
+            self.services = data_manager.get_host_services(self.host_id)
+            self.services_dashboard.update_widget(self.services)
+            self.update_tree(self.services)
+
     def filter_services(self, state):
         """
         Filter services with the wanted state
@@ -149,7 +193,7 @@ class ServicesQWidget(QWidget):
 
         if not services_added:
             not_added_item = QListWidgetItem()
-            not_added_item.setData(Qt.DecorationRole, QIcon(settings.get_image('services_ok')))
+            not_added_item.setData(Qt.DecorationRole, get_qicon('services_ok'))
             not_added_item.setData(Qt.DisplayRole, _('No such services to display...'))
             self.services_list_widget.addItem(not_added_item)
 
@@ -171,7 +215,7 @@ class ServicesQWidget(QWidget):
             filter_item.data['ls_downtimed'],
             monitored
         )
-        item.setData(Qt.DecorationRole, QIcon(settings.get_image(icon_name)))
+        item.setData(Qt.DecorationRole, get_qicon(icon_name))
         item.setData(Qt.DisplayRole, filter_item.get_display_name())
         item.setData(Qt.UserRole, filter_item.item_id)
         item.setToolTip(filter_item.get_tooltip())
@@ -187,54 +231,68 @@ class ServicesQWidget(QWidget):
         """
 
         self.services = services
+        self.host_id = services[0].data['host'] if services else None
 
         # Update services dashboard
         self.services_dashboard.update_widget(self.services)
 
-        # Clear QTreeWidget
-        self.services_tree_widget.clear()
         self.services_tree_widget.setIconSize(QSize(16, 16))
+        self.update_tree(self.services or [])
 
-        if self.services:
-            # Set as "Global" aggregation who are empty
-            for service in self.services:
-                if not service.data['aggregation']:
-                    service.data['aggregation'] = 'Global'
+        if not self.services:
+            # If no services, reset service item to None
+            self.service_data_widget.service_item = None
+        self.service_data_widget.hide()
 
-            # First sort list by state then by aggregation
-            newlist = sorted(
-                self.services,
-                key=lambda s: itemgetter('ls_state', 'ls_acknowledged', 'aggregation')(s.data)
-            )
-            self.services = newlist
+    def update_tree(self, services):
+        """
+        Update QTreeWidget with services grouped by aggregation, sorted by state. Tree items of
+        known services are kept and only updated if their service has changed
 
-            # Get list of aggregations
-            aggregations = []
-            for service in self.services:
-                if service.data['aggregation'] not in aggregations:
-                    aggregations.append(service.data['aggregation'])
-
-            # Add QTreeWidgetItems
-            for aggregation in aggregations:
-                main_tree = QTreeWidgetItem()
-                main_tree.setText(0, aggregation)
-                main_tree.setIcon(0, QIcon(settings.get_image('tree')))
-                main_tree.setToolTip(0, aggregation)
-                for service in self.services:
-                    if service.data['aggregation'] == aggregation:
-                        service_tree = ServiceTreeItem()
-                        service_tree.initialize(service)
-                        service_tree.setToolTip(0, service.get_tooltip())
-                        self.services_tree_widget.clicked.connect(self.update_service_data)
-                        main_tree.addChild(service_tree)
-
-                self.services_tree_widget.addTopLevelItem(main_tree)
-
-            self.service_data_widget.hide()
-        else:
-            # If no services, reset service item to None and hide data widget
-            self.service_data_widget.service_item = None
-            self.service_data_widget.hide()
+        :param services: list of :class:`Services <alignak_app.items.service.Service>` items
+        :type services: list
+        """
+
+        # Group services by aggregation, empty aggregations are set as "Global"
+        groups = OrderedDict()
+        for service in sorted(services, key=get_service_order):
+            groups.setdefault(service.data['aggregation'] or 'Global', []).append(service)
+
+        service_tree_items = {}
+        for service in services:
+            service_tree = self.service_tree_items.get(service.item_id)
+            if not service_tree or service_tree.service_item.data != service.data:
+                service_tree = service_tree or ServiceTreeItem()
+                service_tree.initialize(service)
+                service_tree.setToolTip(0, service.get_tooltip())
+            service_tree_items[service.item_id] = service_tree
+        self.service_tree_items = service_tree_items
+
+        tree_layout = [
+            (aggregation, [service.item_id for service in aggregation_services])
+            for aggregation, aggregation_services in groups.items()
+        ]
+        if tree_layout == self.tree_layout:
+            return
+        self.tree_layout = tree_layout
+
+        # Order has changed: put tree items in new aggregations, expanded ones stay expanded
+        expanded_aggregations = set()
+        for index in range(self.services_tree_widget.topLevelItemCount()):
+            main_tree = self.services_tree_widget.topLevelItem(index)
+            if main_tree.isExpanded():
+                expanded_aggregations.add(main_tree.text(0))
+            main_tree.takeChildren()
+        self.services_tree_widget.clear()
+
+        for aggregation, services_ids in tree_layout:
+            main_tree = QTreeWidgetItem()
+            main_tree.setText(0, aggregation)
+            main_tree.setIcon(0, get_qicon('tree'))
+            main_tree.setToolTip(0, aggregation)
+            main_tree.addChildren([service_tree_items[service_id] for service_id in services_ids])
+            self.services_tree_widget.addTopLevelItem(main_tree)
+            main_tree.setExpanded(aggregation in expanded_aggregations)
 
     def update_service_data(self):  # pragma: no cover
         """
@@ -276,6 +334,23 @@ class ServicesQWidget(QWidget):
                     monitored
                 )
 
-                service_item.setData(Qt.DecorationRole, QIcon(settings.get_image(icon_name)))
+                service_item.setData(Qt.DecorationRole, get_qicon(icon_name))
                 service_item.setData(Qt.DisplayRole, service.get_display_name())
                 service_item.setToolTip(service.get_tooltip())
+
+
+def get_service_order(service):
+    """
+    Return order of service in QTreeWidget: by state, acknowledge then aggregation
+
+    :param service: service item
+    :type service: alignak_app.items.service.Service
+    :return: state, acknowledge and aggregation of service
+    :rtype: tuple
+    """
+
+    return (
+        service.data['ls_state'],
+        service.data['ls_acknowledged'],
+        service.data['aggregation'] or 'Global'
+    )
@@ -27,11 +27,12 @@
 
 from logging import getLogger
 
-from PyQt5.Qt import QLabel, QWidget, Qt, QPixmap, QHBoxLayout, QPushButton, QIcon
+from PyQt5.Qt import QLabel, QWidget, Qt, QHBoxLayout, QPushButton
 
 from alignak_app.items.item import get_icon_name_from_state
 from alignak_app.items.service import Service
-from alignak_app.utils.config import settings
+
+from alignak_app.qobjects.common.labels import get_qicon
 
 logger = getLogger(__name__)
 
@@ -85,7 +86,7 @@ class ServicesDashboardQWidget(QWidget):
 
         for icon in Service.get_available_icons():
             state = icon.replace('services_', '').upper()
-            icon_pixmap = QIcon(settings.get_image(icon))
+            icon_pixmap = get_qicon(icon)
             self.states_btns[state].setIcon(icon_pixmap)
             self.states_btns[state].setFixedSize(20, 20)
             self.states_btns[state].setToolTip(state)
@@ -27,11 +27,12 @@
 
 from logging import getLogger
 
-from PyQt5.Qt import QIcon, QTreeWidgetItem
+from PyQt5.Qt import QTreeWidgetItem
 
 from alignak_app.backend.datamanager import data_manager
 from alignak_app.items.item import get_icon_name
-from alignak_app.utils.config import settings
+
+from alignak_app.qobjects.common.labels import get_qicon
 
 logger = getLogger(__name__)
 
@@ -68,7 +69,7 @@ class ServiceTreeItem(QTreeWidgetItem):  # pylint: disable=too-few-public-method
             monitored
         )
 
-        self.setIcon(0, QIcon(settings.get_image(icon_name)))
+        self.setIcon(0, get_qicon(icon_name))
 
     def update_item(self):
         """
@@ -89,7 +90,7 @@ class ServiceTreeItem(QTreeWidgetItem):  # pylint: disable=too-few-public-method
         )
 
         self.setData(0, 0, service.get_display_name())
-        self.setData(0, 1, QIcon(settings.get_image(icon_name)))
+        self.setData(0, 1, get_qicon(icon_name))
 
         self.service_item = service
 
@@ -29,16 +29,21 @@ import sys
 
 from logging import getLogger
 
-from PyQt5.Qt import QMenu, QSystemTrayIcon, QTimer, QAction, QIcon
+from PyQt5.Qt import QMenu, QSystemTrayIcon, QTimer, QAction
 
 from alignak_app.utils.config import settings, open_url
 from alignak_app.backend.backend import app_backend
+from alignak_app.backend.datamanager import data_manager
+from alignak_app.backend.storage import local_storage
 
+from alignak_app.qobjects.common.labels import get_qicon, clear_images_cache
 from alignak_app.qobjects.app_main import AppQMainWindow
 from alignak_app.qobjects.about import AboutQDialog
+from alignak_app.qobjects.common.widgets import initialize_once
 from alignak_app.qobjects.events.events import send_event
 
 from alignak_app.qobjects.threads.threadmanager import thread_manager
+from alignak_app.qobjects.threads.notifier import changes_notifier
 
 
 logger = getLogger(__name__)
@@ -89,6 +94,11 @@ class AppTrayIcon(QSystemTrayIcon):
         self.setContextMenu(self.menu)
         self.refresh_menus()
 
+        # AppQMainWindow is built after TrayIcon is displayed
+        display = settings.get_config('Alignak-app', 'display')
+        if 'min' in display or 'max' in display:
+            QTimer.singleShot(0, self.show_app_main)
+
     def check_connection(self):
         """
         Check periodically connection to Alignak backend
@@ -118,22 +128,30 @@ class AppTrayIcon(QSystemTrayIcon):
 
         """
 
-        self.app_main.initialize()
-
-        self.tray_actions['app'].setIcon(QIcon(settings.get_image('icon')))
+        self.tray_actions['app'].setIcon(get_qicon('icon'))
         self.tray_actions['app'].setText(_('Alignak-App'))
         self.tray_actions['app'].setToolTip(_('Display Alignak-App'))
-        self.tray_actions['app'].triggered.connect(self.app_main.show)
+        self.tray_actions['app'].triggered.connect(self.show_app_main)
 
         self.menu.addAction(self.tray_actions['app'])
 
+    def show_app_main(self):
+        """
+        Show AppQMainWindow, initialized on first display
+
+        """
+
+        initialize_once(self.app_main)
+        if not self.app_main.isVisible():
+            self.app_main.show()
+
     def add_webui_menu(self):
         """
         Create and add to menu "webui" QAction
 
         """
 
-        self.tray_actions['webui'].setIcon(QIcon(settings.get_image('web')))
+        self.tray_actions['webui'].setIcon(get_qicon('web'))
         self.tray_actions['webui'].setText(_('Go to WebUI'))
         self.tray_actions['webui'].setToolTip(_('Go to Alignak WebUI'))
         self.tray_actions['webui'].triggered.connect(
@@ -159,7 +177,7 @@ class AppTrayIcon(QSystemTrayIcon):
 
         """
 
-        self.tray_actions['reload'].setIcon(QIcon(settings.get_image('refresh')))
+        self.tray_actions['reload'].setIcon(get_qicon('refresh'))
         self.tray_actions['reload'].setText(_('Reload configuration'))
         self.tray_actions['reload'].setToolTip(_('Reload configuration'))
         self.tray_actions['reload'].triggered.connect(self.reload_configuration)
@@ -172,22 +190,29 @@ class AppTrayIcon(QSystemTrayIcon):
 
         """
 
-        self.app_about.initialize()
-
-        self.tray_actions['about'].setIcon(QIcon(settings.get_image('about')))
+        self.tray_actions['about'].setIcon(get_qicon('about'))
         self.tray_actions['about'].setText(_('About...'))
         self.tray_actions['about'].setToolTip(_('About Alignak-app'))
-        self.tray_actions['about'].triggered.connect(self.app_about.show_about)
+        self.tray_actions['about'].triggered.connect(self.show_about)
 
         self.menu.addAction(self.tray_actions['about'])
 
+    def show_about(self):
+        """
+        Show AboutQDialog, initialized on first display
+
+        """
+
+        initialize_once(self.app_about)
+        self.app_about.show_about()
+
     def add_quit_menu(self):
         """
         Create and add to menu "exit" QAction
 
         """
 
-        self.tray_actions['exit'].setIcon(QIcon(settings.get_image('exit')))
+        self.tray_actions['exit'].setIcon(get_qicon('exit'))
         self.tray_actions['exit'].setText(_('Quit'))
         self.tray_actions['exit'].setToolTip(_('Quit Alignak-app'))
         self.tray_actions['exit'].triggered.connect(self.quit_app)
@@ -202,6 +227,9 @@ class AppTrayIcon(QSystemTrayIcon):
         """
 
         thread_manager.stop_threads()
+        thread_manager.wait_threads()
+        changes_notifier.stop()
+        local_storage.save(data_manager.snapshot(), app_backend.get_owner())
         logger.info('----- Alignak-App STOP -----')
         sys.exit(0)
 
@@ -215,5 +243,6 @@ class AppTrayIcon(QSystemTrayIcon):
         logger.info('Reload configuration...')
         settings.init_config()
         settings.init_css()
+        clear_images_cache()
 
         send_event('INFO', _('Configuration reloaded'), timer=True)
@@ -0,0 +1,178 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2015-2018:
+#   Matthieu Estrada, ttamalfor@gmail.com
+#
+# This file is part of (AlignakApp).
+#
+# (AlignakApp) is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# (AlignakApp) is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with (AlignakApp).  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+    Notifier
+    ++++++++
+    Notifier send changes of :class:`DataManager <alignak_app.backend.datamanager.DataManager>`
+    to QWidgets, with the ``items_changed`` signal:
+
+    * changes published by BackendQWorkers are received in the GUI thread
+    * changes received in a short time are merged and sent once for each item type
+    * signal gives item type and a dict with ``added``, ``changed`` and ``removed`` items
+
+    Progress of DataManager filling is sent with the ``progress_changed`` signal, to know when it's
+    ready.
+
+    QWidgets use a :class:`RefreshQTimer <alignak_app.qobjects.threads.notifier.RefreshQTimer>` to
+    refresh themselves only when their data changes, at most once by interval.
+"""
+
+from collections import OrderedDict
+from logging import getLogger
+
+from PyQt5.Qt import QObject, QTimer, pyqtSignal
+
+from alignak_app.backend.datamanager import data_manager
+from alignak_app.backend.itemstore import Changes
+
+logger = getLogger(__name__)
+
+
+class ChangesQNotifier(QObject):
+    """
+        Class who send changes of DataManager to QWidgets
+    """
+
+    items_changed = pyqtSignal(str, object, name='items_changed')
+    changes_received = pyqtSignal(str, object, name='changes_received')
+    progress_changed = pyqtSignal(name='progress_changed')
+
+    def __init__(self, parent=None):
+        super(ChangesQNotifier, self).__init__(parent)
+        self.pending_changes = OrderedDict()
+        self.flush_timer = QTimer(self)
+        self.flush_timer.setSingleShot(True)
+        self.flush_timer.setInterval(200)
+        self.flush_timer.timeout.connect(self.flush_changes)
+        # Signal is queued when emitted by another thread
+        self.changes_received.connect(self.add_changes)
+
+    def start(self):
+        """
+        Start to listen changes of DataManager
+
+        """
+
+        data_manager.add_listener(self.receive_changes)
+        data_manager.add_progress_listener(self.receive_progress)
+
+    def stop(self):
+        """
+        Stop to listen changes of DataManager
+
+        """
+
+        data_manager.remove_listener(self.receive_changes)
+        data_manager.remove_progress_listener(self.receive_progress)
+        self.flush_timer.stop()
+        self.pending_changes.clear()
+
+    def receive_changes(self, item_type, changes):
+        """
+        Receive changes from DataManager, can be called by any thread
+
+        :param item_type: type of item
+        :type item_type: str
+        :param changes: changes of item type
+        :type changes: alignak_app.backend.itemstore.Changes
+        """
+
+        self.changes_received.emit(item_type, changes)
+
+    def receive_progress(self):
+        """
+        Receive progress of DataManager, can be called by any thread
+
+        """
+
+        self.progress_changed.emit()
+
+    def add_changes(self, item_type, changes):
+        """
+        Merge changes with pending changes of item type, they will be sent by flush_changes()
+
+        :param item_type: type of item
+        :type item_type: str
+        :param changes: changes of item type
+        :type changes: alignak_app.backend.itemstore.Changes
+        """
+
+        if item_type not in self.pending_changes:
+            self.pending_changes[item_type] = Changes()
+        self.pending_changes[item_type].merge(changes)
+
+        if not self.flush_timer.isActive():
+            self.flush_timer.start()
+
+    def flush_changes(self):
+        """
+        Emit "items_changed" for each item type who have pending changes
+
+        """
+
+        pending_changes = self.pending_changes
+        self.pending_changes = OrderedDict()
+
+        for item_type, changes in pending_changes.items():
+            if changes:
+                logger.debug('Send changes of [%s]: %s', item_type, changes)
+                self.items_changed.emit(item_type, changes.as_dict())
+
+
+class RefreshQTimer(QTimer):
+    """
+        Class who call a refresh function when it's asked, at most once by interval. Refresh asked
+        during interval is done at its end.
+    """
+
+    def __init__(self, refresh_function, parent=None):
+        super(RefreshQTimer, self).__init__(parent)
+        self.refresh_function = refresh_function
+        self.pending = False
+        self.setSingleShot(True)
+        self.timeout.connect(self.refresh_pending)
+
+    def ask_refresh(self):
+        """
+        Refresh now if interval is over, else at the end of interval
+
+        """
+
+        if self.isActive():
+            self.pending = True
+        else:
+            self.refresh_function()
+            self.start()
+
+    def refresh_pending(self):
+        """
+        Refresh if it has been asked during interval
+
+        """
+
+        if self.pending:
+            self.pending = False
+            self.refresh_function()
+            self.start()
+
+
+changes_notifier = ChangesQNotifier()
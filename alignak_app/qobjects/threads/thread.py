@@ -22,63 +22,55 @@
 """
     Backend Thread
     ++++++++++++++
-    Backend Thread manage creation of QThreads for backend requests
+    Backend Thread manage creation of QThreads for backend requests: BackendQWorker send requests
+    of :class:`ThreadManager <alignak_app.qobjects.threads.threadmanager.ThreadManager>` queue,
+    one after another, until it's stopped
 """
 
+import time
+
 from logging import getLogger
 
 from PyQt5.Qt import QThread
 
 from alignak_app.backend.backend import app_backend
+from alignak_app.backend.fetcher import fetcher
 
 logger = getLogger(__name__)
 
 
-class BackendQThread(QThread):  # pylint: disable=too-few-public-methods
+class BackendQWorker(QThread):
     """
-        Class who create a QThread to trigger requests
+        Class who create a QThread who send requests of ThreadManager queue
     """
 
-    problem_states = ['CRITICAL', 'WARNING', 'UNKNOWN']
-
-    def __init__(self, name, data=None):
-        super(BackendQThread, self).__init__()
-        self.name = name
-        self.data = data
+    def __init__(self, manager):
+        super(BackendQWorker, self).__init__()
+        self.manager = manager
+        self.queue = manager.queue
+        self.busy_time = 0.0
 
-    def run(self):  # pragma: no cover
+    def run(self):
         """
-        Run the QThread. Trigger actions depending on the selected name
+        Run the QThread. Send next request of queue until a stop request is received
 
         """
 
-        if app_backend.connected:
-            logger.debug('Launch a new thread request for backend: %s', self.name)
-            if 'user' in self.name:
-                app_backend.query_user()
-            elif 'host' in self.name:
-                app_backend.query_hosts()
-            elif 'service' in self.name:
-                app_backend.query_services(self.data)
-            elif self.name in self.problem_states:
-                app_backend.query_services_problems(self.name)
-            elif 'alignakdaemon' in self.name:
-                app_backend.query_alignakdaemons()
-            elif 'livesynthesis' in self.name:
-                app_backend.query_livesynthesis()
-            elif 'realm' in self.name:
-                app_backend.query_realms()
-            elif 'timeperiod' in self.name:
-                app_backend.query_timeperiods()
-            elif self.name == 'history':
-                if self.data:
-                    app_backend.query_history(self.data['hostname'], self.data['host_id'])
+        while True:
+            request = self.manager.next_request(self.queue)
+            if request is None:
+                break
+
+            name, data = request
+            start = time.time()
+            changes = {}
+            try:
+                if app_backend.connected:
+                    changes = fetcher.query(name, data)
                 else:
-                    app_backend.query_history()
-            elif 'notifications' in self.name:
-                app_backend.query_notifications()
-            else:
-                logger.error("Thread is unknown: %s", self.name)
-        else:
-            logger.warning('The app is offline, the threads can not be launched !')
-            self.quit()
+                    logger.warning('The app is offline, request %s is not sent !', name)
+            except Exception as e:  # pylint: disable=broad-except
+                logger.exception('Request %s has failed: %s', name, e)
+            finally:
+                self.busy_time += time.time() - start
+                self.manager.request_done(request, changes)
@@ -22,25 +22,41 @@
 """
     Thread Manager
     ++++++++++++++
-    Thread Manager manage BackendQThreads creations and their priority:
-
-    * low : threads that group the queries about the elements that change little
-    * normal: threads that group the queries on items that change often
-    * high: threads that group the queries made on the fly
+    Thread Manager send requests on backend with a pool of :class:`BackendQWorkers
+    <alignak_app.qobjects.threads.thread.BackendQWorker>`, who take them from a priority queue:
+
+    * low : requests about the elements that change little
+    * normal: requests on items that change often
+    * high: requests made on the fly by QWidgets
+
+    Workers are created once, ``fetch_workers`` workers are started. A request already queued or
+    running is not queued again, and requests are never dropped: they wait in queue. Stopped
+    workers are not waited by GUI: they are kept until their ``finished`` signal.
+    Low and normal requests are queued when they are due, see
+    :class:`PollingScheduler <alignak_app.backend.scheduler.PollingScheduler>`.
 """
 
+import json
+import time
+
+from itertools import count
 from logging import getLogger
+from queue import PriorityQueue
+from threading import Lock
 
-from PyQt5.Qt import QObject
+from PyQt5.Qt import QObject, pyqtSlot
 
-from alignak_app.qobjects.threads.thread import BackendQThread
+from alignak_app.backend.backend import app_backend
+from alignak_app.backend.scheduler import PollingScheduler
+from alignak_app.qobjects.threads.thread import BackendQWorker
+from alignak_app.utils.config import settings
 
 logger = getLogger(__name__)
 
 
 class ThreadManager(QObject):
     """
-        Class who create BackendQThreads periodically, to request on Alignak Backend endpoints
+        Class who queue requests periodically, to request on Alignak Backend endpoints
     """
 
     thread_names = {
@@ -48,77 +64,169 @@ class ThreadManager(QObject):
         'normal': ['host', 'alignakdaemon', 'livesynthesis', 'CRITICAL', 'WARNING', 'UNKNOWN']
     }
 
+    priorities = {
+        'high': 0,
+        'normal': 1,
+        'low': 2
+    }
+
     def __init__(self, parent=None):
         super(ThreadManager, self).__init__(parent)
-        self.threads_to_launch = {'low': [], 'normal': []}
-        self.launched_threads = {'low': [], 'normal': []}
-        self.high_threads = []
+        self.queue = PriorityQueue()
+        self.lock = Lock()
+        self.counter = count()
+        self.queued = {}
+        self.running = set()
+        self.workers = []
+        self.stopping = []
+        self.scheduler = PollingScheduler()
+        self.metrics_time = time.time()
+        self.metrics_busy_time = 0.0
+
+    @staticmethod
+    def get_key(name, data=None):
+        """
+        Return key of request, requests with same key are the same
+
+        :param name: name of request
+        :type name: str
+        :param data: data of request
+        :type data: str|dict
+        :return: key of request
+        :rtype: tuple
+        """
 
-    def fill_threads(self, thread_type):
+        return name, json.dumps(data, sort_keys=True)
+
+    def start_workers(self):
         """
-        Fill threads to launch for a specific thread type
+        Start the "fetch_workers" workers who send requests, if they are not started
 
-        :param thread_type: type of thread to fill
-        :type thread_type: str
         """
 
-        for t_name in self.thread_names[thread_type]:
-            if not self.is_launched(thread_type, t_name):
-                self.threads_to_launch[thread_type].append(t_name)
+        if self.workers:
+            return
 
-    def is_launched(self, thread_type, thread_name):
-        """
-        Returns if the thread name is already in the started threads type
+        self.scheduler.start()
 
-        :param thread_type: type of thread
-        :type thread_type: str
-        :param thread_name: name of thread
-        :type thread_name: str
-        :return: if thread is launched or not
+        workers_number = max(1, int(settings.get_config('Alignak', 'fetch_workers')))
+        for _ in range(workers_number):
+            worker = BackendQWorker(self)
+            worker.start()
+            self.workers.append(worker)
+
+        self.metrics_time = time.time()
+        self.metrics_busy_time = 0.0
+        logger.debug('%d workers started', workers_number)
+
+    def add_request(self, name, data=None, priority='normal'):
+        """
+        Add a request in queue. A request already running or queued with same or higher
+        priority is not added again
+
+        :param name: name of request
+        :type name: str
+        :param data: data of request
+        :type data: str|dict
+        :param priority: priority of request: high | normal | low
+        :type priority: str
+        :return: if request has been added
         :rtype: bool
         """
 
-        for thread in self.launched_threads[thread_type]:
-            if thread.name == thread_name:
-                return True
+        key = self.get_key(name, data)
+        priority = self.priorities[priority]
+
+        with self.lock:
+            if key in self.running:
+                return False
+            if key in self.queued and self.queued[key] <= priority:
+                return False
+            # Entry with a lower priority stays in queue, but it will be ignored
+            self.queued[key] = priority
+            self.queue.put((priority, next(self.counter), name, data))
 
-        return False
+        return True
 
-    def launch_threads(self, thread_type=None):  # pragma: no cover
+    def next_request(self, queue=None):
         """
-        Launch the next thread of the given type or launch all the next threads for each type
+        Return next request of queue, wait until there is one. Return None when workers are
+        stopped
+
+        :param queue: queue of worker, current queue if None
+        :type queue: PriorityQueue
+        :return: name and data of request, or None
+        :rtype: tuple
+        """
+
+        if queue is None:
+            queue = self.queue
 
-        :param thread_type: type of thread to launch
-        :type thread_type: str
+        while True:
+            priority, _, name, data = queue.get()
+            if name is None:
+                return None
+
+            key = self.get_key(name, data)
+            with self.lock:
+                if self.queued.get(key) != priority:
+                    # Request has been queued again with higher priority, or removed
+                    continue
+                del self.queued[key]
+                self.running.add(key)
+
+            return name, data
+
+    def request_done(self, request, changes=None):
         """
+        Mark request as done, it can be queued again
 
-        if thread_type:
-            if not self.threads_to_launch[thread_type]:
-                self.fill_threads(thread_type)
-            else:
-                thread_name = self.threads_to_launch[thread_type].pop(0)
-                thread = BackendQThread(thread_name)
-                thread.start()
+        :param request: name and data of request
+        :type request: tuple
+        :param changes: number of items changed by request, for each item type
+        :type changes: dict
+        """
 
-                self.launched_threads[thread_type].append(
-                    thread
+        with self.lock:
+            self.running.discard(self.get_key(*request))
+            name, data = request
+            if data is None and name in self.scheduler.item_types:
+                self.scheduler.request_done(
+                    name, self.scheduler.get_changed(name, changes or {})
                 )
-        else:
-            for t_type in self.threads_to_launch:
-                if not self.threads_to_launch[t_type]:
-                    self.fill_threads(t_type)
-                else:
-                    thread_name = self.threads_to_launch[t_type].pop(0)
-                    thread = BackendQThread(thread_name)
-                    thread.start()
-
-                    self.launched_threads[t_type].append(
-                        thread
-                    )
+
+    def launch_threads(self):
+        """
+        Queue low and normal requests who are due
+
+        """
+
+        self.start_workers()
+
+        with self.lock:
+            due_requests = self.scheduler.get_due_requests()
+            for thread_name in due_requests:
+                self.scheduler.request_started(thread_name)
+
+        for thread_name in due_requests:
+            priority = 'low' if thread_name in self.thread_names['low'] else 'normal'
+            self.add_request(thread_name, priority=priority)
+
+        if due_requests:
+            logger.debug('Requests: %s', self.get_metrics())
+
+    def launch_all_threads(self):
+        """
+        Start workers and queue all low and normal requests. First requests share the workers
+        with others, normal requests are sent first
+
+        """
+
+        self.launch_threads()
 
     def add_high_priority_thread(self, thread_name, data):
         """
-        Launch a thread with higher priority (doesn't wait launch_threads() function)
+        Queue a request with high priority, it will be sent before others
 
         :param thread_name: name of priority thread
         :type thread_name: str
@@ -126,64 +234,94 @@ class ThreadManager(QObject):
         :type data: dict
         """
 
-        if len(self.high_threads) < 3:
-            backend_thread = BackendQThread(thread_name, data)
-            backend_thread.start()
+        self.start_workers()
 
-            self.high_threads.append(backend_thread)
-        else:
-            logger.debug('Too many priority threads for the moment...')
+        if not self.add_request(thread_name, data, 'high'):
+            logger.debug('Request %s is already queued', thread_name)
 
-    def clean_threads(self):  # pragma: no cover
+    def get_metrics(self):
         """
-        Clean current BackendQThreads
+        Return number of queued requests by priority, number of running requests, and
+        percentage of time workers have spent on requests since last call
 
+        :return: metrics of requests
+        :rtype: dict
         """
 
-        for t_thread in self.launched_threads:
-            for thread in self.launched_threads[t_thread]:
-                if thread.isFinished():
-                    logger.debug('Quit %s thread: %s', t_thread, thread.name)
-                    thread.quit()
-                    self.launched_threads[t_thread].remove(thread)
-
-        if self.high_threads:
-            for thread in self.high_threads:
-                if thread.isFinished():
-                    thread.quit()
-                    self.high_threads.remove(thread)
-                    logger.debug('Remove finished thread: %s', thread.name)
+        with self.lock:
+            queued = {priority: 0 for priority in self.priorities}
+            priority_names = {value: name for name, value in self.priorities.items()}
+            for priority in self.queued.values():
+                queued[priority_names[priority]] += 1
+            running = len(self.running)
+
+        now = time.time()
+        busy_time = sum(worker.busy_time for worker in self.workers)
+        available_time = (now - self.metrics_time) * len(self.workers)
+        utilisation = 0
+        if available_time > 0:
+            utilisation = min(100, int(100 * (busy_time - self.metrics_busy_time) / available_time))
+        self.metrics_time = now
+        self.metrics_busy_time = busy_time
+
+        return {
+            'queued': queued,
+            'running': running,
+            'workers': len(self.workers),
+            'utilisation': utilisation,
+        }
 
     def stop_threads(self):
         """
-        Stop all running BackendQThreads
+        Remove queued requests, ask workers to stop and close connections of Web Service. Running
+        requests are not interrupted and not waited: workers are kept until they are finished.
+        New workers use a new queue, so they don't receive stop requests of previous ones
 
         """
 
-        if not self.high_threads and not self.launched_threads['low'] and \
-                not self.launched_threads['normal']:
+        with self.lock:
+            self.queued.clear()
+            queue = self.queue
+            self.queue = PriorityQueue()
+
+        if not self.workers:
             logger.debug('No thread to stop.')
 
-        for t_thread in self.launched_threads:
-            for thread in self.launched_threads[t_thread]:
-                logger.debug('Quit %s thread: %s', t_thread, thread.name)
-                thread.quit()
-                self.launched_threads[t_thread].remove(thread)
+        for worker in self.workers:
+            worker.finished.connect(self.remove_stopped_workers)
+            self.stopping.append(worker)
+            queue.put((-1, next(self.counter), None, None))
+        self.workers = []
+
+        app_backend.ws_client.close()
 
-        if self.high_threads:
-            self.stop_high_priority_threads()
+    @pyqtSlot()
+    def remove_stopped_workers(self):
+        """
+        Forget stopped workers who are finished
 
-    def stop_high_priority_threads(self):
         """
-        Stop threads with high priority
 
+        with self.lock:
+            self.stopping = [worker for worker in self.stopping if not worker.isFinished()]
+
+    def wait_threads(self, timeout=5000):
+        """
+        Wait for stopped workers, only when App quits
+
+        :param timeout: maximum time to wait for all workers, in milliseconds
+        :type timeout: int
+        :return: if all workers are finished
+        :rtype: bool
         """
 
-        for thread in self.high_threads:
-            logger.debug('Quit priority thread: %s', thread.name)
-            thread.quit()
+        end_time = time.time() + timeout / 1000.0
+        for worker in list(self.stopping):
+            if not worker.wait(max(0, int((end_time - time.time()) * 1000))):
+                logger.warning('A worker is still running a request after %dms', timeout)
+        self.remove_stopped_workers()
 
-            self.high_threads.remove(thread)
+        return not self.stopping
 
 
 thread_manager = ThreadManager()
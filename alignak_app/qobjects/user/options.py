@@ -27,11 +27,11 @@
 
 from logging import getLogger
 
-from PyQt5.Qt import QGridLayout, QLabel, QWidget, Qt, QDialog, QVBoxLayout, QPushButton, QIcon
+from PyQt5.Qt import QGridLayout, QLabel, QWidget, Qt, QDialog, QVBoxLayout, QPushButton
 
 from alignak_app.utils.config import settings
 
-from alignak_app.qobjects.common.labels import get_icon_pixmap
+from alignak_app.qobjects.common.labels import get_icon_pixmap, get_qicon
 from alignak_app.qobjects.common.widgets import get_logo_widget, center_widget
 
 logger = getLogger(__name__)
@@ -51,7 +51,7 @@ class UserOptionsQDialog(QDialog):
         super(UserOptionsQDialog, self).__init__(parent)
         self.setWindowFlags(Qt.FramelessWindowHint)
         self.setStyleSheet(settings.css_style)
-        self.setWindowIcon(QIcon(settings.get_image('icon')))
+        self.setWindowIcon(get_qicon('icon'))
         self.setFixedSize(350, 300)
         self.setObjectName('dialog')
         # Fields
@@ -27,10 +27,11 @@
 
 from logging import getLogger
 
-from PyQt5.Qt import QLineEdit, Qt, QIcon, QLabel, QWidget, QDialog, QPushButton, QVBoxLayout
+from PyQt5.Qt import QLineEdit, Qt, QLabel, QWidget, QDialog, QPushButton, QVBoxLayout
 
 from alignak_app.utils.config import settings
 
+from alignak_app.qobjects.common.labels import get_qicon
 from alignak_app.qobjects.common.widgets import center_widget, get_logo_widget
 
 logger = getLogger(__name__)
@@ -46,7 +47,7 @@ class PasswordQDialog(QDialog):
         self.setWindowTitle('User Password')
         self.setWindowFlags(Qt.FramelessWindowHint)
         self.setStyleSheet(settings.css_style)
-        self.setWindowIcon(QIcon(settings.get_image('icon')))
+        self.setWindowIcon(get_qicon('icon'))
         self.setObjectName('dialog')
         self.setFixedSize(300, 300)
         # Fields
@@ -27,7 +27,7 @@
 
 from logging import getLogger
 
-from PyQt5.Qt import QGridLayout, QIcon, Qt, QLabel, QWidget, QPushButton, QScrollArea, QVBoxLayout
+from PyQt5.Qt import QGridLayout, Qt, QLabel, QWidget, QPushButton, QScrollArea, QVBoxLayout
 from PyQt5.Qt import QStyleOption, QStyle, QPainter
 
 from alignak_app.backend.backend import app_backend
@@ -35,7 +35,7 @@ from alignak_app.backend.datamanager import data_manager
 from alignak_app.utils.config import settings
 
 from alignak_app.qobjects.common.widgets import get_logo_widget, center_widget
-from alignak_app.qobjects.common.labels import get_icon_pixmap
+from alignak_app.qobjects.common.labels import get_icon_pixmap, get_qicon
 from alignak_app.qobjects.common.buttons import ToggleQWidgetButton
 from alignak_app.qobjects.common.dialogs import MessageQDialog, EditQDialog, ValidatorQDialog
 
@@ -158,7 +158,7 @@ class ProfileQWidget(QWidget):
         # Password
         info_layout.addWidget(title_labels['password'], 4, 0, 1, 1)
         password_btn = QPushButton()
-        password_btn.setIcon(QIcon(settings.get_image('password')))
+        password_btn.setIcon(get_qicon('password'))
         password_btn.setToolTip(_('Change my password'))
         password_btn.setFixedSize(32, 32)
         password_btn.clicked.connect(lambda: self.patch_data('password'))
@@ -166,7 +166,7 @@ class ProfileQWidget(QWidget):
 
         # Token (only for administrators)
         info_layout.addWidget(title_labels['token'], 4, 2, 1, 1)
-        self.token_btn.setIcon(QIcon(settings.get_image('token')))
+        self.token_btn.setIcon(get_qicon('token'))
         self.token_btn.setFixedSize(32, 32)
         self.token_btn.clicked.connect(self.show_token_dialog)
         info_layout.addWidget(self.token_btn, 4, 3, 1, 1)
@@ -190,7 +190,7 @@ class ProfileQWidget(QWidget):
         notes_layout.addWidget(notes_label, 0, 0, 1, 1)
 
         notes_btn = QPushButton()
-        notes_btn.setIcon(QIcon(settings.get_image('edit')))
+        notes_btn.setIcon(get_qicon('edit'))
         notes_btn.setToolTip(_("Edit your notes."))
         notes_btn.setFixedSize(32, 32)
         notes_btn.clicked.connect(lambda: self.patch_data('notes'))
@@ -214,7 +214,7 @@ class ProfileQWidget(QWidget):
         notes_layout.addWidget(self.labels['email'], 2, 1, 1, 1)
 
         mail_btn = QPushButton()
-        mail_btn.setIcon(QIcon(settings.get_image('edit')))
+        mail_btn.setIcon(get_qicon('edit'))
         mail_btn.setFixedSize(32, 32)
         mail_btn.clicked.connect(lambda: self.patch_data('email'))
         notes_layout.addWidget(mail_btn, 2, 2, 1, 1)
@@ -275,7 +275,9 @@ class ProfileQWidget(QWidget):
                 patched = app_backend.patch(endpoint, data, headers)
 
                 if patched:
-                    data_manager.database['user'].update_data(patch_type, text)
+                    data_manager.update_database(
+                        'user', data_manager.database['user'].update_data(patch_type, text)
+                    )
                     self.labels[patch_type].setText(text)
                     send_event('INFO', _("Your %s have been edited.") % patch_type)
                 else:
@@ -369,7 +371,7 @@ class ProfileQWidget(QWidget):
         host_notif_layout.addWidget(self.labels['host_notification_period'], 2, 1, 1, 1)
 
         option_btn = QPushButton()
-        option_btn.setIcon(QIcon(settings.get_image('options')))
+        option_btn.setIcon(get_qicon('options'))
         option_btn.setFixedSize(64, 32)
         option_btn.clicked.connect(lambda: show_options_dialog(
             'host',
@@ -422,7 +424,7 @@ class ProfileQWidget(QWidget):
         svc_notif_layout.addWidget(self.labels['service_notification_period'], 2, 1, 1, 1)
 
         option_btn = QPushButton()
-        option_btn.setIcon(QIcon(settings.get_image('options')))
+        option_btn.setIcon(get_qicon('options'))
         option_btn.setFixedSize(64, 32)
         option_btn.clicked.connect(lambda: show_options_dialog(
             'service',
@@ -453,7 +455,10 @@ class ProfileQWidget(QWidget):
         patched = app_backend.patch(endpoint, data, headers)
 
         if patched:
-            data_manager.database['user'].update_data(notification_type, notification_enabled)
+            user = data_manager.database['user']
+            data_manager.update_database(
+                'user', user.update_data(notification_type, notification_enabled)
+            )
             enabled = _('enabled') if notification_enabled else _('disabled')
             event_type = 'OK' if notification_enabled else 'WARN'
             message = _("Notifications for %ss are %s") % (
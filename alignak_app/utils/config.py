@@ -27,12 +27,19 @@
     * ``settings.cfg``: contains configurations of Alignak-app (stored in ``ALIGNAKAPP_USR_DIR``)
     * ``images.ini``: contains all images names (stored in ``ALIGNAKAPP_APP_DIR``)
     * ``style.css``: contains css of Alignak-app (stored in ``ALIGNAKAPP_APP_DIR``)
+
+    ``settings.cfg`` is read once in a :class:`ConfigSnapshot
+    <alignak_app.utils.config.ConfigSnapshot>`, rebuilt only when configuration is read or set:
+    ``get_config()`` does not parse configuration again, and values of each section are available
+    as attributes typed like default settings, like ``settings.config.alignak_app.update_host``
 """
 
 import os
 import webbrowser
 
+from collections import namedtuple, OrderedDict
 from logging import getLogger
+from types import MappingProxyType
 
 import configparser
 from configparser import NoOptionError, NoSectionError, InterpolationError
@@ -42,6 +49,89 @@ from alignak_app.utils.system import read_config_file
 logger = getLogger(__name__)
 
 
+class ConfigSnapshot(object):
+    """
+        Class who keep values of configuration, read once. Values of each section are attributes
+        typed like default settings: "Alignak-app" section is "alignak_app" attribute. Without
+        configuration, snapshot only contains default values
+    """
+
+    def __init__(self, app_config, default_settings):
+        values = {}
+        for section, defaults in default_settings.items():
+            section_values = OrderedDict()
+            for option, default in defaults.items():
+                if app_config is not None:
+                    value = self.read_value(app_config, section, option, default)
+                else:
+                    value = default
+                section_values[option] = self.get_typed_value(value, default)
+                values[(section, option)] = (value, section_values[option])
+
+            attribute = section.lower().replace('-', '_')
+            section_class = namedtuple(
+                '%sConfig' % attribute.title().replace('_', ''), section_values
+            )
+            object.__setattr__(self, attribute, section_class(**section_values))
+
+        object.__setattr__(self, 'values', MappingProxyType(values))
+
+    def __setattr__(self, name, value):
+        raise AttributeError('Configuration snapshot can\'t be modified')
+
+    @staticmethod
+    def read_value(app_config, section, option, default):
+        """
+        Return value of option in configuration, default value if it's missing or empty
+
+        :param app_config: configuration of Alignak-app
+        :type app_config: configparser.ConfigParser
+        :param section: section of option
+        :type section: str
+        :param option: option to read
+        :type option: str
+        :param default: default value of option
+        :type default: str | int | bool
+        :return: value of option
+        :rtype: str | int | bool
+        """
+
+        try:
+            value = app_config.get(section, option)
+        except (NoOptionError, NoSectionError, InterpolationError) as e:
+            logger.warning('%s', str(e))
+            logger.info('Replace by default %s: %s', section, default)
+            return default
+
+        return value if value else default
+
+    @staticmethod
+    def get_typed_value(value, default):
+        """
+        Return value converted to type of its default value
+
+        :param value: value of option
+        :type value: str | int | bool
+        :param default: default value of option
+        :type default: str | int | bool
+        :return: converted value, default value if it can't be converted
+        :rtype: str | int | bool
+        """
+
+        try:
+            if isinstance(default, bool):
+                if isinstance(value, bool):
+                    return value
+                return configparser.ConfigParser.BOOLEAN_STATES[value.lower()]
+            if isinstance(default, int):
+                return int(value)
+        except (KeyError, ValueError) as e:
+            logger.warning('Wrong value [%s], replace by default: %s', e, default)
+            return default
+
+        return value
+
+
 class Settings(object):
     """
         Class who read and create configuration for Alignak-app
@@ -56,7 +146,17 @@ class Settings(object):
             'url': 'http://127.0.0.1',
             'webui': '',
             'webservice': '',
+            'ws_pool_size': 10,
+            'ws_connect_timeout': 5,
+            'ws_read_timeout': 30,
             'processes': '1',
+            'delta_sync': True,
+            'reconcile_interval': 300,
+            'max_results': 50,
+            'page_workers': 4,
+            'history_batch': 50,
+            'history_requests': 4,
+            'fetch_workers': 6,
             'proxy': '',
             'proxy_user': '',
             'proxy_password': ''
@@ -69,6 +169,7 @@ class Settings(object):
             'tab_order': 'h,p,s',
             'requests_interval': 20,
             'notification_duration': 30,
+            'notification_elapsed': 20,
             'spy_interval': 30,
             'update_status': 30,
             'daemons_freshness': 10,
@@ -78,6 +179,18 @@ class Settings(object):
             'update_service': 30,
             'update_problems': 30,
         },
+        'Polling': {
+            'user_interval': '60, 900',
+            'realm_interval': '60, 1800',
+            'timeperiod_interval': '60, 1800',
+            'notifications_interval': '30, 300',
+            'host_interval': '10, 120',
+            'alignakdaemon_interval': '30, 600',
+            'livesynthesis_interval': '5, 60',
+            'critical_interval': '10, 120',
+            'warning_interval': '10, 120',
+            'unknown_interval': '10, 120',
+        },
         'Log': {
             'filename': 'alignakapp',
             'debug': True
@@ -92,6 +205,7 @@ class Settings(object):
             'settings': '',
             'images': ''
         }
+        self.config = ConfigSnapshot(None, self.default_settings)
 
     def init_config(self):
         """
@@ -105,9 +219,19 @@ class Settings(object):
         self.settings['settings'] = read_config_file(self.app_config, settings_cfg)
         self.settings['images'] = read_config_file(self.img_config, images_ini)
 
+        self.update_snapshot()
+
+    def update_snapshot(self):
+        """
+        Read again configuration values in snapshot, after "app_config" has changed
+
+        """
+
+        self.config = ConfigSnapshot(self.app_config, self.default_settings)
+
     def get_config(self, section, option, boolean=False):
         """
-        Return global application configuration values
+        Return global application configuration values, read in configuration snapshot
 
         :param section: wanted configuration section
         :type section: str
@@ -119,29 +243,20 @@ class Settings(object):
         :rtype: str | bool
         """
 
-        if boolean:
+        try:
+            value, typed_value = self.config.values[(section, option)]
+        except KeyError:
+            # Option without default value, not kept in snapshot
             try:
-                if self.app_config.get(section, option):
+                if boolean:
                     return self.app_config.getboolean(section, option)
 
-                return self.default_settings[section][option]
-            except (NoOptionError, NoSectionError) as e:  # pragma: no cover - not testable
+                return self.app_config.get(section, option)
+            except (NoOptionError, NoSectionError, InterpolationError, ValueError) as e:
                 logger.warning('%s', str(e))
-                logger.info('Replace by default %s: %s',
-                            section, self.default_settings[section][option])
-                return self.default_settings[section][option]
-        else:
-            try:
-                if self.app_config.get(section, option):
-                    return self.app_config.get(section, option)
+                return None
 
-                return self.default_settings[section][option]
-            # pragma: no cover - not testable
-            except (NoOptionError, NoSectionError, InterpolationError) as e:
-                logger.warning('%s', str(e))
-                logger.info('Replace by default %s: %s',
-                            section, self.default_settings[section][option])
-                return self.default_settings[section][option]
+        return typed_value if boolean else value
 
     def set_config(self, section, option, new_value):
         """
@@ -167,6 +282,7 @@ class Settings(object):
                     break
             # Setting the current configuration
             self.app_config.set(section, option, new_value)
+            self.update_snapshot()
             try:
                 with open(file_to_write, 'w') as new_config_file:
                     new_config_file.writelines(data)
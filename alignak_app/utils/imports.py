@@ -0,0 +1,118 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2015-2018:
+#   Matthieu Estrada, ttamalfor@gmail.com
+#
+# This file is part of (AlignakApp).
+#
+# (AlignakApp) is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# (AlignakApp) is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with (AlignakApp).  If not, see <http://www.gnu.org/licenses/>.
+
+
+"""
+    Imports
+    +++++++
+    Imports measure time spent to import each module, when ``ALIGNAKAPP_IMPORT_TIMES``
+    environment variable is set. Report is printed on exit, modules who take the most time first:
+
+    * **cumulative:** time to import module, with modules it imports
+    * **self:** time to import module only
+"""
+
+import sys
+import time
+import builtins
+
+
+class ImportTimer(object):
+    """
+        Class who measure time spent to import each module
+    """
+
+    def __init__(self):
+        self.original_import = None
+        self.times = {}
+        self.stack = []
+
+    def start(self):
+        """
+        Start to measure imports
+
+        """
+
+        if self.original_import is None:
+            self.original_import = builtins.__import__
+            builtins.__import__ = self.timed_import
+
+    def stop(self):
+        """
+        Stop to measure imports
+
+        """
+
+        if self.original_import is not None:
+            builtins.__import__ = self.original_import
+            self.original_import = None
+
+    def timed_import(self, name, *args, **kwargs):
+        """
+        Replace "__import__" and keep time spent to import modules not already imported
+
+        :param name: name of module
+        :type name: str
+        :return: imported module
+        :rtype: module
+        """
+
+        if name in sys.modules or name in self.times:
+            return self.original_import(name, *args, **kwargs)
+
+        start = time.time()
+        self.stack.append(0.0)
+        try:
+            return self.original_import(name, *args, **kwargs)
+        finally:
+            cumulative = time.time() - start
+            children = self.stack.pop()
+            if self.stack:
+                self.stack[-1] += cumulative
+            self.times[name] = (cumulative, cumulative - children)
+
+    def get_report(self, limit=30):
+        """
+        Return report of modules who take the most time to import
+
+        :param limit: maximum number of modules in report
+        :type limit: int
+        :return: report of import times
+        :rtype: str
+        """
+
+        lines = ['%12s %12s  %s' % ('cumulative', 'self', 'module')]
+        for name, (cumulative, own) in sorted(
+                self.times.items(), key=lambda item: item[1][0], reverse=True)[:limit]:
+            lines.append('%10.1fms %10.1fms  %s' % (cumulative * 1000, own * 1000, name))
+
+        return '\n'.join(lines)
+
+    def print_report(self):
+        """
+        Print report of import times on stderr
+
+        """
+
+        sys.stderr.write('Import times:\n%s\n' % self.get_report())
+
+
+import_timer = ImportTimer()
@@ -0,0 +1,97 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2015-2018:
+#   Matthieu Estrada, ttamalfor@gmail.com
+#
+# This file is part of (AlignakApp).
+#
+# (AlignakApp) is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# (AlignakApp) is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with (AlignakApp).  If not, see <http://www.gnu.org/licenses/>.
+
+
+"""
+    Compare time to get all items of an endpoint, between backend client, who requests pages
+    one after another, and BackendClient, who requests pages at the same time. Backend is
+    simulated, with a fixed latency for each page.
+
+    Usage: python benchmark_get_all.py [latency in ms]
+"""
+
+import sys
+import time
+
+from alignak_backend_client.client import Backend
+
+from alignak_app.backend.backend import BackendClient
+from alignak_app.utils.config import settings
+
+
+class LatencyBackend(Backend):
+    """
+        Class who simulate a backend who answers each page after a latency
+    """
+
+    def __init__(self, total, latency):
+        super(LatencyBackend, self).__init__('http://benchmark')
+        self.total = total
+        self.latency = latency
+
+    def get(self, endpoint, params=None):
+        time.sleep(self.latency)
+        max_results = min(int(params.get('max_results', 25)), 50)
+        page = int(params.get('page', 1))
+        first = (page - 1) * max_results
+        last = min(first + max_results, self.total)
+        request = {
+            '_items': [{'_id': 'id%d' % i, 'name': 'host%d' % i} for i in range(first, last)],
+            '_links': {},
+            '_meta': {'total': self.total, 'max_results': max_results, 'page': page},
+        }
+        if last < self.total:
+            request['_links']['next'] = {}
+
+        return request
+
+
+def benchmark(total, latency):
+    """
+    Print time to get all items with backend client and with BackendClient
+
+    :param total: number of items
+    :type total: int
+    :param latency: latency of each page, in seconds
+    :type latency: float
+    """
+
+    backend = LatencyBackend(total, latency)
+    start = time.time()
+    backend.get_all('host', {'max_results': 50})
+    client_time = time.time() - start
+
+    app_backend = BackendClient()
+    app_backend.backend = backend
+    start = time.time()
+    app_backend.get_all('host', {})
+    app_time = time.time() - start
+
+    print('%7d items: backend client %6.2fs, BackendClient %6.2fs (%d page workers)' % (
+        total, client_time, app_time, int(settings.get_config('Alignak', 'page_workers'))
+    ))
+
+
+if __name__ == '__main__':
+    settings.init_config()
+    page_latency = float(sys.argv[1]) / 1000 if len(sys.argv) > 1 else 0.02
+    for items_number in (10000, 100000):
+        benchmark(items_number, page_latency)
@@ -53,6 +53,16 @@ class TestApp(unittest2.TestCase):
 
         self.assertEqual('test', under_test.text())
 
+        # Bar stays busy until a progress is set
+        under_test.set_progress(0)
+
+        self.assertEqual(under_test.maximum(), 0)
+
+        under_test.set_progress(40)
+
+        self.assertEqual(under_test.maximum(), 100)
+        self.assertEqual(under_test.value(), 40)
+
     def test_app_progress_Widget(self):
         """App Progress QWidget"""
 
@@ -117,11 +117,73 @@ class TestAllItems(unittest2.TestCase):
 
         under_test.create('_id', {'ls_state': 'DOWN', 'ls_acknowledged': True}, 'name')
 
-        under_test.update_data('ls_acknowledged', False)
+        new_item = under_test.update_data('ls_acknowledged', False)
+
+        # Item is not modified, a copy is returned
+        self.assertTrue(under_test.data['ls_acknowledged'])
+        self.assertIsInstance(new_item, Item)
+        self.assertEqual('_id', new_item.item_id)
+        self.assertEqual('name', new_item.name)
+        self.assertTrue(new_item.data['ls_acknowledged'] is False)
+        self.assertEqual('DOWN', new_item.data['ls_state'])
+
+    def test_compact_items(self):
+        """Compact Host and Service Items"""
+
+        under_test = self.service_list[0]
+
+        self.assertIsInstance(under_test.data, ItemData)
+        self.assertFalse(hasattr(under_test, '__dict__'))
+        with self.assertRaises(AttributeError):
+            under_test.other_field = 'other'
+
+        # Data is still read like a dict
+        self.assertEqual('CRITICAL', under_test.data['ls_state'])
+        self.assertEqual('disk', under_test.data.get('aggregation'))
+        self.assertIsNone(under_test.data.get('ls_output'))
+        self.assertFalse('ls_output' in under_test.data)
+        self.assertEqual(10, len(under_test.data))
+        self.assertEqual(dict(under_test.data), under_test.data)
+        self.assertEqual(under_test.data.copy(), under_test.data)
+
+        # Keys are shared by all services
+        self.assertIs(under_test.data.keys_index, self.service_list[1].data.keys_index)
+
+    def test_item_data(self):
+        """Modify ItemData"""
+
+        under_test = Service()
+        under_test.create(
+            '_id', {'name': 'service', 'ls_state': 'OK', '_links': {}, 'other': 'value'}, 'service'
+        )
+
+        # Unused links are not stored, unknown keys are kept
+        self.assertFalse('_links' in under_test.data)
+        self.assertEqual('value', under_test.data['other'])
+
+        under_test = under_test.update_data('ls_state', 'WARNING')
+        under_test.data['new_key'] = 'new_value'
+
+        self.assertEqual('WARNING', under_test.data['ls_state'])
+        self.assertEqual('new_value', under_test.data['new_key'])
+
+        del under_test.data['ls_state']
+        del under_test.data['other']
+
+        self.assertEqual({'name': 'service', 'new_key': 'new_value'}, under_test.data)
+        with self.assertRaises(KeyError):
+            del under_test.data['ls_state']
+
+    def test_item_data_interned(self):
+        """Repeated Values are Interned"""
 
-        data_test = under_test.data['ls_acknowledged']
+        host_id = ''.join(['_id', 'host'])
+        service_1 = Service()
+        service_1.create('_id1', {'host': host_id}, 'service1')
+        service_2 = Service()
+        service_2.create('_id2', {'host': ''.join(['_id', 'host'])}, 'service2')
 
-        self.assertTrue(data_test is False)
+        self.assertIs(service_1.data['host'], service_2.data['host'])
 
     def test_get_icon_name(self):
         """Get Icon Name"""
@@ -20,10 +20,17 @@
 # along with (AlignakApp).  If not, see <http://www.gnu.org/licenses/>.
 
 import json
+import time
+
+from threading import Event, Thread
 
 import unittest2
 
-from alignak_app.backend.backend import BackendClient
+from alignak_backend_client.client import Backend
+
+from alignak_app.backend.backend import BackendClient, SingleFlight
+from alignak_app.backend.datamanager import data_manager
+from alignak_app.items.host import Host
 from alignak_app.utils.config import settings
 
 
@@ -287,3 +294,328 @@ class TestAppBackend(unittest2.TestCase):
 
         under_test = backend_test.get_backend_status_icon()
         self.assertEqual('connected', under_test)
+
+    def test_sync_params(self):
+        """Delta Synchronisation Params"""
+
+        under_test = BackendClient()
+        params = {'where': json.dumps({'_is_template': False})}
+
+        # First request is a full request
+        self.assertIs(params, under_test.get_sync_params('host', params))
+
+        under_test.set_sync_date('host', [
+            {'_id': 'id1', '_updated': 'Thu, 01 Mar 2018 10:00:00 GMT'},
+            {'_id': 'id2', '_updated': 'Thu, 01 Mar 2018 10:05:00 GMT'},
+            {'_id': 'id3', '_updated': 'Thu, 01 Mar 2018 09:00:00 GMT'},
+            {'_id': 'id4'},
+        ])
+        sync_params = under_test.get_sync_params('host', params)
+
+        # Next requests only get items modified since last item received
+        self.assertIsNot(params, sync_params)
+        self.assertEqual(
+            {'_is_template': False, '_updated': {'$gte': 'Thu, 01 Mar 2018 10:05:00 GMT'}},
+            json.loads(sync_params['where'])
+        )
+        self.assertEqual({'where': json.dumps({'_is_template': False})}, params)
+
+        # Older items do not change synchronisation date
+        under_test.set_sync_date('host', [{'_updated': 'Wed, 28 Feb 2018 10:00:00 GMT'}])
+
+        self.assertEqual(
+            {'$gte': 'Thu, 01 Mar 2018 10:05:00 GMT'},
+            json.loads(under_test.get_sync_params('host', params)['where'])['_updated']
+        )
+        self.assertIs(params, under_test.get_sync_params('service', params))
+
+    def test_cached_responses(self):
+        """Cached Responses of Backend"""
+
+        class FakeResponse(object):
+            def __init__(self, status_code, content, etag=None):
+                self.status_code = status_code
+                self.content = content.encode('utf-8')
+                self.headers = {'ETag': etag} if etag else {}
+
+            def raise_for_status(self):
+                pass
+
+            def json(self):
+                return json.loads(self.content.decode('utf-8'))
+
+        class FakeBackend(Backend):
+            def __init__(self):
+                super(FakeBackend, self).__init__('http://fake')
+                self.responses = []
+                self.headers = []
+                self.get_all_count = 0
+                self.total = 1
+
+            def get_response(self, method, endpoint, headers=None, json=None, params=None,
+                             data=None):
+                self.headers.append(headers)
+                return self.responses.pop(0)
+
+            def get(self, endpoint, params=None):
+                if params.get('sort') == '-_updated':
+                    return {'_items': [{'_updated': 'date'}], '_meta': {'total': self.total}}
+                self.get_all_count += 1
+                return {
+                    '_items': [{'_id': 'id%d' % self.get_all_count}],
+                    '_meta': {'total': 1, 'max_results': 50}
+                }
+
+        under_test = BackendClient()
+        under_test.backend = FakeBackend()
+        params = {'max_results': 50}
+
+        # Response with an ETag
+        under_test.backend.responses = [
+            FakeResponse(200, '{"_items": [{"_id": "id1"}]}', 'etag1'),
+            FakeResponse(304, ''),
+        ]
+
+        request = under_test.get_cached('realm', params)
+        self.assertEqual({'_items': [{'_id': 'id1'}], '_status': 'OK'}, request)
+        self.assertIsNone(under_test.backend.headers[0])
+
+        request = under_test.get_cached('realm', params)
+        self.assertTrue(request['_not_modified'])
+        self.assertEqual([{'_id': 'id1'}], request['_items'])
+        self.assertEqual({'If-None-Match': 'etag1'}, under_test.backend.headers[1])
+
+        # Response without ETag is compared with last one
+        under_test.backend.responses = [
+            FakeResponse(200, '{"_items": []}'),
+            FakeResponse(200, '{"_items": []}'),
+            FakeResponse(200, '{"_items": [{"_id": "id2"}]}'),
+        ]
+
+        self.assertFalse(under_test.get_cached('timeperiod', params).get('_not_modified'))
+        self.assertTrue(under_test.get_cached('timeperiod', params).get('_not_modified'))
+        self.assertEqual(
+            [{'_id': 'id2'}], under_test.get_cached('timeperiod', params)['_items']
+        )
+
+        # All items are only requested if their number or last update change
+        self.assertFalse(under_test.get_cached('alignakdaemon', params, True).get('_not_modified'))
+        self.assertTrue(under_test.get_cached('alignakdaemon', params, True).get('_not_modified'))
+        self.assertEqual(1, under_test.backend.get_all_count)
+
+        under_test.backend.total = 2
+
+        self.assertEqual(
+            [{'_id': 'id2'}], under_test.get_cached('alignakdaemon', params, True)['_items']
+        )
+        self.assertEqual(2, under_test.backend.get_all_count)
+
+    def test_history_events(self):
+        """History Events of several Hosts"""
+
+        class FakeBackendClient(BackendClient):
+            def __init__(self, events):
+                super(FakeBackendClient, self).__init__()
+                self.events = events
+                self.requests = []
+
+            def get(self, endpoint, params=None, projection=None, all_items=False,
+                    use_cache=False):
+                self.requests.append(params)
+                where = json.loads(params['where'])
+                if isinstance(where['host'], dict):
+                    events = [e for e in self.events if e['host'] in where['host']['$in']]
+                else:
+                    events = [e for e in self.events if e['host'] == where['host']]
+                # Backend returns 4 items by page at most, responses may be shared
+                page_size = min(params['max_results'], 4)
+                page = params.get('page', 1)
+                request = {
+                    '_items': events[(page - 1) * page_size:page * page_size],
+                    '_meta': {'max_results': page_size},
+                    '_links': {},
+                }
+                if page * page_size < len(events):
+                    request['_links']['next'] = {}
+
+                return request
+
+        events = [{'_id': 'e%d' % i, 'host': 'host1'} for i in range(10)]
+        events.insert(1, {'_id': 'e_host2', 'host': 'host2'})
+        events.insert(2, {'_id': 'e_host3', 'host': 'host3'})
+        under_test = FakeBackendClient(events)
+
+        events_by_host = under_test.get_history_events(['host1', 'host2'], max_events=1)
+
+        # One request for both hosts
+        self.assertEqual(1, len(under_test.requests))
+        self.assertEqual(
+            {'$in': ['host1', 'host2']}, json.loads(under_test.requests[0]['where'])['host']
+        )
+        self.assertEqual([{'_id': 'e0'}], events_by_host['host1'])
+        self.assertEqual([{'_id': 'e_host2'}], events_by_host['host2'])
+        # Received events are not modified
+        self.assertEqual({'_id': 'e0', 'host': 'host1'}, events[0])
+
+        # Events of "host3" are after too many events of "host1", it is requested alone
+        events.remove({'_id': 'e_host3', 'host': 'host3'})
+        events.append({'_id': 'e_host3', 'host': 'host3'})
+        under_test.requests = []
+
+        events_by_host = under_test.get_history_events(['host1', 'host3'], max_events=2)
+
+        self.assertEqual(2, len(under_test.requests))
+        self.assertEqual([{'_id': 'e0'}, {'_id': 'e1'}], events_by_host['host1'])
+        self.assertEqual('host3', json.loads(under_test.requests[1]['where'])['host'])
+        self.assertEqual([{'_id': 'e_host3', 'host': 'host3'}], events_by_host['host3'])
+
+    def test_get_all_pages(self):
+        """Get All Pages at the Same Time"""
+
+        class PagesBackend(Backend):
+            def __init__(self, total):
+                super(PagesBackend, self).__init__('http://fake')
+                self.total = total
+                self.pages = []
+
+            def get(self, endpoint, params=None):
+                self.pages.append(params['page'])
+                # Backend returns 50 items by page at most
+                max_results = min(params['max_results'], 50)
+                first = (params['page'] - 1) * max_results
+                return {
+                    '_items': [
+                        {'_id': 'id%d' % i}
+                        for i in range(first, min(first + max_results, self.total))
+                    ],
+                    '_meta': {'total': self.total, 'max_results': max_results}
+                }
+
+        under_test = BackendClient()
+        under_test.backend = PagesBackend(120)
+        params = {'where': json.dumps({'_is_template': False})}
+
+        request = under_test.get_all('host', params)
+
+        # Items are in order of pages, params are not modified
+        self.assertEqual(['id%d' % i for i in range(0, 120)], [i['_id'] for i in request['_items']])
+        self.assertEqual('OK', request['_status'])
+        self.assertEqual([1, 2, 3], sorted(under_test.backend.pages))
+        self.assertEqual({'where': json.dumps({'_is_template': False})}, params)
+
+        # Executor is kept for next requests
+        executor = under_test.page_executor
+
+        under_test.backend = PagesBackend(0)
+
+        self.assertEqual([], under_test.get_all('host', params)['_items'])
+        self.assertEqual([1], under_test.backend.pages)
+        self.assertIs(executor, under_test.get_page_executor())
+
+    def test_stream_items(self):
+        """Stream Items Page by Page"""
+
+        class PagesBackend(Backend):
+            def __init__(self, total):
+                super(PagesBackend, self).__init__('http://fake')
+                self.total = total
+
+            def get(self, endpoint, params=None):
+                first = (params['page'] - 1) * 50
+                return {
+                    '_items': [
+                        {'_id': 'id%d' % i, 'name': 'host%d' % i, 'ls_state': 'UP'}
+                        for i in range(first, min(first + 50, self.total))
+                    ],
+                    '_meta': {'total': self.total, 'max_results': 50}
+                }
+
+        under_test = BackendClient()
+        under_test.connected = True
+        under_test.backend = PagesBackend(120)
+
+        pages = []
+        request = under_test.get(
+            'host', {}, all_items=True,
+            page_callback=lambda items, received, total: pages.append((len(items), received))
+        )
+
+        # Pages are given in order and not returned
+        self.assertEqual([(50, 50), (50, 100), (20, 120)], pages)
+        self.assertEqual([], request['_items'])
+
+        old_host = Host()
+        old_host.create('old_id', {'name': 'old_host'}, 'old_host')
+        data_manager.update_database('host', [old_host])
+
+        published = []
+
+        def listener(item_type, changes):
+            if item_type == 'host':
+                published.append(changes)
+
+        data_manager.add_listener(listener)
+        under_test.merged_items = 100
+        try:
+            under_test.stream_items(Host, Host.get_request_model())
+        finally:
+            data_manager.remove_listener(listener)
+
+        # Received items are merged by batches of 100 items, others are removed with last batch
+        self.assertEqual(120, len(data_manager.database['host']))
+        self.assertIsNone(data_manager.get_item('host', 'old_id'))
+        self.assertEqual(100, data_manager.progress['host'])
+        self.assertEqual(2, len(published))
+        self.assertEqual(100, len(published[0].added))
+        self.assertEqual(0, len(published[0].removed))
+        self.assertEqual(20, len(published[1].added))
+        self.assertEqual(1, len(published[1].removed))
+
+    def test_single_flight(self):
+        """Same Calls Share One Result"""
+
+        under_test = SingleFlight()
+        calls = []
+        started = Event()
+        release = Event()
+
+        def slow_call(value):
+            calls.append(value)
+            started.set()
+            release.wait(5)
+            if value == 'error':
+                raise ValueError(value)
+            return {'_items': [value]}
+
+        results = []
+
+        def caller(value):
+            try:
+                results.append(under_test.do(('host', value), slow_call, value))
+            except ValueError as e:
+                results.append(str(e))
+
+        first = Thread(target=caller, args=('host1',))
+        first.start()
+        started.wait(5)
+        others = [Thread(target=caller, args=('host1',)) for _ in range(0, 3)]
+        for thread in others:
+            thread.start()
+        time.sleep(0.1)
+        release.set()
+        for thread in [first] + others:
+            thread.join(5)
+
+        # Function is called once, all callers get its result
+        self.assertEqual(['host1'], calls)
+        self.assertEqual([{'_items': ['host1']}] * 4, results)
+        self.assertIs(results[0], results[1])
+        self.assertFalse(under_test.calls)
+
+        # Next call is done again, errors are raised
+        results = []
+        caller('error')
+
+        self.assertEqual(['host1', 'error'], calls)
+        self.assertEqual(['error'], results)
+        self.assertFalse(under_test.calls)
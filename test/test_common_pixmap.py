@@ -22,11 +22,12 @@
 import sys
 
 import unittest2
-from PyQt5.Qt import QApplication, QPixmap
+from PyQt5.Qt import QApplication, QPixmap, QIcon
 
 from alignak_app.utils.config import settings
 
-from alignak_app.qobjects.common.labels import get_icon_pixmap, get_icon_item
+from alignak_app.qobjects.common.labels import get_icon_pixmap, get_icon_item, get_qicon, \
+    get_qpixmap, clear_images_cache, images_cache
 
 settings.init_config()
 
@@ -65,3 +66,28 @@ class TestCommonQPixmap(unittest2.TestCase):
 
         self.assertIsInstance(under_test_true, QPixmap)
         self.assertIsInstance(under_test_false, QPixmap)
+
+    def test_images_cache(self):
+        """Images Cache of QIcons and QPixmaps"""
+
+        clear_images_cache()
+
+        under_test = get_qicon('host')
+
+        self.assertIsInstance(under_test, QIcon)
+        # QIcon is created once
+        self.assertIs(under_test, get_qicon('host'))
+
+        pixmap_test = get_qpixmap('host')
+        scaled_test = get_qpixmap('host', 16)
+
+        self.assertIs(pixmap_test, get_qpixmap('host'))
+        self.assertIsNot(pixmap_test, scaled_test)
+        self.assertEqual(16, scaled_test.width())
+        self.assertEqual(3, len(images_cache))
+
+        # Cache is cleared when configuration is reloaded
+        clear_images_cache()
+
+        self.assertFalse(images_cache)
+        self.assertIsNot(under_test, get_qicon('host'))
@@ -28,6 +28,7 @@ from alignak_app.utils.config import settings
 from alignak_app.locales.locales import init_localization
 
 from alignak_app.qobjects.common.widgets import get_logo_widget, center_widget, LogoQWidget
+from alignak_app.qobjects.common.widgets import initialize_once, construction_times
 
 settings.init_config()
 init_localization()
@@ -85,3 +86,19 @@ class TestCommonQWidget(unittest2.TestCase):
         new_pos = under_test.pos()
 
         self.assertNotEqual(old_pos, new_pos)
+
+    def test_initialize_once(self):
+        """Initialize QWidget Once"""
+
+        test_widget = QWidget()
+        under_test = LogoQWidget()
+
+        self.assertIsNone(under_test.layout())
+
+        self.assertTrue(initialize_once(under_test, test_widget, '', False))
+
+        self.assertIsNotNone(under_test.layout())
+        self.assertTrue('LogoQWidget' in construction_times)
+
+        # QWidget is only initialized on first call
+        self.assertFalse(initialize_once(under_test, test_widget, '', False))
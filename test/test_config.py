@@ -24,7 +24,7 @@ import unittest2
 import configparser
 
 from alignak_app.utils.installer import Installer
-from alignak_app.utils.config import get_url_endpoint_from_icon_name, Settings
+from alignak_app.utils.config import get_url_endpoint_from_icon_name, Settings, ConfigSnapshot
 
 
 class TestUtils(unittest2.TestCase):
@@ -79,6 +79,43 @@ class TestUtils(unittest2.TestCase):
 
         self.assertIsInstance(bool_test, bool)
 
+    def test_config_snapshot(self):
+        """Typed Configuration Snapshot"""
+
+        under_test = Settings()
+
+        # Default values before configuration is read
+        self.assertIsInstance(under_test.config, ConfigSnapshot)
+        self.assertEqual(30, under_test.config.alignak_app.update_host)
+
+        under_test.init_config()
+        under_test.app_config.read_dict({
+            'Alignak-app': {'update_host': '25', 'problems': 'yes', 'spy_interval': 'wrong'},
+            'Log': {'debug': ''}
+        })
+
+        # Snapshot is only updated when asked
+        self.assertNotEqual(25, under_test.config.alignak_app.update_host)
+
+        under_test.update_snapshot()
+
+        self.assertEqual(25, under_test.config.alignak_app.update_host)
+        self.assertIs(True, under_test.config.alignak_app.problems)
+        # Wrong or empty values are replaced by default
+        self.assertEqual(30, under_test.config.alignak_app.spy_interval)
+        self.assertIs(True, under_test.config.log.debug)
+
+        # "get_config" keeps values of configuration file
+        self.assertEqual('25', under_test.get_config('Alignak-app', 'update_host'))
+        self.assertIs(True, under_test.get_config('Alignak-app', 'problems', boolean=True))
+        self.assertIsNone(under_test.get_config('Alignak-app', 'no_option'))
+
+        # Snapshot can't be modified
+        with self.assertRaises(AttributeError):
+            under_test.config.alignak_app = None
+        with self.assertRaises(AttributeError):
+            under_test.config.alignak_app.update_host = 10
+
     def test_get_image(self):
         """Get Image"""
 
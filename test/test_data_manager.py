@@ -19,6 +19,8 @@
 # You should have received a copy of the GNU Affero General Public License
 # along with (AlignakApp).  If not, see <http://www.gnu.org/licenses/>.
 
+from threading import Thread
+
 import unittest2
 
 from alignak_app.backend.datamanager import DataManager
@@ -406,6 +408,46 @@ class TestDataManager(unittest2.TestCase):
 
         self.assertTrue(2 == len(host_services_test))
 
+    def test_update_host_services(self):
+        """Update Services of Host"""
+
+        under_test = DataManager()
+
+        services = []
+        for i in range(0, 3):
+            for name in ['service%d' % i, 'other_service%d' % i]:
+                service = Service()
+                service.create(
+                    '%s_id%d' % (name, i),
+                    {'name': name, 'host': '_id%d' % i, 'ls_state': 'UP'},
+                    name
+                )
+                services.append(service)
+        under_test.update_database('service', services)
+
+        self.assertEqual(2, len(under_test.get_host_services('_id1')))
+
+        # Known service is updated, new service is added, missing service is removed
+        updated_service = Service()
+        updated_service.create(
+            'service1_id1', {'name': 'service1', 'host': '_id1', 'ls_state': 'OK'}, 'service1'
+        )
+        new_service = Service()
+        new_service.create(
+            'new_id1', {'name': 'new_service1', 'host': '_id1', 'ls_state': 'OK'}, 'new_service1'
+        )
+
+        under_test.update_host_services('_id1', [updated_service, new_service])
+
+        host_services_test = under_test.get_host_services('_id1')
+
+        self.assertEqual(2, len(host_services_test))
+        self.assertEqual('OK', under_test.get_item('service', 'service1_id1').data['ls_state'])
+        self.assertTrue(new_service in host_services_test)
+        self.assertIsNone(under_test.get_item('service', 'other_service1_id1'))
+        # Other hosts are not impacted
+        self.assertEqual(2, len(under_test.get_host_services('_id2')))
+
     def test_get_host_with_services(self):
         """Get Host with Services"""
 
@@ -529,7 +571,9 @@ class TestDataManager(unittest2.TestCase):
 
         under_test.update_problems()
 
-        # Host is added but not the service
+        # Host is added but not the service, items are replaced by their updated copy
+        host_test = under_test.get_item('host', 'id_1')
+        self.assertEqual('DOWN', host_test.data['ls_state'])
         self.assertTrue(host_test in under_test.database['problems'])
         self.assertFalse(service_test in under_test.database['problems'])
 
@@ -540,6 +584,8 @@ class TestDataManager(unittest2.TestCase):
         under_test.update_problems()
 
         # Services is added in problems and host have been removed from problems
+        host_test = under_test.get_item('host', 'id_1')
+        service_test = under_test.get_item('service', 'id_2')
         self.assertFalse(host_test in under_test.database['problems'])
         self.assertTrue(service_test in under_test.database['problems'])
 
@@ -571,6 +617,115 @@ class TestDataManager(unittest2.TestCase):
         )
         # Service still in problems
         self.assertTrue(service_test in under_test.database['problems'])
+        self.assertIs(service_test, under_test.get_item('service', 'id_2'))
+
+    def test_problems_follow_ingestion(self):
+        """Problems are Updated during Ingestion"""
+
+        under_test = DataManager()
+
+        hosts = []
+        for i in range(0, 4):
+            host = Host()
+            host.create(
+                'host_id%d' % i,
+                {
+                    'name': 'host%d' % i,
+                    'ls_state': 'DOWN' if i % 2 else 'UP',
+                    'ls_acknowledged': False,
+                    'ls_downtimed': False,
+                    'passive_checks_enabled': True,
+                    'active_checks_enabled': True
+                },
+                'host%d' % i
+            )
+            hosts.append(host)
+
+        under_test.update_database('host', hosts)
+
+        # Only DOWN hosts are problems, without calling update_problems()
+        self.assertEqual(2, under_test.get_problems()['hosts_nb'])
+        self.assertTrue(hosts[1] in under_test.database['problems'])
+        self.assertTrue(hosts[3] in under_test.database['problems'])
+
+        # Acknowledged host leave problems
+        under_test.update_item_data('host', 'host_id1', {'ls_acknowledged': True})
+
+        self.assertEqual(1, under_test.get_problems()['hosts_nb'])
+        self.assertFalse(hosts[1] in under_test.database['problems'])
+        self.assertFalse(under_test.get_item('host', 'host_id1') in under_test.database['problems'])
+
+        # New hosts list replace problems of hosts
+        under_test.update_database('host', [hosts[0], under_test.get_item('host', 'host_id1')])
+
+        self.assertEqual(0, under_test.get_problems()['hosts_nb'])
+
+    def test_disable_checks_remove_problem(self):
+        """Host in Problem without Checks Leave Problems"""
+
+        under_test = DataManager()
+
+        host = Host()
+        host.create(
+            'host_id',
+            {
+                'name': 'host',
+                'ls_state': 'DOWN',
+                'ls_acknowledged': False,
+                'ls_downtimed': False,
+                'passive_checks_enabled': True,
+                'active_checks_enabled': True
+            },
+            'host'
+        )
+        under_test.update_database('host', [host])
+
+        self.assertEqual(1, under_test.get_problems()['hosts_nb'])
+
+        # Checks are disabled one by one, like HostQWidget.patch_host_checks()
+        under_test.update_item_data('host', 'host_id', {'active_checks_enabled': False})
+        self.assertEqual(1, under_test.get_problems()['hosts_nb'])
+        under_test.update_item_data('host', 'host_id', {'passive_checks_enabled': False})
+
+        self.assertEqual(0, under_test.get_problems()['hosts_nb'])
+        self.assertFalse(under_test.database['problems'])
+        # Read item is not modified
+        self.assertTrue(host.data['active_checks_enabled'])
+
+    def test_replace_problems_for_state(self):
+        """Replace Problems of a State"""
+
+        under_test = DataManager()
+
+        services = []
+        for i, state in enumerate(['CRITICAL', 'CRITICAL', 'WARNING']):
+            service = Service()
+            service.create(
+                'service_id%d' % i,
+                {
+                    'name': 'service%d' % i,
+                    'host': 'host_id',
+                    'ls_state': state,
+                    'ls_acknowledged': False,
+                    'ls_downtimed': False,
+                    'passive_checks_enabled': False,
+                    'active_checks_enabled': True
+                },
+                'service%d' % i
+            )
+            services.append(service)
+
+        under_test.replace_problems('service', services[0:2], 'CRITICAL')
+        under_test.replace_problems('service', services[2:], 'WARNING')
+
+        self.assertEqual(3, under_test.get_problems()['services_nb'])
+
+        # "service0" is no more CRITICAL, WARNING problems are kept
+        under_test.replace_problems('service', services[1:2], 'CRITICAL')
+
+        self.assertEqual(2, under_test.get_problems()['services_nb'])
+        self.assertFalse(services[0] in under_test.database['problems'])
+        self.assertTrue(services[2] in under_test.database['problems'])
 
     def test_get_problems(self):
         """Get Database Problems"""
@@ -588,6 +743,91 @@ class TestDataManager(unittest2.TestCase):
         self.assertEqual(problems_test['services_nb'], 20)
         self.assertIsNotNone(problems_test['problems'])
 
+    def test_write_publish_snapshot(self):
+        """Writers Publish a New Database"""
+
+        under_test = DataManager()
+        under_test.update_database('host', self.host_list)
+
+        snapshot = under_test.snapshot()
+        old_hosts = snapshot['host']
+
+        with under_test.write() as database:
+            database.edit('host').remove(self.host_list[0])
+            # Nested write use same draft
+            with under_test.write() as same_database:
+                self.assertIs(database, same_database)
+            # Nothing published before the end of write()
+            self.assertIs(snapshot, under_test.snapshot())
+
+        # Old snapshot is not modified, new one is published
+        self.assertEqual(10, len(old_hosts))
+        self.assertEqual(9, len(under_test.database['host']))
+        self.assertIsNot(snapshot, under_test.snapshot())
+        self.assertIsNone(under_test.draft)
+
+        # Draft is dropped if write fails
+        try:
+            with under_test.write() as database:
+                database.edit('host').remove(self.host_list[1])
+                raise ValueError('write failed')
+        except ValueError:
+            pass
+
+        self.assertEqual(9, len(under_test.database['host']))
+        self.assertIsNone(under_test.draft)
+
+    def test_get_database_of_writer(self):
+        """Only Writer Reads Draft of Database"""
+
+        under_test = DataManager()
+        under_test.update_database('host', self.host_list)
+
+        read = []
+
+        with under_test.write() as database:
+            database.edit('host').remove(self.host_list[0])
+            self.assertIs(database, under_test.get_database())
+
+            reader = Thread(target=lambda: read.append(under_test.get_database()))
+            reader.start()
+            reader.join()
+
+        # Other threads read the published database, not the draft
+        self.assertIsNot(database, read[0])
+        self.assertEqual(10, len(read[0]['host']))
+        self.assertIs(database, under_test.get_database())
+
+    def test_get_item_of_writer(self):
+        """Get Item Reads Draft of Writer"""
+
+        under_test = DataManager()
+        under_test.update_database('host', self.host_list)
+
+        with under_test.write():
+            under_test.update_item_data(
+                'host', self.host_list[0].item_id, {'ls_state': 'UNREACHABLE'}
+            )
+
+            # Writer reads its own changes before they are published
+            host = under_test.get_item('host', self.host_list[0].item_id)
+            self.assertEqual('UNREACHABLE', host.data['ls_state'])
+
+    def test_update_item_data_keep_snapshot(self):
+        """Update Item Data does not Modify Read Data"""
+
+        under_test = DataManager()
+
+        host = Host()
+        host.create('_id', {'name': 'host', 'ls_state': 'UP'}, 'host')
+        under_test.update_database('host', [host])
+
+        old_data = host.data
+        under_test.update_item_data('host', '_id', {'ls_state': 'DOWN', 'ls_output': 'down'})
+
+        self.assertEqual({'name': 'host', 'ls_state': 'UP'}, old_data)
+        self.assertEqual('DOWN', under_test.get_item('host', '_id').data['ls_state'])
+
     def test_update_item_data(self):
         """Update Item Data"""
 
@@ -609,3 +849,135 @@ class TestDataManager(unittest2.TestCase):
         )
 
         self.assertEqual('UP', under_test.get_item('host', '_id1').data['ls_state'])
+
+    def test_listeners_receive_changes(self):
+        """Listeners Receive Changes when Database is Published"""
+
+        under_test = DataManager()
+        received = []
+
+        def listener(item_type, changes):
+            received.append((item_type, changes.as_dict()))
+
+        under_test.add_listener(listener)
+        under_test.add_listener(listener)
+
+        self.assertEqual([listener], under_test.listeners)
+
+        host = Host()
+        host.create(
+            '_id', {'name': 'host', 'ls_state': 'UP', 'active_checks_enabled': True}, 'host'
+        )
+        under_test.update_database('host', [host])
+
+        self.assertEqual([('host', {'added': [host], 'changed': [], 'removed': []})], received)
+
+        # Host in problem changes "host" and "problems"
+        del received[:]
+        under_test.update_item_data('host', '_id', {'ls_state': 'DOWN'})
+
+        # Host has been replaced by a copy with new data
+        new_host = under_test.get_item('host', '_id')
+        self.assertIsNot(host, new_host)
+        self.assertEqual('UP', host.data['ls_state'])
+        self.assertEqual(
+            [('host', {'added': [], 'changed': [new_host], 'removed': []}),
+             ('problems', {'added': [new_host], 'changed': [], 'removed': []})],
+            sorted(received, key=lambda x: x[0])
+        )
+
+        # Same data does not notify listeners
+        del received[:]
+        under_test.update_item_data('host', '_id', {'ls_state': 'DOWN'})
+
+        self.assertEqual([], received)
+
+        under_test.remove_listener(listener)
+        under_test.update_item_data('host', '_id', {'ls_state': 'UP'})
+
+        self.assertEqual([], received)
+
+    def test_update_and_keep_items(self):
+        """Update Modified Items and Remove Deleted Items"""
+
+        under_test = DataManager()
+
+        hosts = []
+        for i in range(0, 3):
+            host = Host()
+            host.create(
+                '_id%d' % i,
+                {'name': 'host%d' % i, 'ls_state': 'UP', 'active_checks_enabled': True},
+                'host%d' % i
+            )
+            hosts.append(host)
+        under_test.update_database('host', hosts[:2])
+
+        modified_host = Host()
+        modified_host.create(
+            '_id1', {'name': 'host1', 'ls_state': 'DOWN', 'active_checks_enabled': True}, 'host1'
+        )
+        under_test.update_items('host', [modified_host, hosts[2]])
+
+        # Known host is updated, new host is added, other hosts are kept
+        updated_host = under_test.get_item('host', '_id1')
+        self.assertEqual(3, len(under_test.database['host']))
+        self.assertEqual('DOWN', updated_host.data['ls_state'])
+        self.assertEqual('UP', hosts[1].data['ls_state'])
+        self.assertEqual([updated_host], list(under_test.database['problems']))
+
+        under_test.keep_items('host', {'_id0', '_id2'})
+
+        self.assertEqual([hosts[0], hosts[2]], list(under_test.database['host']))
+        self.assertFalse(under_test.database['problems'])
+
+    def test_progress(self):
+        """Progress of DataManager Filling"""
+
+        under_test = DataManager()
+
+        self.assertEqual(0, under_test.get_progress())
+        self.assertFalse(under_test.is_ready().endswith('%'))
+
+        under_test.set_progress('livesynthesis', 50, 200)
+
+        # Percentage of items received is added to status
+        self.assertTrue(under_test.is_ready().endswith('livesynthesis(s)... 25%'))
+
+        under_test.db_is_ready['livesynthesis'] = True
+        under_test.set_progress('alignakdaemon', 0, 0)
+
+        # 2 databases of 9 are filled
+        self.assertEqual(22, under_test.get_progress())
+
+    def test_ready_databases(self):
+        """Databases Filled by Requests"""
+
+        under_test = DataManager()
+        notified = []
+        under_test.add_progress_listener(lambda: notified.append(True))
+
+        under_test.set_db_ready('host')
+        under_test.set_db_ready('problems', 'CRITICAL')
+        under_test.set_progress('user', 1, 2)
+
+        # Listeners are notified for each filling and progress
+        self.assertEqual(3, len(notified))
+        self.assertTrue(under_test.db_is_ready['host'])
+        self.assertTrue(under_test.db_is_ready['problems']['CRITICAL'])
+        self.assertEqual(['CRITICAL', 'host'], sorted(under_test.ready_times))
+        self.assertFalse(under_test.is_loaded())
+
+        # Saved items fill databases, but they are not loaded by requests
+        under_test.load_items({'livesynthesis': [], 'alignakdaemon': [], 'user': []})
+
+        self.assertEqual(4, len(notified))
+        self.assertFalse(under_test.is_loaded())
+
+        for db_name in ['livesynthesis', 'alignakdaemon', 'user', 'realm', 'timeperiod']:
+            under_test.set_db_ready(db_name)
+        under_test.set_db_ready('problems', 'WARNING')
+        under_test.set_db_ready('problems', 'UNKNOWN')
+
+        self.assertTrue(under_test.is_loaded())
+        self.assertEqual('READY', under_test.is_ready())
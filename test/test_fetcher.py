@@ -0,0 +1,92 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2015-2018:
+#   Matthieu Estrada, ttamalfor@gmail.com
+#
+# This file is part of (AlignakApp).
+#
+# (AlignakApp) is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# (AlignakApp) is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with (AlignakApp).  If not, see <http://www.gnu.org/licenses/>.
+
+
+import time
+
+from threading import Thread
+
+import unittest2
+
+from alignak_app.backend.datamanager import data_manager
+from alignak_app.backend.fetcher import Fetcher
+from alignak_app.items.realm import Realm
+from alignak_app.utils.config import settings
+
+
+class TestFetcher(unittest2.TestCase):
+    """
+        This file test the Fetcher class.
+    """
+
+    settings.init_config()
+
+    def test_same_queries(self):
+        """Same Queries Sent Once"""
+
+        class CountFetcher(Fetcher):
+            queries = []
+
+            @staticmethod
+            def send_query(name, data=None):
+                CountFetcher.queries.append((name, data))
+                time.sleep(0.2)
+
+        under_test = CountFetcher()
+
+        threads = [
+            Thread(target=under_test.query, args=('service', 'host1')),
+            Thread(target=under_test.query, args=('service', 'host1')),
+            Thread(target=under_test.query, args=('service', 'host2')),
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(5)
+
+        self.assertEqual(
+            [('service', 'host1'), ('service', 'host2')], sorted(CountFetcher.queries)
+        )
+
+    def test_count_changes(self):
+        """Count Changes of Query"""
+
+        def add_realm(realm_id):
+            realm = Realm()
+            realm.create(realm_id, {'name': realm_id}, realm_id)
+            data_manager.add_item('realm', realm)
+
+        class ChangeFetcher(Fetcher):
+            @staticmethod
+            def send_query(name, data=None):
+                # Other thread changes data during query
+                thread = Thread(target=add_realm, args=('other_%s' % name,))
+                thread.start()
+                thread.join(5)
+                add_realm(name)
+                add_realm('%s_2' % name)
+
+        under_test = ChangeFetcher()
+
+        self.assertEqual({'realm': 2}, under_test.query('realm1'))
+        self.assertEqual({'realm': 2}, under_test.query('realm2'))
+        # Unknown request changes nothing
+        self.assertEqual({}, Fetcher().count_changes('nothing'))
@@ -81,6 +81,9 @@ class TestHostQWidget(unittest2.TestCase):
         under_test.initialize()
 
         self.assertIsNotNone(under_test.layout())
+        # History and customs are initialized on first display
+        self.assertIsNone(under_test.history_widget.layout())
+        self.assertIsNone(under_test.customs_widget.layout())
 
     def test_set_data(self):
         """Set Data Host QWidget"""
@@ -0,0 +1,67 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2015-2018:
+#   Matthieu Estrada, ttamalfor@gmail.com
+#
+# This file is part of (AlignakApp).
+#
+# (AlignakApp) is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# (AlignakApp) is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with (AlignakApp).  If not, see <http://www.gnu.org/licenses/>.
+
+
+import sys
+
+import unittest2
+
+from alignak_app.utils.imports import ImportTimer
+
+
+class TestImports(unittest2.TestCase):
+    """
+        This file test the ImportTimer class.
+    """
+
+    def test_import_times(self):
+        """Measure Import Times"""
+
+        under_test = ImportTimer()
+        sys.modules.pop('json.tool', None)
+
+        under_test.start()
+        import json.tool  # pylint: disable=unused-variable
+        under_test.stop()
+
+        self.assertIn('json.tool', under_test.times)
+        cumulative, own = under_test.times['json.tool']
+        self.assertGreaterEqual(cumulative, own)
+        self.assertIn('json.tool', under_test.get_report())
+
+        # Imports are no longer measured
+        sys.modules.pop('json.tool', None)
+        under_test.times.clear()
+        import json.tool  # pylint: disable=unused-variable,reimported
+
+        self.assertFalse(under_test.times)
+
+    def test_report_limit(self):
+        """Import Times Report is Limited"""
+
+        under_test = ImportTimer()
+        under_test.times = {'module%d' % i: (i, i) for i in range(0, 10)}
+
+        report = under_test.get_report(limit=3).splitlines()
+
+        # Title and the 3 slowest modules
+        self.assertEqual(4, len(report))
+        self.assertIn('module9', report[1])
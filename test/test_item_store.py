@@ -0,0 +1,383 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2015-2018:
+#   Matthieu Estrada, ttamalfor@gmail.com
+#
+# This file is part of (AlignakApp).
+#
+# (AlignakApp) is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# (AlignakApp) is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with (AlignakApp).  If not, see <http://www.gnu.org/licenses/>.
+
+import unittest2
+
+from alignak_app.backend.itemstore import ItemStore, Database, Changes
+from alignak_app.items.host import Host
+from alignak_app.items.service import Service
+from alignak_app.items.user import User
+
+
+class TestItemStore(unittest2.TestCase):
+    """
+        This file test the ItemStore and Database classes.
+    """
+
+    host_list = []
+    for i in range(0, 5):
+        host = Host()
+        host.create('_id%d' % i, {'name': 'host%d' % i, 'ls_state': 'UP'}, 'host%d' % i)
+        host_list.append(host)
+
+    def test_initialize_item_store(self):
+        """Initialize ItemStore"""
+
+        under_test = ItemStore()
+
+        self.assertFalse(under_test)
+        self.assertEqual(0, len(under_test))
+
+        under_test = ItemStore(self.host_list)
+
+        self.assertTrue(under_test)
+        self.assertEqual(5, len(under_test))
+        # Order is kept
+        self.assertEqual(self.host_list, list(under_test))
+        self.assertEqual(self.host_list[0], under_test[0])
+        self.assertEqual(self.host_list, under_test)
+
+    def test_get_items(self):
+        """Get Items by ID and Name"""
+
+        under_test = ItemStore(self.host_list)
+
+        self.assertEqual(self.host_list[2], under_test.get('_id2'))
+        self.assertEqual(self.host_list[3], under_test.get_by_name('host3'))
+        self.assertEqual(self.host_list[1], under_test.find('_id', '_id1'))
+        self.assertEqual(self.host_list[4], under_test.find('name', 'host4'))
+        self.assertEqual(self.host_list[0], under_test.find('ls_state', 'UP'))
+
+        self.assertIsNone(under_test.get('no_id'))
+        self.assertIsNone(under_test.get_by_name('no_name'))
+        self.assertIsNone(under_test.find('ls_state', 'DOWN'))
+
+    def test_same_names(self):
+        """Items with Same Name"""
+
+        service_1 = Service()
+        service_1.create('id1', {'name': 'cpu', 'host': 'host1'}, 'cpu')
+        service_2 = Service()
+        service_2.create('id2', {'name': 'cpu', 'host': 'host2'}, 'cpu')
+
+        under_test = ItemStore([service_1, service_2])
+
+        # First item with name is returned
+        self.assertEqual(service_1, under_test.get_by_name('cpu'))
+
+        under_test.remove(service_1)
+
+        # Next item with same name is returned
+        self.assertEqual(service_2, under_test.get_by_name('cpu'))
+
+        under_test.remove(service_2)
+
+        self.assertIsNone(under_test.get_by_name('cpu'))
+        self.assertFalse(under_test.names)
+
+    def test_append_and_remove(self):
+        """Append and Remove Items"""
+
+        under_test = ItemStore(self.host_list)
+
+        new_host = Host()
+        new_host.create('_id2', {'name': 'new_host2'}, 'new_host2')
+
+        # Like a list, item with same ID is added at the end, first one is returned
+        under_test.append(new_host)
+        under_test.append(new_host)
+
+        self.assertEqual(6, len(under_test))
+        self.assertEqual(new_host, under_test[-1])
+        self.assertTrue(new_host in under_test)
+        self.assertEqual(self.host_list[2], under_test.get('_id2'))
+        self.assertEqual([self.host_list[2], new_host], under_test.get_all('_id2'))
+
+        under_test.remove(self.host_list[2])
+
+        self.assertEqual(5, len(under_test))
+        self.assertEqual(new_host, under_test.get('_id2'))
+        self.assertIsNone(under_test.get_by_name('host2'))
+        with self.assertRaises(ValueError):
+            under_test.remove(self.host_list[2])
+
+        under_test.clear()
+
+        self.assertFalse(under_test)
+        self.assertFalse(under_test.ids)
+        self.assertFalse(under_test.names)
+
+    def test_remove_during_iteration(self):
+        """Remove Items during Iteration"""
+
+        under_test = ItemStore(self.host_list)
+
+        for item in list(under_test):
+            under_test.remove(item)
+
+        self.assertFalse(under_test)
+
+    def test_database(self):
+        """Database convert Lists"""
+
+        under_test = Database({'host': [], 'user': []})
+
+        self.assertIsInstance(under_test['host'], ItemStore)
+        self.assertIsInstance(under_test['user'], ItemStore)
+
+        under_test['host'] = self.host_list
+        user = User()
+        under_test['user'] = user
+
+        self.assertIsInstance(under_test['host'], ItemStore)
+        self.assertEqual(self.host_list[1], under_test['host'].get('_id1'))
+        self.assertEqual(user, under_test['user'])
+
+    def test_group_key(self):
+        """Group Items by Data Field"""
+
+        service_1 = Service()
+        service_1.create('id1', {'name': 'cpu', 'host': 'host1'}, 'cpu')
+        service_2 = Service()
+        service_2.create('id2', {'name': 'mem', 'host': 'host1'}, 'mem')
+        service_3 = Service()
+        service_3.create('id3', {'name': 'cpu', 'host': 'host2'}, 'cpu')
+
+        under_test = ItemStore([service_1, service_2, service_3], 'host')
+
+        self.assertEqual([service_1, service_2], under_test.get_group('host1'))
+        self.assertEqual([service_3], under_test.get_group('host2'))
+        self.assertEqual([], under_test.get_group('host3'))
+        self.assertEqual(service_3, under_test.find('host', 'host2'))
+
+        # Update "group_key" move item in other group
+        new_service_2 = under_test.update_data(service_2, {'host': 'host2', 'ls_state': 'OK'})
+
+        self.assertEqual([service_1], under_test.get_group('host1'))
+        self.assertEqual([service_3, new_service_2], under_test.get_group('host2'))
+        self.assertEqual('OK', new_service_2.data['ls_state'])
+
+        under_test.remove(service_1)
+
+        self.assertEqual([], under_test.get_group('host1'))
+        self.assertFalse('host1' in under_test.groups)
+
+    def test_database_group_keys(self):
+        """Database Group Services by Host"""
+
+        under_test = Database({'host': [], 'service': []})
+
+        self.assertIsNone(under_test['host'].group_key)
+        self.assertEqual('host', under_test['service'].group_key)
+
+    def test_copy(self):
+        """Copy ItemStore without Modifying Original"""
+
+        service_1 = Service()
+        service_1.create('id1', {'name': 'cpu', 'host': 'host1'}, 'cpu')
+        service_2 = Service()
+        service_2.create('id2', {'name': 'cpu', 'host': 'host1'}, 'cpu')
+
+        original = ItemStore([service_1], 'host')
+        under_test = original.copy()
+
+        under_test.append(service_2)
+        under_test.remove(service_1)
+
+        # Original store and its indexes are not modified
+        self.assertEqual([service_1], list(original))
+        self.assertEqual(service_1, original.get_by_name('cpu'))
+        self.assertEqual([service_1], original.get_group('host1'))
+
+        self.assertEqual([service_2], list(under_test))
+        self.assertEqual(service_2, under_test.get_by_name('cpu'))
+        self.assertEqual([service_2], under_test.get_group('host1'))
+
+        # Original can still be modified without modifying copy
+        original.remove(service_1)
+
+        self.assertEqual(service_2, under_test.get_by_name('cpu'))
+
+    def test_update_data_of_copy(self):
+        """Update Data of Copy without Modifying Items of Original"""
+
+        service_1 = Service()
+        service_1.create('id1', {'name': 'cpu', 'host': 'host1', 'ls_state': 'OK'}, 'cpu')
+        service_2 = Service()
+        service_2.create('id2', {'name': 'mem', 'host': 'host1', 'ls_state': 'OK'}, 'mem')
+
+        original = ItemStore([service_1, service_2], 'host')
+        under_test = original.copy()
+
+        new_service_1 = under_test.update_data(service_1, {'ls_state': 'CRITICAL'})
+
+        # Item is replaced by a copy, at the same place
+        self.assertIsNot(service_1, new_service_1)
+        self.assertEqual('OK', service_1.data['ls_state'])
+        self.assertEqual('CRITICAL', new_service_1.data['ls_state'])
+        self.assertEqual([new_service_1, service_2], list(under_test))
+        self.assertEqual(new_service_1, under_test[0])
+        self.assertEqual(new_service_1, under_test.get('id1'))
+        self.assertEqual([new_service_1, service_2], under_test.get_group('host1'))
+        self.assertTrue(new_service_1 in under_test)
+        self.assertFalse(service_1 in under_test)
+
+        # Original store keeps its items
+        self.assertEqual([service_1, service_2], list(original))
+        self.assertEqual(service_1, original[0])
+        self.assertEqual(service_1, original.get('id1'))
+
+    def test_replace(self):
+        """Replace Item of Store"""
+
+        service_1 = Service()
+        service_1.create('id1', {'name': 'cpu', 'host': 'host1'}, 'cpu')
+        service_2 = Service()
+        service_2.create('id2', {'name': 'mem', 'host': 'host1'}, 'mem')
+        other_service = Service()
+        other_service.create('id1', {'name': 'disk', 'host': 'host2'}, 'disk')
+
+        under_test = ItemStore([service_1, service_2], 'host')
+        self.assertEqual(service_2, under_test[1])
+
+        under_test.replace(service_1, other_service)
+
+        self.assertEqual([other_service, service_2], list(under_test))
+        self.assertEqual(other_service, under_test[0])
+        self.assertIsNone(under_test.get_by_name('cpu'))
+        self.assertEqual(other_service, under_test.get_by_name('disk'))
+        self.assertEqual([service_2], under_test.get_group('host1'))
+        self.assertEqual([other_service], under_test.get_group('host2'))
+
+        with self.assertRaises(ValueError):
+            under_test.replace(service_1, other_service)
+
+    def test_database_edit(self):
+        """Edit Database Copy"""
+
+        original = Database({'host': self.host_list})
+        under_test = original.copy()
+
+        self.assertIs(original['host'], under_test['host'])
+
+        hosts = under_test.edit('host')
+
+        self.assertIsNot(original['host'], hosts)
+        # Store is only copied once
+        self.assertIs(hosts, under_test.edit('host'))
+
+    def test_changes_are_merged(self):
+        """Merge Changes of Items"""
+
+        under_test = Changes()
+
+        self.assertFalse(under_test)
+
+        under_test.add(self.host_list[0])
+        under_test.change(self.host_list[0])
+        under_test.change(self.host_list[1])
+        under_test.remove(self.host_list[2])
+
+        # Changed item who has been added stays added
+        self.assertEqual([self.host_list[0]], under_test.as_dict()['added'])
+        self.assertEqual([self.host_list[1]], under_test.as_dict()['changed'])
+        self.assertEqual([self.host_list[2]], under_test.as_dict()['removed'])
+
+        next_changes = Changes()
+        next_changes.remove(self.host_list[0])
+        next_changes.remove(self.host_list[1])
+        next_changes.add(self.host_list[2])
+
+        under_test.merge(next_changes)
+
+        # Added then removed is forgotten, removed then added is changed
+        self.assertEqual([], under_test.as_dict()['added'])
+        self.assertEqual([self.host_list[2]], under_test.as_dict()['changed'])
+        self.assertEqual([self.host_list[1]], under_test.as_dict()['removed'])
+
+    def test_changes_diff(self):
+        """Changes between two Stores"""
+
+        new_host = Host()
+        new_host.create('_id1', {'name': 'host1', 'ls_state': 'DOWN'}, 'host1')
+        same_host = Host()
+        same_host.create('_id2', dict(self.host_list[2].data), 'host2')
+
+        old_store = ItemStore(self.host_list[:3])
+        new_store = ItemStore([new_host, same_host, self.host_list[3]])
+
+        under_test = Changes.diff(old_store, new_store)
+
+        self.assertEqual([self.host_list[3]], under_test.as_dict()['added'])
+        # Items with same data are not changed
+        self.assertEqual([new_host], under_test.as_dict()['changed'])
+        self.assertEqual([self.host_list[0]], under_test.as_dict()['removed'])
+
+    def test_track_changes(self):
+        """Track Changes of Store"""
+
+        service_1 = Service()
+        service_1.create('id1', {'name': 'cpu', 'host': 'host1'}, 'cpu')
+        service_2 = Service()
+        service_2.create('id2', {'name': 'mem', 'host': 'host1'}, 'mem')
+
+        under_test = ItemStore([service_1], 'host')
+
+        self.assertIsNone(under_test.changes)
+
+        under_test.track_changes()
+        under_test.append(service_2)
+
+        # Same data does not change item
+        self.assertIsNone(under_test.update_data(service_1, {'name': 'cpu'}))
+        self.assertFalse(under_test.changes.changed)
+        new_service_1 = under_test.update_data(service_1, {'ls_state': 'OK'})
+        self.assertEqual([new_service_1], under_test.changes.as_dict()['changed'])
+
+        under_test.clear()
+
+        self.assertEqual([new_service_1], under_test.changes.as_dict()['removed'])
+        self.assertFalse(under_test.changes.added)
+
+    def test_database_changes(self):
+        """Get Changes of Database Copy"""
+
+        original = Database({'host': self.host_list[:2], 'user': User()})
+        under_test = original.copy()
+
+        self.assertEqual({}, under_test.get_changes(original))
+
+        under_test.edit('host').remove(self.host_list[0])
+        new_user = User()
+        under_test['user'] = new_user
+
+        changes = under_test.get_changes(original)
+
+        self.assertEqual([self.host_list[0]], changes['host'].as_dict()['removed'])
+        self.assertEqual([new_user], changes['user'].as_dict()['changed'])
+
+        # Replaced store is compared with original one
+        under_test['host'] = self.host_list[1:3]
+
+        changes = under_test.get_changes(original)
+
+        self.assertEqual([self.host_list[2]], changes['host'].as_dict()['added'])
+        self.assertEqual([self.host_list[0]], changes['host'].as_dict()['removed'])
@@ -0,0 +1,140 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2015-2018:
+#   Matthieu Estrada, ttamalfor@gmail.com
+#
+# This file is part of (AlignakApp).
+#
+# (AlignakApp) is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# (AlignakApp) is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with (AlignakApp).  If not, see <http://www.gnu.org/licenses/>.
+
+import sys
+
+import unittest2
+from PyQt5.Qt import QApplication
+
+from alignak_app.backend.datamanager import data_manager
+from alignak_app.backend.itemstore import Changes
+from alignak_app.items.host import Host
+
+from alignak_app.qobjects.threads.notifier import ChangesQNotifier, RefreshQTimer
+
+
+class TestChangesQNotifier(unittest2.TestCase):
+    """
+        This file test the ChangesQNotifier and RefreshQTimer classes.
+    """
+
+    host_list = []
+    for i in range(0, 3):
+        host = Host()
+        host.create('_id%d' % i, {'name': 'host%d' % i, 'ls_state': 'UP'}, 'host%d' % i)
+        host_list.append(host)
+
+    @classmethod
+    def setUpClass(cls):
+        """Create QApplication"""
+        try:
+            cls.app = QApplication(sys.argv)
+        except:
+            pass
+
+    def test_start_and_stop(self):
+        """Start and Stop Listen DataManager"""
+
+        under_test = ChangesQNotifier()
+
+        under_test.start()
+
+        self.assertTrue(under_test.receive_changes in data_manager.listeners)
+
+        self.assertTrue(under_test.receive_progress in data_manager.progress_listeners)
+
+        under_test.stop()
+
+        self.assertFalse(under_test.receive_changes in data_manager.listeners)
+        self.assertFalse(under_test.receive_progress in data_manager.progress_listeners)
+
+    def test_progress_changed(self):
+        """Progress of DataManager is Sent"""
+
+        under_test = ChangesQNotifier()
+        sent = []
+        under_test.progress_changed.connect(lambda: sent.append(True))
+
+        under_test.start()
+        data_manager.set_progress('host', 10, 20)
+        under_test.stop()
+
+        self.assertEqual(1, len(sent))
+
+    def test_changes_are_merged(self):
+        """Changes are Merged and Sent Once"""
+
+        under_test = ChangesQNotifier()
+        sent = []
+        under_test.items_changed.connect(lambda item_type, changes: sent.append(changes))
+
+        first_changes = Changes()
+        first_changes.add(self.host_list[0])
+        first_changes.add(self.host_list[1])
+        next_changes = Changes()
+        next_changes.remove(self.host_list[1])
+        next_changes.change(self.host_list[2])
+
+        under_test.receive_changes('host', first_changes)
+        under_test.receive_changes('host', next_changes)
+
+        self.assertTrue(under_test.flush_timer.isActive())
+        self.assertEqual([], sent)
+
+        under_test.flush_changes()
+
+        self.assertEqual(
+            [{'added': [self.host_list[0]], 'changed': [self.host_list[2]], 'removed': []}],
+            sent
+        )
+        self.assertFalse(under_test.pending_changes)
+
+    def test_refresh_timer(self):
+        """Refresh at most once by Interval"""
+
+        refreshed = []
+        under_test = RefreshQTimer(lambda: refreshed.append(True))
+        under_test.setInterval(10000)
+
+        self.assertTrue(under_test.isSingleShot())
+
+        under_test.ask_refresh()
+
+        # First refresh is done now
+        self.assertEqual(1, len(refreshed))
+        self.assertTrue(under_test.isActive())
+
+        under_test.ask_refresh()
+        under_test.ask_refresh()
+
+        # Next ones are done once at the end of interval
+        self.assertEqual(1, len(refreshed))
+        self.assertTrue(under_test.pending)
+
+        under_test.refresh_pending()
+
+        self.assertEqual(2, len(refreshed))
+        self.assertFalse(under_test.pending)
+
+        under_test.stop()
+        under_test.refresh_pending()
+
+        self.assertEqual(2, len(refreshed))
@@ -135,6 +135,20 @@ class TestPanelQWidget(unittest2.TestCase):
             under_test.hostnames_list
         )
 
+    def test_problems_tab_initialized_on_display(self):
+        """Problems Initialized when its Tab is Displayed"""
+
+        under_test = PanelQWidget()
+        under_test.initialize()
+        under_test.tab_widget.setCurrentWidget(under_test.synthesis_widget)
+
+        self.assertIsNone(under_test.problems_widget.layout())
+
+        under_test.tab_widget.setCurrentWidget(under_test.problems_widget)
+
+        self.assertIsNotNone(under_test.problems_widget.layout())
+        self.assertEqual(under_test.spy_widget, under_test.problems_widget.spy_widget)
+
     def test_spy_host(self):
         """Panel Add Spy Host"""
 
@@ -170,14 +184,24 @@ class TestPanelQWidget(unittest2.TestCase):
         problems_index = under_test.get_tab_order().index('p')
         self.assertEqual('Problems (20)', under_test.tab_widget.tabText(problems_index))
 
-        # Remove a service from problems
+        # Remove a service from problems, problems tab is not initialized
+        self.assertIsNone(under_test.problems_widget.layout())
         data_manager.database['problems'].remove(self.service_list[0])
 
-        under_test.tab_widget.widget(problems_index).update_problems_data()
+        under_test.data_changed('problems', {'added': [], 'changed': [], 'removed': []})
+        # Refresh asked during interval is done at its end
+        under_test.problems_timer.refresh_pending()
 
         # There are only 9 services in CRITICAL condition
         self.assertEqual('Problems (19)', under_test.tab_widget.tabText(problems_index))
 
+        # Changes of other items do not update tab
+        data_manager.database['problems'].remove(self.service_list[1])
+        under_test.problems_timer.stop()
+        under_test.data_changed('host', {'added': [], 'changed': [], 'removed': []})
+
+        self.assertEqual('Problems (19)', under_test.tab_widget.tabText(problems_index))
+
     def test_display_host(self):
         """Display Host in Panel"""
 
@@ -233,6 +257,8 @@ class TestPanelQWidget(unittest2.TestCase):
 
         under_test = PanelQWidget()
         under_test.initialize()
+        # Problems are initialized when their tab is displayed
+        under_test.tab_widget.setCurrentWidget(under_test.problems_widget)
 
         self.assertEqual('', under_test.synthesis_widget.line_search.text())
         self.assertIsNone(under_test.problems_widget.get_current_user_role_item())
@@ -21,13 +21,13 @@
 
 import unittest2
 
-from PyQt5.Qt import QStandardItem
+from PyQt5.Qt import QIcon, QPersistentModelIndex, Qt
 
 from alignak_app.backend.datamanager import data_manager
 from alignak_app.items.host import Host
 from alignak_app.items.service import Service
 
-from alignak_app.qobjects.alignak.problems_table import ProblemsQTableView
+from alignak_app.qobjects.alignak.problems_table import ProblemsQTableView, ProblemsQTableModel
 
 
 class TestProblemsQTableView(unittest2.TestCase):
@@ -92,16 +92,189 @@ class TestProblemsQTableView(unittest2.TestCase):
         self.assertEqual(['Items in problem', 'Output'], under_test.headers_list)
         self.assertEqual(2, under_test.model().columnCount())
 
-    def test_get_tableitem(self):
-        """Get Problems Table Item"""
+    def test_problems_model_data(self):
+        """Problems Model Data"""
+
+        data_manager.update_database('host', self.host_list)
+        under_test = ProblemsQTableModel(['Items in problem', 'Output'])
+
+        under_test.update_items([self.host_list[0], self.service_list[0]])
+
+        self.assertEqual(2, under_test.rowCount())
+        self.assertEqual('Output', under_test.headerData(1, Qt.Horizontal))
+        self.assertEqual('Host 0 is UNKNOWN', under_test.data(under_test.index(0, 0)))
+        self.assertEqual(
+            'Service 0 is CRITICAL (Attached to Host 0)', under_test.data(under_test.index(1, 0))
+        )
+        self.assertEqual('output host 0', under_test.data(under_test.index(1, 1)))
+        self.assertEqual(
+            self.service_list[0], under_test.data(under_test.index(1, 0), Qt.UserRole)
+        )
+        self.assertIsInstance(under_test.data(under_test.index(0, 0), Qt.DecorationRole), QIcon)
+
+    def test_problems_model_update_rows(self):
+        """Update Only Changed Rows of Problems Model"""
+
+        under_test = ProblemsQTableModel(['Items in problem', 'Output'])
+        under_test.update_items(self.host_list[:5])
+
+        changed_rows = []
+        under_test.dataChanged.connect(
+            lambda first, last: changed_rows.append((first.row(), last.row()))
+        )
+        reset = []
+        under_test.modelReset.connect(lambda: reset.append(True))
+        selected = QPersistentModelIndex(under_test.index(3, 0))
+
+        # Host 1 is removed, host 4 has changed, host 7 is added
+        changed_host = Host()
+        changed_host.create(
+            '_id4', dict(self.host_list[4].data, ls_output='new output'), 'host4'
+        )
+        under_test.update_items(
+            [self.host_list[0], self.host_list[2], self.host_list[3], changed_host,
+             self.host_list[7]]
+        )
+
+        self.assertEqual(
+            ['_id0', '_id2', '_id3', '_id4', '_id7'], [item.item_id for item in under_test.items]
+        )
+        self.assertEqual([(3, 3)], changed_rows)
+        self.assertEqual('new output', under_test.data(under_test.index(3, 1)))
+        self.assertFalse(reset)
+        # Persistent index, like selection, follows its row
+        self.assertEqual(2, selected.row())
+
+        # Rows are moved to order of items
+        under_test.update_items(
+            [self.host_list[7], self.host_list[0], self.host_list[2], self.host_list[3]]
+        )
+
+        self.assertEqual(
+            ['_id7', '_id0', '_id2', '_id3'], [item.item_id for item in under_test.items]
+        )
+        self.assertEqual(3, selected.row())
+        self.assertEqual('Host 7 is UNKNOWN', under_test.data(under_test.index(0, 0)))
+
+    def test_problems_model_update_changed_keys(self):
+        """Update Only Rows of Changed Keys in Problems Model"""
+
+        data_manager.update_database('host', self.host_list)
+        under_test = ProblemsQTableModel(['Items in problem', 'Output'])
+        under_test.update_items(self.host_list[:3] + self.service_list[:3])
+
+        changed_rows = []
+        under_test.dataChanged.connect(
+            lambda first, last: changed_rows.append((first.row(), last.row()))
+        )
+
+        changed_hosts = []
+        for i in range(3):
+            changed_host = Host()
+            changed_host.create(
+                '_id%d' % i,
+                dict(self.host_list[i].data, alias='New Host %d' % i, ls_output='new output'),
+                'host%d' % i
+            )
+            changed_hosts.append(changed_host)
+        data_manager.update_database('host', changed_hosts)
+
+        # Only host 1 is given as changed: other rows, except service of host 1, are not updated
+        under_test.update_items(changed_hosts + self.service_list[:3], {('host', '_id1')})
+
+        self.assertEqual([(1, 1), (4, 4)], changed_rows)
+        self.assertEqual('new output', under_test.data(under_test.index(1, 1)))
+        self.assertEqual(
+            'Service 1 is CRITICAL (Attached to New Host 1)',
+            under_test.data(under_test.index(4, 0))
+        )
+        self.assertEqual('output host 0', under_test.data(under_test.index(0, 1)))
+        self.assertEqual(
+            'Service 0 is CRITICAL (Attached to Host 0)', under_test.data(under_test.index(3, 0))
+        )
+        # Items are always the new ones
+        self.assertIs(changed_hosts[0], under_test.data(under_test.index(0, 0), Qt.UserRole))
+
+    def test_update_view_keep_model(self):
+        """Update View Keep Model and Filter"""
 
         under_test = ProblemsQTableView()
-        tableitem_test = under_test.get_tableitem(self.host_list[0])
+        under_test.update_view({'problems': self.host_list})
+        model_test = under_test.model()
 
-        self.assertIsInstance(tableitem_test, QStandardItem)
-        self.assertEqual('Host 0 is UNKNOWN', tableitem_test.text())
+        under_test.filter_items('host 1 ')
 
-        tableitem_test = under_test.get_tableitem(self.service_list[0])
+        self.assertEqual(1, model_test.rowCount())
 
-        self.assertIsInstance(tableitem_test, QStandardItem)
-        self.assertEqual('Service 0 is CRITICAL (Attached to Host 0)', tableitem_test.text())
+        under_test.update_view({'problems': self.host_list[1:]})
+
+        # Same model, filter is kept
+        self.assertIs(model_test, under_test.model())
+        self.assertEqual(1, under_test.model().rowCount())
+
+    def test_problems_model_search(self):
+        """Search in Problems Model"""
+
+        data_manager.update_database('host', self.host_list)
+        under_test = ProblemsQTableModel(['Items in problem', 'Output'])
+        under_test.update_items(self.host_list[:5] + self.service_list[:2])
+
+        self.assertEqual(
+            'host 0 service 0 critical output host 0',
+            under_test.search_texts[('service', self.service_list[0].item_id)]
+        )
+
+        # Search is case insensitive
+        under_test.search('SERVICE')
+
+        self.assertEqual(
+            [False] * 5 + [True] * 2, [under_test.match_row(row) for row in range(7)]
+        )
+
+        # Next text only looks in previous matches
+        under_test.search_texts[('host', '_id0')] = 'service 1'
+        under_test.search('service 1')
+
+        self.assertEqual(
+            {('service', self.service_list[1].item_id)}, under_test.matches
+        )
+
+        # Changed and added rows are searched with current filter
+        changed_host = Host()
+        changed_host.create(
+            '_id2', dict(self.host_list[2].data, ls_output='service 1 is down'), 'host2'
+        )
+        under_test.update_items(
+            [self.host_list[0], self.host_list[1], changed_host, self.service_list[1]]
+        )
+
+        self.assertEqual(
+            {('host', '_id2'), ('service', self.service_list[1].item_id)}, under_test.matches
+        )
+        self.assertEqual(
+            [False, False, True, True], [under_test.match_row(row) for row in range(4)]
+        )
+
+        under_test.search('')
+
+        self.assertIsNone(under_test.matches)
+        self.assertTrue(under_test.match_row(0))
+
+    def test_delay_filter(self):
+        """Filter is Applied when User Stops Typing"""
+
+        under_test = ProblemsQTableView()
+        under_test.update_view({'problems': self.host_list})
+
+        for text in ['h', 'ho', 'host 3']:
+            under_test.delay_filter(text)
+
+        self.assertTrue(under_test.filter_timer.isActive())
+        self.assertEqual(10, under_test.model().rowCount())
+
+        under_test.filter_timer.timeout.emit()
+
+        self.assertEqual(1, under_test.model().rowCount())
+        self.assertEqual(
+            self.host_list[3], under_test.model().index(0, 0).data(Qt.UserRole)
+        )
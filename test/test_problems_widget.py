@@ -154,9 +154,9 @@ class TestProblemsQWidget(unittest2.TestCase):
 
         under_test.update_problems_data()
 
-        # Assert Table models have changed
-        self.assertNotEqual(model_test, under_test.problems_table.model())
-        self.assertNotEqual(select_model_test, under_test.problems_table.selectionModel())
+        # Assert Table models are kept
+        self.assertEqual(model_test, under_test.problems_table.model())
+        self.assertEqual(select_model_test, under_test.problems_table.selectionModel())
 
         # Add problems
         for item in self.host_list:
@@ -0,0 +1,107 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2015-2018:
+#   Matthieu Estrada, ttamalfor@gmail.com
+#
+# This file is part of (AlignakApp).
+#
+# (AlignakApp) is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# (AlignakApp) is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with (AlignakApp).  If not, see <http://www.gnu.org/licenses/>.
+
+
+import unittest2
+
+from alignak_app.backend.scheduler import PollingScheduler
+from alignak_app.utils.config import settings
+
+
+class TestPollingScheduler(unittest2.TestCase):
+    """
+        This file test the PollingScheduler class.
+    """
+
+    settings.init_config()
+
+    def test_start_scheduler(self):
+        """Start PollingScheduler"""
+
+        under_test = PollingScheduler()
+        under_test.start()
+
+        # All requests are due at start
+        self.assertEqual(
+            sorted(under_test.item_types), sorted(under_test.get_due_requests(now=0))
+        )
+        self.assertEqual((60, 1800), under_test.limits['realm'])
+        self.assertEqual((5, 60), under_test.limits['livesynthesis'])
+        self.assertEqual(20, under_test.intervals['livesynthesis'])
+        self.assertEqual(60, under_test.intervals['realm'])
+
+    def test_adapt_intervals(self):
+        """Adapt Intervals to Changes"""
+
+        under_test = PollingScheduler()
+        under_test.start()
+
+        under_test.request_started('realm', now=100)
+
+        # Request already sent is not due
+        self.assertNotIn('realm', under_test.get_due_requests(now=100))
+
+        under_test.request_done('realm', now=101)
+
+        # Data has not changed, interval is doubled
+        self.assertEqual(120, under_test.intervals['realm'])
+        self.assertEqual(221, under_test.next_times['realm'])
+        self.assertNotIn('realm', under_test.get_due_requests(now=220))
+        self.assertIn('realm', under_test.get_due_requests(now=221))
+
+        for _ in range(0, 10):
+            under_test.request_started('realm', now=1)
+            under_test.request_done('realm', now=1)
+
+        # Interval stays under maximum
+        self.assertEqual(1800, under_test.intervals['realm'])
+
+        # Data has changed, interval is divided
+        under_test.request_started('CRITICAL', now=100)
+        under_test.request_done('CRITICAL', under_test.get_changed('CRITICAL', {'problems': 2}))
+
+        self.assertEqual(10, under_test.intervals['CRITICAL'])
+
+        under_test.request_started('CRITICAL', now=100)
+        under_test.request_done('CRITICAL', 1)
+
+        # Interval stays above minimum
+        self.assertEqual(10, under_test.intervals['CRITICAL'])
+
+        # Changes of other item types are not changes of request
+        self.assertEqual(0, under_test.get_changed('CRITICAL', {'host': 2}))
+
+    def test_wrong_limits(self):
+        """Wrong Polling Limits"""
+
+        settings.app_config.read_dict({'Polling': {'host_interval': 'wrong'}})
+        settings.update_snapshot()
+
+        self.assertEqual((10, 120), PollingScheduler.get_limits('host'))
+
+        settings.app_config.read_dict({'Polling': {'host_interval': '30, 20'}})
+        settings.update_snapshot()
+
+        # Maximum can't be under minimum
+        self.assertEqual((30, 30), PollingScheduler.get_limits('host'))
+
+        settings.app_config.read_dict({'Polling': {'host_interval': '10, 120'}})
+        settings.update_snapshot()
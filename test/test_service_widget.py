@@ -172,6 +172,29 @@ class TestServiceDataQWidget(unittest2.TestCase):
         for label in old_labels:
             self.assertNotEqual(new_labels[label].text(), old_labels[label])
 
+    def test_update_since_labels(self):
+        """Update Time since Last Check of ServiceData QWidget"""
 
+        under_test = ServiceDataQWidget()
+        under_test.initialize()
+
+        self.assertTrue(under_test.since_timer.isActive())
+        self.assertEqual(60000, under_test.since_timer.interval())
+
+        # Nothing to update without service
+        under_test.update_since_labels()
+        self.assertEqual('', under_test.labels['ls_last_check'].text())
+
+        data_manager.database['user'].data['can_submit_commands'] = True
+        data_manager.update_database('service', self.service_list)
+        under_test.update_widget(self.service_list[0])
+        output = under_test.labels['ls_output'].text()
 
+        # Only label of time since last check is updated
+        under_test.labels['ls_last_check'].setText('')
+        under_test.labels['ls_output'].setText('')
+        under_test.update_since_labels()
 
+        self.assertNotEqual('', under_test.labels['ls_last_check'].text())
+        self.assertEqual('', under_test.labels['ls_output'].text())
+        self.assertNotEqual('', output)
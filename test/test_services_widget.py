@@ -190,3 +190,69 @@ class TestServicesQWidget(unittest2.TestCase):
             'Service 1',
             under_test.services_list_widget.currentItem().data(Qt.DisplayRole)
         )
+
+    def test_update_tree(self):
+        """Update Services QTreeWidget Grouped by Aggregation"""
+
+        under_test = ServicesQWidget()
+        under_test.initialize()
+        tree_widget = under_test.services_tree_widget
+        receivers_nb = tree_widget.receivers(tree_widget.clicked)
+
+        # Services sorted by state then aggregation, empty aggregation is "Global"
+        global_service = Service()
+        global_service.create(
+            'global_id', dict(self.service_list[1].data, aggregation=''), 'global'
+        )
+        services = self.service_list[:4] + [global_service]
+        under_test.update_tree(services)
+
+        self.assertEqual(
+            [('CPU', ['other_id20', 'other_id21']), ('Global', ['global_id']),
+             ('disk', ['_id0', '_id1'])],
+            under_test.tree_layout
+        )
+        self.assertEqual(3, under_test.services_tree_widget.topLevelItemCount())
+        self.assertEqual(
+            2, under_test.services_tree_widget.topLevelItem(0).childCount()
+        )
+        # Only one connection, whatever the number of services
+        self.assertEqual(receivers_nb, tree_widget.receivers(tree_widget.clicked))
+
+        tree_items = dict(under_test.service_tree_items)
+        under_test.services_tree_widget.topLevelItem(0).setExpanded(True)
+
+        # Service "_id0" changes, without changing order
+        changed_service = Service()
+        changed_service.create(
+            '_id0', dict(self.service_list[0].data, ls_output='changed output'), 'service0'
+        )
+        under_test.update_tree([changed_service] + services[1:])
+
+        self.assertIs(tree_items['_id0'], under_test.service_tree_items['_id0'])
+        self.assertIs(changed_service, under_test.service_tree_items['_id0'].service_item)
+        self.assertIs(
+            self.service_list[1], under_test.service_tree_items['other_id20'].service_item
+        )
+
+        # Service "_id1" becomes CRITICAL: tree is reordered with same items
+        critical_service = Service()
+        critical_service.create(
+            '_id1', dict(self.service_list[2].data, ls_state='CRITICAL'), 'service1'
+        )
+        under_test.update_tree(
+            [changed_service, self.service_list[1], critical_service, self.service_list[3]]
+        )
+
+        self.assertEqual(
+            [('CPU', ['other_id20', 'other_id21']), ('disk', ['_id1', '_id0'])],
+            under_test.tree_layout
+        )
+        self.assertEqual(
+            ['CPU', 'disk'],
+            [under_test.services_tree_widget.topLevelItem(i).text(0) for i in range(2)]
+        )
+        self.assertIs(tree_items['_id1'], under_test.service_tree_items['_id1'])
+        self.assertNotIn('global_id', under_test.service_tree_items)
+        # Expanded aggregations stay expanded
+        self.assertTrue(under_test.services_tree_widget.topLevelItem(0).isExpanded())
@@ -0,0 +1,203 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2015-2018:
+#   Matthieu Estrada, ttamalfor@gmail.com
+#
+# This file is part of (AlignakApp).
+#
+# (AlignakApp) is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# (AlignakApp) is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with (AlignakApp).  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+import shutil
+import tempfile
+
+import unittest2
+
+from alignak_app.backend.datamanager import DataManager
+from alignak_app.backend.storage import LocalStorage
+from alignak_app.items.host import Host
+from alignak_app.items.service import Service
+from alignak_app.items.user import User
+
+
+class TestLocalStorage(unittest2.TestCase):
+    """
+        This file test the LocalStorage class.
+    """
+
+    host_list = []
+    for i in range(0, 5):
+        host = Host()
+        host.create(
+            '_id%d' % i,
+            {'name': 'host%d' % i, 'ls_state': 'DOWN', 'active_checks_enabled': True},
+            'host%d' % i
+        )
+        host_list.append(host)
+
+    service_list = []
+    for i in range(0, 5):
+        service = Service()
+        service.create(
+            '_id%d' % i,
+            {'name': 'service%d' % i, 'host': '_id%d' % i, 'ls_state': 'OK'},
+            'service%d' % i
+        )
+        service_list.append(service)
+
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+        self.filename = os.path.join(self.folder, 'storage.db')
+
+    def tearDown(self):
+        shutil.rmtree(self.folder)
+
+    def get_data_manager(self):
+        """Return DataManager filled with test items"""
+
+        data_manager_test = DataManager()
+        data_manager_test.update_database('host', self.host_list)
+        data_manager_test.update_database('service', self.service_list)
+        user = User()
+        user.create(
+            '_id', {'name': 'admin', 'token': 'secret', 'can_submit_commands': True}, 'admin'
+        )
+        data_manager_test.update_database('user', user)
+
+        return data_manager_test
+
+    def test_save_and_load(self):
+        """Save and Load Items"""
+
+        under_test = LocalStorage(self.filename)
+
+        # Nothing saved yet
+        self.assertEqual({}, under_test.load('admin@backend'))
+
+        self.assertTrue(under_test.save(self.get_data_manager().snapshot(), 'admin@backend'))
+        self.assertTrue(os.path.isfile(self.filename))
+
+        items = under_test.load('admin@backend')
+
+        # User is not loaded without token
+        self.assertEqual(['host', 'service'], sorted(items))
+        self.assertEqual(5, len(items['host']))
+        self.assertIsInstance(items['host'][0], Host)
+        self.assertEqual('_id0', items['host'][0].item_id)
+        self.assertEqual('host0', items['host'][0].name)
+        self.assertEqual(self.host_list[0].data, items['host'][0].data)
+        self.assertIsInstance(items['service'][4], Service)
+        self.assertEqual(self.service_list[4].data, items['service'][4].data)
+
+    def test_load_other_owner(self):
+        """Items of Other Owner are not Loaded"""
+
+        under_test = LocalStorage(self.filename)
+        under_test.save(self.get_data_manager().snapshot(), 'admin@backend')
+
+        self.assertEqual({}, under_test.load('admin@other_backend'))
+
+        # Last save replace previous one
+        under_test.save(self.get_data_manager().snapshot(), 'admin@other_backend')
+
+        self.assertEqual(
+            ['host', 'service', 'user'], sorted(under_test.load('admin@other_backend', 'token'))
+        )
+        self.assertEqual({}, under_test.load('admin@backend'))
+
+    def test_save_user_without_token(self):
+        """Save User without its Token"""
+
+        under_test = LocalStorage(self.filename)
+        under_test.save(self.get_data_manager().snapshot(), 'admin@backend')
+
+        with open(self.filename, 'rb') as saved_file:
+            self.assertFalse(b'secret' in saved_file.read())
+
+        user = under_test.load('admin@backend', 'new_token')['user']
+
+        self.assertIsInstance(user, User)
+        self.assertEqual('_id', user.item_id)
+        self.assertEqual('admin', user.name)
+        self.assertEqual(
+            {'name': 'admin', 'token': 'new_token', 'can_submit_commands': True}, user.data
+        )
+
+    def test_load_corrupted_file(self):
+        """Corrupted File is Ignored"""
+
+        with open(self.filename, 'w') as corrupted_file:
+            corrupted_file.write('not a database')
+
+        under_test = LocalStorage(self.filename)
+
+        self.assertEqual({}, under_test.load('admin@backend'))
+        self.assertFalse(under_test.save(self.get_data_manager().snapshot(), 'admin@backend'))
+
+    def test_load_items_in_data_manager(self):
+        """Loaded Items are Stale until Requested"""
+
+        under_test = LocalStorage(self.filename)
+        under_test.save(self.get_data_manager().snapshot(), 'admin@backend')
+
+        data_manager_test = DataManager()
+        data_manager_test.load_items(under_test.load('admin@backend'))
+
+        self.assertEqual({'host', 'service'}, data_manager_test.stale)
+        self.assertTrue(data_manager_test.db_is_ready['host'])
+        self.assertTrue(data_manager_test.db_is_ready['problems']['CRITICAL'])
+        self.assertFalse(data_manager_test.db_is_ready['user'])
+        self.assertEqual(5, len(data_manager_test.database['service']))
+        # Problems are computed from loaded items
+        self.assertEqual(5, len(data_manager_test.database['problems']))
+
+        data_manager_test.update_database('host', self.host_list)
+
+        self.assertEqual({'service'}, data_manager_test.stale)
+
+    def test_get_items_with_other_keys(self):
+        """Get Items Saved with Other Keys"""
+
+        saved_items = {
+            'keys': ['_id', 'name', 'old_key', 'ls_state'],
+            'items': [['_id1', 'service1', [['_id1', 'service1', 'old', None], [3], None]]],
+        }
+
+        under_test = LocalStorage.get_items(Service, saved_items)
+
+        self.assertEqual(
+            {'_id': '_id1', 'name': 'service1', 'old_key': 'old'}, under_test[0].data
+        )
+
+    def test_load_items_after_requests(self):
+        """Items Received from Backend are not Replaced by Loaded Items"""
+
+        under_test = LocalStorage(self.filename)
+        under_test.save(self.get_data_manager().snapshot(), 'admin@backend')
+
+        data_manager_test = DataManager()
+        user = User()
+        user.create('_id', {'name': 'admin', 'token': 'token'}, 'admin')
+        data_manager_test.update_database('user', user)
+        data_manager_test.set_db_ready('user')
+        data_manager_test.set_db_ready('problems', 'CRITICAL')
+
+        data_manager_test.load_items(under_test.load('admin@backend', 'token'))
+
+        # Only "user" has been received, hosts and services are not loaded once problems are
+        self.assertIs(user, data_manager_test.database['user'])
+        self.assertFalse(data_manager_test.stale)
+        self.assertFalse(data_manager_test.database['host'])
+        self.assertFalse(data_manager_test.db_is_ready['host'])
@@ -92,7 +92,7 @@ class TestSystem(unittest2.TestCase):
 
         # Assert parser have been read
         self.assertTrue(parser_test.sections())
-        self.assertEqual(['Alignak', 'Alignak-app', 'Log'], parser_test.sections())
+        self.assertEqual(['Alignak', 'Alignak-app', 'Polling', 'Log'], parser_test.sections())
 
         under_test = read_config_file(parser_test, 'etc/no-settings.cfg')
 
@@ -25,22 +25,45 @@ from alignak_app.backend.backend import app_backend
 from alignak_app.utils.config import settings
 from alignak_app.locales.locales import init_localization
 
-from alignak_app.qobjects.threads.thread import BackendQThread
+from alignak_app.qobjects.threads.thread import BackendQWorker
+from alignak_app.qobjects.threads.threadmanager import ThreadManager
 
 settings.init_config()
 init_localization()
 app_backend.login()
 
 
-class TestBackendQThread(unittest2.TestCase):
+class TestBackendQWorker(unittest2.TestCase):
     """
-        This file test the BackendQThread classes.
+        This file test the BackendQWorker classes.
     """
 
-    def test_initialize_backend_thread(self):
-        """Initialize BackendQThread"""
+    def test_initialize_backend_worker(self):
+        """Initialize BackendQWorker"""
 
-        under_test = BackendQThread('user')
+        manager = ThreadManager()
+        under_test = BackendQWorker(manager)
 
-        self.assertEqual('user', under_test.name)
-        self.assertIsNone(under_test.data)
+        self.assertIs(manager, under_test.manager)
+        self.assertEqual(0.0, under_test.busy_time)
+
+    def test_run_until_stopped(self):
+        """BackendQWorker Send Requests until Stopped"""
+
+        manager = ThreadManager()
+        under_test = BackendQWorker(manager)
+
+        connected = app_backend.connected
+        app_backend.connected = False
+        try:
+            manager.add_request('user')
+            # Stop request after "user" request
+            manager.queue.put((10, -1, None, None))
+            # Offline request is not sent, but it is done
+            under_test.run()
+        finally:
+            app_backend.connected = connected
+
+        self.assertTrue(manager.queue.empty())
+        self.assertFalse(manager.running)
+        self.assertFalse(manager.queued)
@@ -19,12 +19,15 @@
 # You should have received a copy of the GNU Affero General Public License
 # along with (AlignakApp).  If not, see <http://www.gnu.org/licenses/>.
 
+import time
+
 import unittest2
 
+from alignak_app.backend.backend import app_backend
 from alignak_app.utils.config import settings
 from alignak_app.locales.locales import init_localization
 
-from alignak_app.qobjects.threads.thread import BackendQThread
+from alignak_app.qobjects.threads.thread import BackendQWorker
 from alignak_app.qobjects.threads.threadmanager import ThreadManager
 
 settings.init_config()
@@ -41,82 +44,235 @@ class TestThreadManager(unittest2.TestCase):
 
         under_test = ThreadManager()
 
-        for t_type in under_test.threads_to_launch:
-            self.assertFalse(under_test.threads_to_launch[t_type])
-        self.assertFalse(under_test.high_threads)
+        self.assertTrue(under_test.queue.empty())
+        self.assertFalse(under_test.queued)
+        self.assertFalse(under_test.running)
+        self.assertFalse(under_test.workers)
+
+    def test_priority_requests(self):
+        """Requests are Sent by Priority"""
+
+        under_test = ThreadManager()
+
+        under_test.add_request('user', priority='low')
+        under_test.add_request('host', priority='normal')
+        under_test.add_request('livesynthesis', priority='normal')
+        under_test.add_request('service', 'host_id', priority='high')
 
-    def test_fill_threads(self):
-        """Add Low / Normal Threads"""
+        self.assertEqual(('service', 'host_id'), under_test.next_request())
+        self.assertEqual(('host', None), under_test.next_request())
+        self.assertEqual(('livesynthesis', None), under_test.next_request())
+        self.assertEqual(('user', None), under_test.next_request())
+        self.assertTrue(under_test.queue.empty())
+
+    def test_same_requests(self):
+        """Same Requests are not Queued Twice"""
 
         under_test = ThreadManager()
 
-        self.assertFalse(under_test.threads_to_launch['low'])
-        self.assertFalse(under_test.threads_to_launch['normal'])
+        self.assertTrue(under_test.add_request('history', {'host_id': 'id1'}, 'low'))
+        self.assertFalse(under_test.add_request('history', {'host_id': 'id1'}, 'low'))
+        self.assertTrue(under_test.add_request('history', {'host_id': 'id2'}, 'low'))
+
+        # Higher priority moves request before others
+        self.assertTrue(under_test.add_request('history', {'host_id': 'id2'}, 'high'))
+
+        request = under_test.next_request()
 
-        under_test.fill_threads('low')
+        self.assertEqual(('history', {'host_id': 'id2'}), request)
 
-        self.assertTrue(under_test.threads_to_launch['low'])
-        self.assertFalse(under_test.threads_to_launch['normal'])
+        # Running request is not queued again until it's done
+        self.assertFalse(under_test.add_request('history', {'host_id': 'id2'}, 'high'))
 
-        under_test.fill_threads('normal')
+        under_test.request_done(request)
 
-        self.assertTrue(under_test.threads_to_launch['low'])
-        self.assertTrue(under_test.threads_to_launch['normal'])
+        self.assertTrue(under_test.add_request('history', {'host_id': 'id2'}, 'high'))
+        self.assertEqual({'high': 1, 'normal': 0, 'low': 1}, under_test.get_metrics()['queued'])
 
-    def test_is_launched(self):
-        """Thread Is Launched"""
+    def test_launch_threads(self):
+        """Only Due Requests are Queued"""
 
         under_test = ThreadManager()
+        # Workers are already started
+        under_test.workers = [BackendQWorker(under_test)]
+        under_test.scheduler.start()
 
-        test_launched = under_test.is_launched('low', 'user')
+        under_test.launch_threads()
 
-        self.assertFalse(test_launched)
+        self.assertEqual(
+            len(under_test.thread_names['low']) + len(under_test.thread_names['normal']),
+            len(under_test.queued)
+        )
+        self.assertEqual(
+            len(under_test.thread_names['low']), under_test.get_metrics()['queued']['low']
+        )
 
-        under_test.launched_threads['low'].append(BackendQThread('user'))
+        while under_test.queued:
+            under_test.request_done(under_test.next_request())
+        under_test.launch_threads()
 
-        test_launched = under_test.is_launched('low', 'user')
-        self.assertTrue(test_launched)
+        # Requests are due again after their interval
+        self.assertFalse(under_test.queued)
 
-    def test_priority_threads(self):
-        """Add / Remove Priority Threads"""
+        under_test.workers = []
+
+    def test_request_changes(self):
+        """Interval of Request Depends on its own Changes"""
 
         under_test = ThreadManager()
-        under_test.high_threads.append(BackendQThread('user'))
+        under_test.scheduler.start()
+        interval = under_test.scheduler.intervals['CRITICAL']
+        host_interval = under_test.scheduler.intervals['host']
 
-        self.assertTrue(under_test.high_threads)
+        under_test.scheduler.request_started('CRITICAL')
+        under_test.scheduler.request_started('host')
 
-        under_test.stop_high_priority_threads()
+        # Only changes of "problems" are counted for "CRITICAL"
+        under_test.request_done(('CRITICAL', None), {'host': 3})
+        under_test.request_done(('host', None), {'host': 3})
 
-        # Priority thread is removed
-        self.assertFalse(under_test.high_threads)
+        self.assertEqual(
+            min(interval * 2, under_test.scheduler.limits['CRITICAL'][1]),
+            under_test.scheduler.intervals['CRITICAL']
+        )
+        self.assertEqual(
+            max(under_test.scheduler.limits['host'][0], host_interval / 2),
+            under_test.scheduler.intervals['host']
+        )
 
-        # Add 3 priority threads
-        under_test.high_threads.append(BackendQThread('user'))
-        under_test.high_threads.append(BackendQThread('host'))
-        under_test.high_threads.append(BackendQThread('history'))
+    def test_metrics(self):
+        """Metrics of Requests"""
 
-        self.assertTrue(len(under_test.high_threads) == 3)
+        under_test = ThreadManager()
 
-        under_test.add_high_priority_thread('user', {})
+        under_test.add_request('host')
+        under_test.add_request('user', priority='low')
+        under_test.add_request('user', priority='low')
+        under_test.add_request('livesynthesis')
+        under_test.next_request()
 
-        # When already 3 priority threads, next priority htread is not add
-        self.assertTrue(len(under_test.high_threads) == 3)
+        metrics = under_test.get_metrics()
+
+        self.assertEqual({'high': 0, 'normal': 1, 'low': 1}, metrics['queued'])
+        self.assertEqual(1, metrics['running'])
+        self.assertEqual(0, metrics['workers'])
+        self.assertEqual(0, metrics['utilisation'])
 
     def test_stop_threads(self):
         """Stop All Threads"""
 
         under_test = ThreadManager()
 
-        under_test.high_threads.append(BackendQThread(''))
-        under_test.launched_threads['low'].append(BackendQThread(''))
-        under_test.launched_threads['normal'].append(BackendQThread(''))
+        under_test.add_request('host')
+        under_test.add_request('user', priority='low')
+        workers = [BackendQWorker(under_test), BackendQWorker(under_test)]
+        under_test.workers = list(workers)
+        app_backend.ws_client.get_session()
+        queue = under_test.queue
+
+        under_test.stop_threads()
+
+        self.assertFalse(under_test.queued)
+        self.assertFalse(under_test.workers)
+        self.assertEqual(workers, under_test.stopping)
+        self.assertIsNone(app_backend.ws_client.session)
+
+        # Each worker receive a stop request in its queue, removed requests are ignored
+        self.assertIsNone(under_test.next_request(queue))
+        self.assertIsNone(under_test.next_request(queue))
+        self.assertEqual(2, queue.qsize())
+        # New workers use a new queue
+        self.assertIsNot(queue, under_test.queue)
+        self.assertTrue(under_test.queue.empty())
+
+    def test_stop_threads_with_running_request(self):
+        """Stop Threads does not Wait for Running Request"""
+
+        class SlowThreadManager(ThreadManager):
+            def next_request(self, queue=None):
+                request = super(SlowThreadManager, self).next_request(queue)
+                if request is not None:
+                    # Request is still running when threads are stopped
+                    time.sleep(0.3)
+                return request
+
+        under_test = SlowThreadManager()
+        under_test.start_workers()
+        workers = under_test.workers
+
+        under_test.add_request('user')
+        start = time.time()
+        while not under_test.running and time.time() - start < 5:
+            time.sleep(0.01)
+        self.assertTrue(under_test.running)
+
+        start = time.time()
+        under_test.stop_threads()
+
+        # GUI is not blocked, running request is still running
+        self.assertLess(time.time() - start, 0.2)
+        self.assertFalse(under_test.workers)
+        self.assertEqual(workers, under_test.stopping)
+        self.assertTrue(under_test.running)
+
+        # Finished workers are removed by their "finished" signal
+        for worker in workers:
+            self.assertEqual(1, worker.receivers(worker.finished))
+            self.assertTrue(worker.wait(5000))
+        under_test.remove_stopped_workers()
+
+        self.assertFalse(under_test.stopping)
+        self.assertFalse(under_test.running)
+
+    def test_wait_threads(self):
+        """Wait Stopped Threads"""
+
+        under_test = ThreadManager()
+        under_test.start_workers()
+        workers = under_test.workers
+
+        under_test.stop_threads()
+
+        self.assertTrue(under_test.wait_threads())
+        self.assertFalse(under_test.stopping)
+        for worker in workers:
+            self.assertTrue(worker.isFinished())
+
+    def test_launch_all_threads(self):
+        """Launch All First Requests with Fetch Workers"""
+
+        under_test = ThreadManager()
+
+        under_test.launch_all_threads()
+
+        # First requests share "fetch_workers" workers
+        workers = under_test.workers
+        self.assertEqual(int(settings.get_config('Alignak', 'fetch_workers')), len(workers))
+
+        under_test.stop_threads()
+
+        for worker in workers:
+            self.assertTrue(worker.wait(5000))
+
+    def test_workers(self):
+        """Workers Send Queued Requests"""
+
+        under_test = ThreadManager()
+
+        under_test.start_workers()
+        workers = under_test.workers
+
+        self.assertEqual(int(settings.get_config('Alignak', 'fetch_workers')), len(workers))
+
+        # Workers are only started once
+        under_test.start_workers()
 
-        self.assertTrue(under_test.high_threads)
-        self.assertTrue(under_test.launched_threads['low'])
-        self.assertTrue(under_test.launched_threads['normal'])
+        self.assertIs(workers, under_test.workers)
 
+        under_test.add_request('user')
+        under_test.add_high_priority_thread('history', {'host_id': 'id1'})
         under_test.stop_threads()
 
-        self.assertFalse(under_test.high_threads)
-        self.assertFalse(under_test.launched_threads['low'])
-        self.assertFalse(under_test.launched_threads['normal'])
+        for worker in workers:
+            self.assertTrue(worker.wait(5000))
+        self.assertFalse(under_test.running)
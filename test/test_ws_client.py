@@ -21,6 +21,8 @@
 
 import unittest2
 
+from requests.exceptions import ConnectionError as RequestsConnectionError
+
 from alignak_app.backend.ws_client import WSClient
 from alignak_app.utils.config import settings
 
@@ -53,3 +55,42 @@ class TestWSClient(unittest2.TestCase):
         self.assertEqual(config_url, under_test.ws_backend)
         # WS is not auth
         self.assertIsNone(under_test.auth)
+
+    def test_session(self):
+        """Web Service Session"""
+
+        under_test = WSClient()
+
+        self.assertIsNone(under_test.session)
+
+        session = under_test.get_session()
+
+        # Session is created once, with a pool of connections
+        self.assertIs(session, under_test.get_session())
+        adapter = session.get_adapter('http://127.0.0.1:8888')
+        self.assertEqual(
+            int(settings.get_config('Alignak', 'ws_pool_size')), adapter._pool_maxsize
+        )
+        self.assertEqual((5.0, 30.0), under_test.get_timeout())
+
+        under_test.close()
+
+        self.assertIsNone(under_test.session)
+
+    def test_login_close_session(self):
+        """Login Close Session of Previous Login"""
+
+        class FakeWSClient(WSClient):
+            def request(self, method, endpoint, **kwargs):
+                self.get_session()
+                raise RequestsConnectionError('Web Service is not available')
+
+        under_test = FakeWSClient()
+        session = under_test.get_session()
+
+        under_test.login('')
+
+        # Connections of previous login are not reused
+        self.assertIsNotNone(under_test.session)
+        self.assertIsNot(session, under_test.session)
+        self.assertIsNone(under_test.auth)